@@ -3,6 +3,7 @@ import pymunk
 from typing import Optional
 from engine.core.scene import SceneManager
 from engine.core.base import GameObject, GameSystem
+from engine.core.timing import game_clock
 from engine.systems.audio import AudioSystem
 from engine.systems.ui import UIManager
 from engine.systems.renderer import Renderer
@@ -39,6 +40,7 @@ class FarmoriaEngine:
                     self.scene_manager.handle_event(event)
                 
     def update(self, dt: float):
+        game_clock.advance(dt)
         self.scene_manager.update(dt)
         self.ui_manager.update(dt)
         
@@ -75,6 +75,28 @@ class Timer:
         )
         pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP])
 
+class GameClock:
+    """Oyun saati
+    
+    Animasyonlar bu saatten ve kendi başlangıç zamanlarından örneklenir;
+    örnek başına her frame güncelleme gerekmez.
+    """
+    def __init__(self):
+        self.time = 0.0
+        self.paused = False
+    
+    def advance(self, dt: float):
+        """Saati dt kadar ilerletir"""
+        if not self.paused:
+            self.time += dt
+    
+    def reset(self):
+        """Saati sıfırlar"""
+        self.time = 0.0
+
+# Global oyun saati, FarmoriaEngine.update tarafından ilerletilir
+game_clock = GameClock()
+
 class FrameManager:
     """Frame yönetimi"""
     def __init__(self, timer: Timer):
@@ -6,6 +6,8 @@ Render işlemleri, shader yönetimi, doku atlası ve animasyon sistemini içerir
 """
 
 from .animation import *
+from .animation_batch import *
+from .animation_culling import *
 from .shader_system import *
 from .texture_atlas import *
 from .sprite_generator import *
@@ -1,11 +1,25 @@
 import pygame
 from typing import Dict, List, Optional, Tuple
+from array import array
+from bisect import bisect_right
 import json
 import math
+import mmap
+import os
+import struct
+import sys
 from dataclasses import dataclass
 from ..core.base import GameObject
+from ..core.timing import GameClock, game_clock
+from .texture_atlas import TextureAtlas
+from ..utils.texture_cache import texture_cache
 from . import DebugCategory, DebugLevel, debug_manager
 
+try:
+    import lz4.frame
+except ImportError:  # lz4 kurulu değilse ikili dosyalar sıkıştırılmaz
+    lz4 = None
+
 @dataclass
 class Bone:
     """İskelet animasyonu için kemik sınıfı"""
@@ -78,18 +92,151 @@ class Keyframe:
             scale_y=data.get('scale_y', 1.0)
         )
 
-class Animation:
+class AnimationTrack:
+    """Tek bir kemiğin derlenmiş anahtar kare izi
+    
+    Zamanlar sıralı bir dizide, değerler aynı indekslerle paralel dizilerde
+    tutulur. Arama, önceki karenin indeksini tutan bir imleçle yapılır.
+    """
+    __slots__ = ('bone_name', 'times', 'x', 'y', 'rotation', 'scale_x', 'scale_y')
+    
+    def __init__(self, bone_name: str):
+        self.bone_name = bone_name
+        self.times = array('d')
+        self.x = array('d')
+        self.y = array('d')
+        self.rotation = array('d')
+        self.scale_x = array('d')
+        self.scale_y = array('d')
+        
+    @classmethod
+    def from_buffers(cls, bone_name: str, times, x, y, rotation, scale_x, scale_y) -> 'AnimationTrack':
+        """Hazır dizilerden (array veya memoryview) iz oluşturur, veriyi kopyalamaz"""
+        track = cls.__new__(cls)
+        track.bone_name = bone_name
+        track.times = times
+        track.x = x
+        track.y = y
+        track.rotation = rotation
+        track.scale_x = scale_x
+        track.scale_y = scale_y
+        return track
+    
+    def append(self, keyframe: Keyframe):
+        """Anahtar kareyi izin sonuna ekler (zamana göre sıralı olmalı)"""
+        self.times.append(keyframe.time)
+        self.x.append(keyframe.x)
+        self.y.append(keyframe.y)
+        self.rotation.append(keyframe.rotation)
+        self.scale_x.append(keyframe.scale_x)
+        self.scale_y.append(keyframe.scale_y)
+        
+    def find(self, time: float, cursor: int = -1) -> int:
+        """Zamanı <= time olan son karenin indeksini döndürür, yoksa -1
+        
+        Önce imleç ve bir sonraki kare denenir, ikisi de tutmazsa ikili
+        arama yapılır.
+        """
+        times = self.times
+        count = len(times)
+        for index in (cursor, cursor + 1):
+            if 0 <= index < count and times[index] <= time and (index + 1 == count or time < times[index + 1]):
+                return index
+        return bisect_right(times, time) - 1
+        
+    def apply(self, bone: 'Bone', index: int, time: float):
+        """index karesi ile bir sonraki kare arasında kemiği interpolasyonla günceller"""
+        if index + 1 < len(self.times):
+            start = self.times[index]
+            t = (time - start) / (self.times[index + 1] - start)
+            x, y, rotation = self.x, self.y, self.rotation
+            scale_x, scale_y = self.scale_x, self.scale_y
+            bone.x = x[index] + (x[index + 1] - x[index]) * t
+            bone.y = y[index] + (y[index + 1] - y[index]) * t
+            bone.rotation = rotation[index] + ((rotation[index + 1] - rotation[index] + 180) % 360 - 180) * t
+            bone.scale_x = scale_x[index] + (scale_x[index + 1] - scale_x[index]) * t
+            bone.scale_y = scale_y[index] + (scale_y[index + 1] - scale_y[index]) * t
+        else:
+            # Son anahtar kareyi kullan
+            bone.x = self.x[index]
+            bone.y = self.y[index]
+            bone.rotation = self.rotation[index]
+            bone.scale_x = self.scale_x[index]
+            bone.scale_y = self.scale_y[index]
+
+class SkeletalAnimation:
     """İskelet animasyonu sınıfı"""
     def __init__(self, name: str, duration: float = 1.0, loop: bool = True):
         self.name = name
         self.duration = duration
         self.loop = loop
-        self.keyframes: List[Keyframe] = []
+        self._keyframes: Optional[List[Keyframe]] = []
+        self._sorted = True
+        self._tracks: Optional[Dict[str, AnimationTrack]] = None
+    
+    @classmethod
+    def from_tracks(cls, name: str, duration: float, loop: bool,
+                    tracks: Dict[str, AnimationTrack]) -> 'SkeletalAnimation':
+        """Derlenmiş izlerden animasyon oluşturur
+        
+        Anahtar kare nesneleri yalnızca keyframes özelliğine erişildiğinde oluşturulur.
+        """
+        animation = cls(name, duration, loop)
+        animation._keyframes = None
+        animation._tracks = tracks
+        return animation
+        
+    @property
+    def keyframes(self) -> List[Keyframe]:
+        """Zamana göre sıralı anahtar kareler"""
+        if self._keyframes is None:
+            # İzlerden geri oluştur
+            self._keyframes = [
+                Keyframe(*values)
+                for track in self._tracks.values()
+                for values in zip(track.times, [track.bone_name] * len(track.times), track.x,
+                                  track.y, track.rotation, track.scale_x, track.scale_y)
+            ]
+            self._sorted = False
+        if not self._sorted:
+            self._keyframes.sort(key=lambda k: k.time)
+            self._sorted = True
+        return self._keyframes
+        
+    @property
+    def tracks(self) -> Dict[str, AnimationTrack]:
+        """Kemik adına göre derlenmiş izler (gerektiğinde yeniden derlenir)"""
+        if self._tracks is None:
+            self.compile()
+        return self._tracks
         
     def add_keyframe(self, keyframe: Keyframe):
         """Anahtar kare ekler"""
-        self.keyframes.append(keyframe)
-        self.keyframes.sort(key=lambda k: k.time)  # Zamana göre sırala
+        # İzlerden yüklenmişse önce kareleri oluştur
+        keyframes = self._keyframes if self._keyframes is not None else self.keyframes
+        if keyframes and keyframe.time < keyframes[-1].time:
+            self._sorted = False  # Sıralama bir sonraki erişime ertelenir
+        keyframes.append(keyframe)
+        self._tracks = None
+        
+    def add_keyframes(self, keyframes: List[Keyframe]):
+        """Birden fazla anahtar kare ekler"""
+        for keyframe in keyframes:
+            self.add_keyframe(keyframe)
+            
+    def compile(self):
+        """Anahtar kareleri kemik başına sıralı izlere derler"""
+        tracks: Dict[str, AnimationTrack] = {}
+        for keyframe in self.keyframes:
+            track = tracks.get(keyframe.bone_name)
+            if track is None:
+                track = tracks[keyframe.bone_name] = AnimationTrack(keyframe.bone_name)
+            track.append(keyframe)
+        self._tracks = tracks
+        
+    def get_track(self, bone_name: str) -> Optional[AnimationTrack]:
+        """Belirli bir kemiğin derlenmiş izini döndürür"""
+        return self.tracks.get(bone_name)
         
     def get_keyframes_for_bone(self, bone_name: str) -> List[Keyframe]:
         """Belirli bir kemik için anahtar kareleri döndürür"""
@@ -105,41 +252,242 @@ class Animation:
         }
         
     @classmethod
-    def from_dict(cls, data: dict) -> 'Animation':
+    def from_dict(cls, data: dict) -> 'SkeletalAnimation':
         """Sözlükten animasyon oluşturur"""
         animation = cls(
             name=data['name'],
             duration=data['duration'],
             loop=data['loop']
         )
-        for keyframe_data in data['keyframes']:
-            animation.add_keyframe(Keyframe.from_dict(keyframe_data))
+        animation.add_keyframes([Keyframe.from_dict(k) for k in data['keyframes']])
         return animation
 
+def _local_matrix(x: float, y: float, rotation: float,
+                  scale_x: float, scale_y: float) -> Tuple[float, float, float, float, float, float]:
+    """Yerel dönüşümden (a, b, c, d, tx, ty) afin matrisini oluşturur
+    
+    Nokta dönüşümü: x' = a*x + c*y + tx, y' = b*x + d*y + ty
+    """
+    radians = math.radians(rotation)
+    cos = math.cos(radians)
+    sin = math.sin(radians)
+    return (cos * scale_x, sin * scale_x, -sin * scale_y, cos * scale_y, x, y)
+
+def _multiply(parent: Tuple[float, ...], local: Tuple[float, ...]) -> Tuple[float, float, float, float, float, float]:
+    """İki afin matrisi çarpar (önce yerel, sonra ebeveyn dönüşümü)"""
+    pa, pb, pc, pd, ptx, pty = parent
+    la, lb, lc, ld, ltx, lty = local
+    return (pa * la + pc * lb, pb * la + pd * lb,
+            pa * lc + pc * ld, pb * lc + pd * ld,
+            pa * ltx + pc * lty + ptx, pb * ltx + pd * lty + pty)
+
+class BakedAnimation:
+    """Önceden çizilmiş pozlardan oluşan iskelet animasyonu
+    
+    Her örnek, iskeletin o andaki tüm kemiklerini içeren tek bir yüzeydir;
+    oynatma iskelet başına tek bir blit ile yapılır.
+    """
+    def __init__(self, name: str, sample_rate: float, duration: float, loop: bool,
+                 frames: List[pygame.Surface], offsets: List[Tuple[float, float]]):
+        self.name = name
+        self.sample_rate = sample_rate
+        self.duration = duration
+        self.loop = loop
+        self.frames = frames
+        self.offsets = offsets
+        
+    def get_frame_index(self, time: float) -> int:
+        """Zamana karşılık gelen örnek indeksini döndürür"""
+        index = int(time * self.sample_rate)
+        if self.loop:
+            return index % len(self.frames)
+        return min(index, len(self.frames) - 1)
+        
+    def draw(self, surface: pygame.Surface, time: float):
+        """Verilen zamandaki pozu çizer"""
+        index = self.get_frame_index(time)
+        surface.blit(self.frames[index], self.offsets[index])
+        
+    def to_atlas(self, atlas: TextureAtlas, prefix: Optional[str] = None):
+        """Kareleri atlas'a yazar ve atlas bölgelerini kullanmaya başlar"""
+        prefix = prefix or self.name
+        for index, frame in enumerate(self.frames):
+            name = f"{prefix}_{index}"
+            if atlas.add_texture(name, frame) is not None:
+                self.frames[index] = atlas.get_texture(name)
+
 class Skeleton(GameObject):
     """İskelet sınıfı"""
+    # İkili format: başlık ve ardından (isteğe bağlı lz4 ile sıkıştırılmış) gövde
+    BINARY_MAGIC = b'FSKL'
+    BINARY_VERSION = 1
+    BINARY_COMPRESSED = 1
+    BINARY_HEADER = struct.Struct('<4sHHIIIIQ')
+    NO_PARENT = 0xFFFFFFFF
+    
     def __init__(self, name: str = "Skeleton"):
         super().__init__(name)
         self.bones: Dict[str, Bone] = {}
-        self.animations: Dict[str, Animation] = {}
+        self.animations: Dict[str, SkeletalAnimation] = {}
         self.current_animation: Optional[str] = None
         self.animation_time = 0.0
+        self._track_cursors: Dict[str, int] = {}
+        self.batched = False  # True ise kemikleri BatchAnimationEvaluator hesaplar
+        self.baked_animations: Dict[str, BakedAnimation] = {}
+        self.live_evaluation = False  # Karışım/prosedürel kontrol için pişmiş pozları atla
         self.sprite_surface: Optional[pygame.Surface] = None
         self.sprite_offset = (0, 0)
+        self._draw_source: Optional[pygame.Surface] = None
+        self._draw_source_of: Optional[pygame.Surface] = None
         
+        # Dünya dönüşümü önbelleği
+        self._bone_order: Optional[List[Tuple[str, Optional[str]]]] = None
+        self._local_cache: Dict[str, Tuple[float, float, float, float, float]] = {}
+        self._world: Dict[str, Tuple[float, float, float, float, float, float]] = {}
+        self._world_pose: Dict[str, Tuple[float, float, float, float, float]] = {}
+        self.transform_updates = 0  # Son güncellemede yeniden hesaplanan kemik sayısı
+    
     def add_bone(self, bone: Bone):
         """Kemik ekler"""
         self.bones[bone.name] = bone
+        self.invalidate_transforms()
+    
+    def invalidate_transforms(self):
+        """Dönüşüm önbelleğini temizler (kemiklerin ebeveyni değiştiğinde çağrılmalı)"""
+        self._bone_order = None
+        self._local_cache.clear()
+        self._world.clear()
+        self._world_pose.clear()
+    
+    def _get_bone_order(self) -> List[Tuple[str, Optional[str]]]:
+        """Kemikleri ebeveynleri önce gelecek şekilde (kemik, ebeveyn) olarak sıralar"""
+        if self._bone_order is not None and len(self._bone_order) == len(self.bones):
+            return self._bone_order
+        
+        children: Dict[str, List[str]] = {}
+        for bone in self.bones.values():
+            if bone.parent in self.bones and bone.parent != bone.name:
+                children.setdefault(bone.parent, []).append(bone.name)
+        
+        # Ebeveyni olmayanlar kök; döngüdeki kemikler de kök kabul edilir
+        order = []
+        visited = set()
+        roots = [name for name, bone in self.bones.items() if bone.parent not in self.bones]
+        for root in roots + list(self.bones):
+            if root in visited:
+                continue
+            stack = [(root, None)]
+            while stack:
+                name, parent = stack.pop()
+                if name in visited:
+                    continue
+                visited.add(name)
+                order.append((name, parent))
+                stack.extend((child, name) for child in reversed(children.get(name, ())))
+        
+        self._bone_order = order
+        self._local_cache.clear()
+        return order
+    
+    def update_transforms(self) -> int:
+        """Yerel dönüşümü değişen kemiklerin ve alt ağaçlarının dünya dönüşümlerini yeniler
+        
+        Kemik değerleri ebeveyne göredir; ebeveyni olmayan kemikler dünya
+        uzayındadır. Dönüşümü değişmeyen kemikler önbellekten okunur.
+        
+        Returns:
+            Yeniden hesaplanan kemik sayısı
+        """
+        bones = self.bones
+        local_cache = self._local_cache
+        world = self._world
+        world_pose = self._world_pose
+        dirty = set()
+        for name, parent in self._get_bone_order():
+            bone = bones[name]
+            local = (bone.x, bone.y, bone.rotation, bone.scale_x, bone.scale_y)
+            if parent not in dirty and local_cache.get(name) == local:
+                continue
+            
+            local_cache[name] = local
+            dirty.add(name)
+            matrix = _local_matrix(*local)
+            if parent is None:
+                world[name] = matrix
+                world_pose[name] = local
+            else:
+                # Kayma (shear) yok sayılarak konum, açı ve ölçek çıkarılır
+                a, b, c, d, tx, ty = world[name] = _multiply(world[parent], matrix)
+                world_pose[name] = (tx, ty, math.degrees(math.atan2(b, a)),
+                                    math.hypot(a, b), math.hypot(c, d))
+        
+        self.transform_updates = len(dirty)
+        return len(dirty)
+    
+    def get_world_transform(self, name: str) -> Optional[Tuple[float, float, float, float, float, float]]:
+        """Kemiğin (a, b, c, d, tx, ty) dünya matrisini döndürür"""
+        self.update_transforms()
+        return self._world.get(name)
+    
+    def get_world_pose(self, name: str) -> Optional[Tuple[float, float, float, float, float]]:
+        """Kemiğin dünya uzayındaki (x, y, açı, ölçek_x, ölçek_y) değerlerini döndürür"""
+        self.update_transforms()
+        return self._world_pose.get(name)
+    
+    def get_bounds(self) -> pygame.Rect:
+        """Tüm kemik sprite'larını kapsayan yaklaşık dünya dikdörtgenini döndürür"""
+        self.update_transforms()
+        if not self._world_pose:
+            return pygame.Rect(0, 0, 0, 0)
+        
+        # Dönüş ne olursa olsun sprite'ı kapsayan yarıçap
+        if self.sprite_surface:
+            radius = math.hypot(*self.sprite_surface.get_size()) / 2
+        else:
+            radius = 0.0
+        rects = []
+        for x, y, _, scale_x, scale_y in self._world_pose.values():
+            extent = radius * max(abs(scale_x), abs(scale_y))
+            rects.append(pygame.Rect(int(x + self.sprite_offset[0] - extent), int(y + self.sprite_offset[1] - extent),
+                                     int(extent * 2) + 1, int(extent * 2) + 1))
+        return rects[0].unionall(rects[1:])
+    
+    def hit_test(self, point: Tuple[float, float]) -> Optional[str]:
+        """Noktanın üzerinde olduğu en üstteki kemiğin adını döndürür"""
+        if not self.sprite_surface:
+            return None
+        
+        self.update_transforms()
+        half_width = self.sprite_surface.get_width() / 2
+        half_height = self.sprite_surface.get_height() / 2
+        px = point[0] - self.sprite_offset[0]
+        py = point[1] - self.sprite_offset[1]
+        
+        # Son çizilen kemik en üsttedir
+        for name in reversed(list(self.bones)):
+            a, b, c, d, tx, ty = self._world[name]
+            det = a * d - b * c
+            if det == 0:
+                continue
+            
+            # Noktayı kemiğin yerel uzayına taşı
+            dx = px - tx
+            dy = py - ty
+            local_x = (d * dx - c * dy) / det
+            local_y = (a * dy - b * dx) / det
+            if abs(local_x) <= half_width and abs(local_y) <= half_height:
+                return name
+        return None
         
     def get_bone(self, name: str) -> Optional[Bone]:
         """İsme göre kemik döndürür"""
         return self.bones.get(name)
         
-    def add_animation(self, animation: Animation):
+    def add_animation(self, animation: SkeletalAnimation):
         """Animasyon ekler"""
         self.animations[animation.name] = animation
         
-    def get_animation(self, name: str) -> Optional[Animation]:
+    def get_animation(self, name: str) -> Optional[SkeletalAnimation]:
         """İsme göre animasyon döndürür"""
         return self.animations.get(name)
         
@@ -148,6 +496,7 @@ class Skeleton(GameObject):
         if name in self.animations:
             self.current_animation = name
             self.animation_time = 0.0
+            self._track_cursors.clear()
             debug_manager.log(f"Playing animation: {name}", DebugCategory.GRAPHICS)
             
     def stop_animation(self):
@@ -164,9 +513,25 @@ class Skeleton(GameObject):
         """İskeleti günceller"""
         super().update(dt)
         
-        if not self.current_animation:
+        if self.batched:
             return
             
+        animation = self.advance_time(dt)
+        if animation and not self.get_active_baked():
+            self.apply_animation(animation)
+            self.update_transforms()
+            
+    def get_active_baked(self) -> Optional[BakedAnimation]:
+        """Oynayan animasyonun pişmiş halini döndürür (canlı değerlendirmede None)"""
+        if self.live_evaluation or not self.current_animation:
+            return None
+        return self.baked_animations.get(self.current_animation)
+            
+    def advance_time(self, dt: float) -> Optional[SkeletalAnimation]:
+        """Animasyon zamanını ilerletir, oynayan animasyonu döndürür"""
+        if not self.current_animation:
+            return None
+            
         animation = self.animations[self.current_animation]
         self.animation_time += dt
         
@@ -176,65 +541,127 @@ class Skeleton(GameObject):
                 self.animation_time %= animation.duration
             else:
                 self.stop_animation()
-                return
+                return None
                 
-        # Her kemik için interpolasyon yap
-        for bone_name, bone in self.bones.items():
-            keyframes = animation.get_keyframes_for_bone(bone_name)
-            if not keyframes:
+        return animation
+        
+    def apply_animation(self, animation: SkeletalAnimation):
+        """Animasyonu mevcut zamanda kemiklere uygular"""
+        # İzi olan her kemik için interpolasyon yap
+        time = self.animation_time
+        cursors = self._track_cursors
+        for bone_name, track in animation.tracks.items():
+            bone = self.bones.get(bone_name)
+            if bone is None:
                 continue
                 
-            # Önceki ve sonraki anahtar kareleri bul
-            prev_keyframe = None
-            next_keyframe = None
-            for keyframe in keyframes:
-                if keyframe.time <= self.animation_time:
-                    prev_keyframe = keyframe
-                else:
-                    next_keyframe = keyframe
-                    break
-                    
-            if prev_keyframe and next_keyframe:
-                # İki anahtar kare arasında interpolasyon yap
-                t = (self.animation_time - prev_keyframe.time) / (next_keyframe.time - prev_keyframe.time)
-                bone.x = self._lerp(prev_keyframe.x, next_keyframe.x, t)
-                bone.y = self._lerp(prev_keyframe.y, next_keyframe.y, t)
-                bone.rotation = self._lerp_angle(prev_keyframe.rotation, next_keyframe.rotation, t)
-                bone.scale_x = self._lerp(prev_keyframe.scale_x, next_keyframe.scale_x, t)
-                bone.scale_y = self._lerp(prev_keyframe.scale_y, next_keyframe.scale_y, t)
-            elif prev_keyframe:
-                # Son anahtar kareyi kullan
-                bone.x = prev_keyframe.x
-                bone.y = prev_keyframe.y
-                bone.rotation = prev_keyframe.rotation
-                bone.scale_x = prev_keyframe.scale_x
-                bone.scale_y = prev_keyframe.scale_y
+            # Önceki anahtar kareyi imleçten bul
+            index = track.find(time, cursors.get(bone_name, -1))
+            cursors[bone_name] = index
+            if index >= 0:
+                track.apply(bone, index, time)
                 
     def draw(self, surface: pygame.Surface):
         """İskeleti çizer"""
-        if not self.enabled or not self.sprite_surface:
+        if not self.enabled:
             return
             
-        # Her kemiği çiz
-        for bone_name, bone in self.bones.items():
-            # Kemik transformasyonunu hesapla
-            transform = pygame.Surface(self.sprite_surface.get_size(), pygame.SRCALPHA)
+        # Pişmiş animasyon varsa tek blit yeterli
+        baked = self.get_active_baked()
+        if baked:
+            baked.draw(surface, self.animation_time)
+            return
             
-            # Sprite'ı kopyala
-            transform.blit(self.sprite_surface, (0, 0))
+        if not self.sprite_surface:
+            return
+            
+        surface.blits(self._get_bone_blits(), doreturn=False)
+        
+    def _get_bone_blits(self) -> List[Tuple[pygame.Surface, Tuple[float, float]]]:
+        """Her kemik için dönüştürülmüş sprite ve çizim pozisyonunu döndürür"""
+        # Saydam kopya sprite değişmedikçe yeniden oluşturulmaz
+        if self._draw_source_of is not self.sprite_surface:
+            self._draw_source = pygame.Surface(self.sprite_surface.get_size(), pygame.SRCALPHA)
+            self._draw_source.blit(self.sprite_surface, (0, 0))
+            self._draw_source_of = self.sprite_surface
             
-            # Dönüşümleri uygula
-            rotated = pygame.transform.rotate(transform, -bone.rotation)
+        self.update_transforms()
+        world_pose = self._world_pose
+        blits = []
+        for name in self.bones:
+            # Dünya dönüşümlerini uygula
+            bone_x, bone_y, rotation, scale_x, scale_y = world_pose[name]
+            rotated = pygame.transform.rotate(self._draw_source, -rotation)
             scaled = pygame.transform.scale(rotated,
-                (int(rotated.get_width() * bone.scale_x),
-                 int(rotated.get_height() * bone.scale_y)))
+                (int(rotated.get_width() * scale_x),
+                 int(rotated.get_height() * scale_y)))
             
             # Pozisyonu hesapla
-            x = bone.x - scaled.get_width() / 2 + self.sprite_offset[0]
-            y = bone.y - scaled.get_height() / 2 + self.sprite_offset[1]
+            x = bone_x - scaled.get_width() / 2 + self.sprite_offset[0]
+            y = bone_y - scaled.get_height() / 2 + self.sprite_offset[1]
+            blits.append((scaled, (x, y)))
+        return blits
+        
+    def bake_animation(self, name: str, sample_rate: float = 30.0,
+                       atlas: Optional[TextureAtlas] = None) -> Optional[BakedAnimation]:
+        """Animasyonu verilen örnekleme hızında önceden çizilmiş karelere dönüştürür
+        
+        Sonuç iskelette saklanır; aynı sprite ve kemikleri kullanan diğer
+        iskeletlere add_baked_animation ile paylaştırılabilir.
+        """
+        animation = self.animations.get(name)
+        if animation is None or not self.sprite_surface:
+            return None
+            
+        # Mevcut durumu sakla
+        saved_bones = {bone_name: (b.x, b.y, b.rotation, b.scale_x, b.scale_y)
+                       for bone_name, b in self.bones.items()}
+        saved_time = self.animation_time
+        
+        count = max(1, int(round(animation.duration * sample_rate)))
+        if not animation.loop:
+            count += 1  # Son pozu da dahil et
+            
+        frames = []
+        offsets = []
+        for index in range(count):
+            self.animation_time = min(index / sample_rate, animation.duration)
+            self.apply_animation(animation)
+            blits = self._get_bone_blits()
+            if not blits:
+                frames.append(pygame.Surface((1, 1), pygame.SRCALPHA))
+                offsets.append((0, 0))
+                continue
+                
+            # Tüm kemikleri kapsayan alanı bul ve tek yüzeye çiz
+            rects = [pygame.Rect((int(x), int(y)), sprite.get_size()) for sprite, (x, y) in blits]
+            bounds = rects[0].unionall(rects[1:])
+            frame = pygame.Surface(bounds.size, pygame.SRCALPHA)
+            frame.blits([(sprite, (rect.x - bounds.x, rect.y - bounds.y))
+                         for (sprite, _), rect in zip(blits, rects)], doreturn=False)
+            frames.append(frame)
+            offsets.append(bounds.topleft)
             
-            # Çiz
-            surface.blit(scaled, (x, y))
+        # Durumu geri yükle
+        for bone_name, values in saved_bones.items():
+            bone = self.bones[bone_name]
+            bone.x, bone.y, bone.rotation, bone.scale_x, bone.scale_y = values
+        self.animation_time = saved_time
+        self._track_cursors.clear()
+        
+        baked = BakedAnimation(name, sample_rate, animation.duration, animation.loop, frames, offsets)
+        if atlas is not None:
+            baked.to_atlas(atlas, f"{self.name}_{name}")
+        self.baked_animations[name] = baked
+        return baked
+        
+    def add_baked_animation(self, baked: BakedAnimation):
+        """Önceden pişirilmiş bir animasyonu iskelete ekler"""
+        self.baked_animations[baked.name] = baked
+        
+    def clear_baked_animations(self):
+        """Pişmiş animasyonları siler"""
+        self.baked_animations.clear()
             
     def save(self, file_path: str):
         """İskeleti dosyaya kaydeder"""
@@ -245,6 +672,160 @@ class Skeleton(GameObject):
         with open(file_path, 'w') as f:
             json.dump(data, f, indent=2)
             
+    def save_binary(self, file_path: str, compress: bool = False):
+        """İskeleti kompakt ikili formatta kaydeder
+        
+        Gövde sırası: dize tablosu (ofsetler ve UTF-8 veri), kemik, animasyon
+        ve iz tamsayıları, ardından tüm float değerler. Her iz için zamanlar
+        ve kanallar ardışık olarak paketlenir.
+        """
+        strings: Dict[str, int] = {}
+        
+        def intern(text: str) -> int:
+            index = strings.get(text)
+            if index is None:
+                index = strings[text] = len(strings)
+            return index
+        
+        bone_ints = array('I')
+        animation_ints = array('I')
+        track_ints = array('I')
+        floats = array('d')
+        for bone in self.bones.values():
+            parent = self.NO_PARENT if bone.parent is None else intern(bone.parent)
+            bone_ints.extend((intern(bone.name), parent))
+            floats.extend((bone.x, bone.y, bone.rotation, bone.scale_x, bone.scale_y))
+        
+        for animation in self.animations.values():
+            tracks = animation.tracks
+            animation_ints.extend((intern(animation.name), int(animation.loop), len(tracks)))
+            floats.append(animation.duration)
+            for track in tracks.values():
+                track_ints.extend((intern(track.bone_name), len(track.times)))
+                for channel in (track.times, track.x, track.y, track.rotation,
+                                track.scale_x, track.scale_y):
+                    floats.extend(channel)
+        
+        encoded = [text.encode('utf-8') for text in strings]
+        string_offsets = array('I', [0])
+        for text in encoded:
+            string_offsets.append(string_offsets[-1] + len(text))
+        
+        sections = [string_offsets, b''.join(encoded), bone_ints, animation_ints, track_ints]
+        body = bytearray()
+        for section in sections:
+            if isinstance(section, array) and sys.byteorder == 'big':
+                section.byteswap()
+            body += section if isinstance(section, bytes) else section.tobytes()
+        
+        # Float'lar bellek eşlemede hizalı okunabilsin
+        body += bytes(-len(body) % 8)
+        if sys.byteorder == 'big':
+            floats.byteswap()
+        body += floats.tobytes()
+        
+        flags = 0
+        if compress:
+            if lz4 is None:
+                debug_manager.log("lz4 not installed, skeleton saved uncompressed",
+                                  DebugCategory.GRAPHICS, DebugLevel.WARNING)
+            else:
+                body = lz4.frame.compress(bytes(body))
+                flags |= self.BINARY_COMPRESSED
+        
+        header = self.BINARY_HEADER.pack(
+            self.BINARY_MAGIC, self.BINARY_VERSION, flags, len(strings), len(self.bones),
+            len(self.animations), len(track_ints) // 2, len(floats)
+        )
+        with open(file_path, 'wb') as f:
+            f.write(header)
+            f.write(body)
+    
+    @staticmethod
+    def _read_array(view: memoryview, offset: int, typecode: str, count: int,
+                    copy: bool = True) -> Tuple[memoryview, int]:
+        """Tamponun offset konumundan count elemanlık dizi okur
+        
+        copy False ise veri kopyalanmadan tampon üzerinde görünüm döndürülür.
+        """
+        size = count * array(typecode).itemsize
+        chunk = view[offset:offset + size]
+        if copy or sys.byteorder == 'big':
+            values = array(typecode)
+            values.frombytes(chunk)
+            if sys.byteorder == 'big':
+                values.byteswap()
+            return memoryview(values), offset + size
+        return chunk.cast(typecode), offset + size
+    
+    @classmethod
+    def load_binary(cls, file_path: str, use_mmap: bool = False) -> 'Skeleton':
+        """İkili formattaki iskeleti yükler
+        
+        use_mmap True ise sıkıştırılmamış dosyalar bellek eşlenir ve iz
+        dizileri dosya üzerindeki salt okunur görünümler olur.
+        """
+        with open(file_path, 'rb') as f:
+            if use_mmap:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = f.read()
+        
+        (magic, version, flags, string_count, bone_count, animation_count,
+         track_count, float_count) = cls.BINARY_HEADER.unpack_from(data)
+        if magic != cls.BINARY_MAGIC or version != cls.BINARY_VERSION:
+            raise ValueError(f"Invalid skeleton file: {file_path}")
+        
+        body = memoryview(data)[cls.BINARY_HEADER.size:]
+        copy = not use_mmap
+        if flags & cls.BINARY_COMPRESSED:
+            if lz4 is None:
+                raise RuntimeError("lz4 is required to load compressed skeleton files")
+            body = memoryview(lz4.frame.decompress(body))
+            copy = False  # Açılan tampon zaten bellekte
+        
+        # Dize tablosu
+        string_offsets, offset = cls._read_array(body, 0, 'I', string_count + 1)
+        blob = bytes(body[offset:offset + string_offsets[-1]])
+        offset += string_offsets[-1]
+        strings = [blob[string_offsets[i]:string_offsets[i + 1]].decode('utf-8')
+                   for i in range(string_count)]
+        
+        bone_ints, offset = cls._read_array(body, offset, 'I', bone_count * 2)
+        animation_ints, offset = cls._read_array(body, offset, 'I', animation_count * 3)
+        track_ints, offset = cls._read_array(body, offset, 'I', track_count * 2)
+        offset += -offset % 8
+        floats, offset = cls._read_array(body, offset, 'd', float_count, copy)
+        
+        skeleton = cls()
+        bone_values = floats[:bone_count * 5].tolist()
+        for index in range(bone_count):
+            parent = bone_ints[index * 2 + 1]
+            skeleton.add_bone(Bone(strings[bone_ints[index * 2]],
+                                   None if parent == cls.NO_PARENT else strings[parent],
+                                   *bone_values[index * 5:index * 5 + 5]))
+        
+        # İzler tek float dizisi üzerindeki dilimlerdir
+        position = bone_count * 5
+        track_index = 0
+        for index in range(animation_count):
+            name, loop, count = animation_ints[index * 3:index * 3 + 3]
+            duration = floats[position]
+            position += 1
+            tracks: Dict[str, AnimationTrack] = {}
+            for _ in range(count):
+                bone_name = strings[track_ints[track_index * 2]]
+                length = track_ints[track_index * 2 + 1]
+                track_index += 1
+                channels = [floats[position + i * length:position + (i + 1) * length] for i in range(6)]
+                position += length * 6
+                tracks[bone_name] = AnimationTrack.from_buffers(bone_name, *channels)
+            skeleton.add_animation(SkeletalAnimation.from_tracks(strings[name], duration, bool(loop), tracks))
+        
+        if position != float_count:
+            raise ValueError(f"Corrupt skeleton file: {file_path}")
+        return skeleton
+    
     @classmethod
     def load(cls, file_path: str) -> 'Skeleton':
         """Dosyadan iskelet yükler"""
@@ -259,7 +840,7 @@ class Skeleton(GameObject):
             
         # Animasyonları yükle
         for animation_data in data['animations'].values():
-            skeleton.add_animation(Animation.from_dict(animation_data))
+            skeleton.add_animation(SkeletalAnimation.from_dict(animation_data))
             
         return skeleton
         
@@ -272,35 +853,89 @@ class Skeleton(GameObject):
         diff = (b - a + 180) % 360 - 180
         return a + diff * t 
 
-class Animation:
-    """Sprite animasyonu sınıfı"""
+class AnimationClip:
+    """Paylaşılabilir, değişmez sprite animasyonu verisi
+    
+    Kareler ve zamanlama bilgisi tek bir nesnede tutulur; oynatma durumu
+    AnimationPlayer veya AnimationPlayerPool içinde saklanır.
+    """
+    __slots__ = ('frames', 'frame_duration', 'loop')
+    
     def __init__(self, frames: List[pygame.Surface], frame_duration: float = 0.1, loop: bool = True):
-        self.frames = frames
-        self.frame_duration = frame_duration
-        self.loop = loop
+        object.__setattr__(self, 'frames', tuple(frames))
+        object.__setattr__(self, 'frame_duration', frame_duration)
+        object.__setattr__(self, 'loop', loop)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("AnimationClip is immutable")
+    
+    @property
+    def frame_count(self) -> int:
+        """Kare sayısını döndürür"""
+        return len(self.frames)
+    
+    @property
+    def length(self) -> float:
+        """Klibin toplam süresi"""
+        return self.frame_duration * len(self.frames)
+    
+    def frame_at(self, elapsed: float) -> int:
+        """Başlangıçtan elapsed saniye sonraki kare indeksini döndürür"""
+        index = math.floor(elapsed / self.frame_duration)
+        if self.loop:
+            return index % len(self.frames)
+        return min(max(index, 0), len(self.frames) - 1)
+    
+    def step(self, frame: int, elapsed: float, finished: bool, dt: float) -> Tuple[int, float, bool]:
+        """Oynatma durumunu dt kadar ilerletir ve yeni (kare, süre, bitti) değerini döndürür"""
+        if finished and not self.loop:
+            return frame, elapsed, finished
+        
+        elapsed += dt
+        if elapsed >= self.frame_duration:
+            elapsed = 0.0
+            frame += 1
+            if frame >= len(self.frames):
+                if self.loop:
+                    frame = 0
+                else:
+                    frame = len(self.frames) - 1
+                    finished = True
+        return frame, elapsed, finished
+
+class AnimationPlayer:
+    """Bir klibi oynatan örneğe özel durum"""
+    __slots__ = ('clip', 'current_frame', 'time_elapsed', 'finished')
+    
+    def __init__(self, clip: AnimationClip):
+        self.clip = clip
         self.current_frame = 0
         self.time_elapsed = 0.0
         self.finished = False
         
+    @property
+    def frames(self) -> Tuple[pygame.Surface, ...]:
+        """Klibin kareleri"""
+        return self.clip.frames
+    
+    @property
+    def frame_duration(self) -> float:
+        """Kare süresi"""
+        return self.clip.frame_duration
+    
+    @property
+    def loop(self) -> bool:
+        """Döngü durumu"""
+        return self.clip.loop
+    
     def update(self, dt: float):
         """Animasyonu günceller"""
-        if self.finished and not self.loop:
-            return
-            
-        self.time_elapsed += dt
-        if self.time_elapsed >= self.frame_duration:
-            self.time_elapsed = 0
-            self.current_frame += 1
-            if self.current_frame >= len(self.frames):
-                if self.loop:
-                    self.current_frame = 0
-                else:
-                    self.current_frame = len(self.frames) - 1
-                    self.finished = True
+        self.current_frame, self.time_elapsed, self.finished = self.clip.step(
+            self.current_frame, self.time_elapsed, self.finished, dt)
                     
     def get_current_frame(self) -> pygame.Surface:
         """Mevcut frame'i döndürür"""
-        return self.frames[self.current_frame]
+        return self.clip.frames[self.current_frame]
         
     def reset(self):
         """Animasyonu sıfırlar"""
@@ -312,17 +947,184 @@ class Animation:
         """Animasyonun bitip bitmediğini döndürür"""
         return self.finished
 
+class ClockedAnimationPlayer:
+    """Klibi oyun saatinden durumsuz örnekleyen oynatıcı
+    
+    Kare, saat zamanı ile başlangıç zamanının farkından hesaplanır; update
+    çağrısı gerekmez ve birikmiş zaman hatası oluşmaz.
+    """
+    __slots__ = ('clip', 'clock', 'start_time')
+    
+    def __init__(self, clip: AnimationClip, start_time: Optional[float] = None,
+                 clock: Optional[GameClock] = None):
+        self.clip = clip
+        self.clock = clock or game_clock
+        self.start_time = self.clock.time if start_time is None else start_time
+    
+    @property
+    def frames(self) -> Tuple[pygame.Surface, ...]:
+        """Klibin kareleri"""
+        return self.clip.frames
+    
+    @property
+    def frame_duration(self) -> float:
+        """Kare süresi"""
+        return self.clip.frame_duration
+    
+    @property
+    def loop(self) -> bool:
+        """Döngü durumu"""
+        return self.clip.loop
+    
+    @property
+    def time_elapsed(self) -> float:
+        """Başlangıçtan beri geçen süre"""
+        return self.clock.time - self.start_time
+    
+    @property
+    def current_frame(self) -> int:
+        """Mevcut kare indeksi"""
+        return self.clip.frame_at(self.clock.time - self.start_time)
+    
+    @property
+    def finished(self) -> bool:
+        """Döngüsüz klibin son karesine ulaşılıp ulaşılmadığı"""
+        return not self.clip.loop and self.time_elapsed >= self.clip.length
+    
+    def update(self, dt: float):
+        """Saat tabanlı oynatıcıda bir şey yapmaz"""
+    
+    def get_current_frame(self) -> pygame.Surface:
+        """Mevcut frame'i döndürür"""
+        return self.clip.frames[self.current_frame]
+    
+    def reset(self):
+        """Animasyonu saatin şu anından başlatır"""
+        self.start_time = self.clock.time
+    
+    def is_finished(self) -> bool:
+        """Animasyonun bitip bitmediğini döndürür"""
+        return self.finished
+
+class Animation(AnimationPlayer):
+    """Sprite animasyonu sınıfı
+    
+    Kendi klibini oluşturan oynatıcı; kareleri paylaşmak için from_clip kullanılmalı.
+    """
+    __slots__ = ()
+    
+    def __init__(self, frames: List[pygame.Surface], frame_duration: float = 0.1, loop: bool = True):
+        super().__init__(AnimationClip(frames, frame_duration, loop))
+    
+    @classmethod
+    def from_clip(cls, clip: AnimationClip) -> 'Animation':
+        """Paylaşılan klipten yeni bir oynatıcı oluşturur"""
+        animation = cls.__new__(cls)
+        AnimationPlayer.__init__(animation, clip)
+        return animation
+
+class AnimationPlayerPool:
+    """Çok sayıda örneğin oynatma durumunu paralel dizilerde tutar
+    
+    Örnek başına yalnızca klip indeksi, kare, geçen süre ve bitti bayrağı
+    saklanır; kareler klipler arasında paylaşılır.
+    """
+    def __init__(self):
+        self.clips: List[AnimationClip] = []
+        self._clip_ids: Dict[int, int] = {}
+        self.clip_index = array('I')
+        self.frame = array('I')
+        self.elapsed = array('d')
+        self.finished = bytearray()
+        self.active = bytearray()
+        self._free: List[int] = []
+    
+    def __len__(self) -> int:
+        return len(self.active) - len(self._free)
+    
+    def _register_clip(self, clip: AnimationClip) -> int:
+        """Klibi kaydeder ve indeksini döndürür"""
+        index = self._clip_ids.get(id(clip))
+        if index is None:
+            index = self._clip_ids[id(clip)] = len(self.clips)
+            self.clips.append(clip)
+        return index
+    
+    def add(self, clip: AnimationClip) -> int:
+        """Yeni örnek ekler ve indeksini döndürür"""
+        clip_index = self._register_clip(clip)
+        if self._free:
+            index = self._free.pop()
+            self.clip_index[index] = clip_index
+            self.frame[index] = 0
+            self.elapsed[index] = 0.0
+            self.finished[index] = 0
+            self.active[index] = 1
+            return index
+        
+        self.clip_index.append(clip_index)
+        self.frame.append(0)
+        self.elapsed.append(0.0)
+        self.finished.append(0)
+        self.active.append(1)
+        return len(self.active) - 1
+    
+    def remove(self, index: int):
+        """Örneği siler, indeksi yeniden kullanılır"""
+        if self.active[index]:
+            self.active[index] = 0
+            self._free.append(index)
+    
+    def play(self, index: int, clip: AnimationClip):
+        """Örneğin klibini değiştirir ve baştan oynatır"""
+        self.clip_index[index] = self._register_clip(clip)
+        self.frame[index] = 0
+        self.elapsed[index] = 0.0
+        self.finished[index] = 0
+    
+    def update(self, dt: float):
+        """Tüm örneklerin oynatma durumunu ilerletir"""
+        clips = self.clips
+        clip_index = self.clip_index
+        frame = self.frame
+        elapsed = self.elapsed
+        finished = self.finished
+        for index, active in enumerate(self.active):
+            if not active:
+                continue
+            frame[index], elapsed[index], done = clips[clip_index[index]].step(
+                frame[index], elapsed[index], finished[index], dt)
+            finished[index] = done
+    
+    def get_frame(self, index: int) -> pygame.Surface:
+        """Örneğin mevcut karesini döndürür"""
+        return self.clips[self.clip_index[index]].frames[self.frame[index]]
+    
+    def is_finished(self, index: int) -> bool:
+        """Örneğin animasyonunun bitip bitmediğini döndürür"""
+        return bool(self.finished[index])
+
 class AnimationManager:
     """Animasyon yönetim sınıfı"""
     def __init__(self):
-        self.animations: Dict[str, Animation] = {}
+        self.animations: Dict[str, AnimationPlayer] = {}
         self.current_animation: Optional[str] = None
         
-    def add_animation(self, name: str, animation: Animation):
+    def add_animation(self, name: str, animation: AnimationPlayer):
         """Yeni animasyon ekler"""
         self.animations[name] = animation
         if self.current_animation is None:
             self.current_animation = name
+    
+    def add_clip(self, name: str, clip: AnimationClip, clock: Optional[GameClock] = None):
+        """Paylaşılan klip için yeni bir oynatıcı ekler
+        
+        clock verilirse oynatıcı bu saatten örneklenir ve update gerektirmez.
+        """
+        if clock is not None:
+            self.add_animation(name, ClockedAnimationPlayer(clip, clock=clock))
+        else:
+            self.add_animation(name, Animation.from_clip(clip))
             
     def play(self, name: str):
         """Belirtilen animasyonu oynatır"""
@@ -361,21 +1163,65 @@ class AnimationManager:
         self.current_animation = None
 
 # Sprite sheet'ten animasyon oluşturma yardımcı fonksiyonları
-def load_spritesheet(filename: str, frame_width: int, frame_height: int) -> List[pygame.Surface]:
-    """Sprite sheet'i yükler ve frame'lere böler"""
-    spritesheet = pygame.image.load(filename)
-    frames = []
+class SpriteSheetCache:
+    """Yol anahtarlı sprite sheet önbelleği
     
-    sheet_width = spritesheet.get_width()
-    sheet_height = spritesheet.get_height()
+    Her sheet bir kez çözülüp dönüştürülür; kareler sheet üzerinde
+    subsurface olarak döndürülür ve piksel kopyalanmaz.
+    """
+    def __init__(self):
+        self.sheets: Dict[str, pygame.Surface] = {}
+        self.frames: Dict[Tuple[str, int, int], Tuple[pygame.Surface, ...]] = {}
+        self.loads = 0
     
-    for y in range(0, sheet_height, frame_height):
-        for x in range(0, sheet_width, frame_width):
-            frame = pygame.Surface((frame_width, frame_height), pygame.SRCALPHA)
-            frame.blit(spritesheet, (0, 0), (x, y, frame_width, frame_height))
-            frames.append(frame)
+    def get_sheet(self, filename: str) -> pygame.Surface:
+        """Sheet'i önbellekten döndürür, yoksa yükler"""
+        key = os.path.abspath(filename)
+        sheet = self.sheets.get(key)
+        if sheet is None:
+            sheet = texture_cache.load_image(filename)
+            if pygame.display.get_surface() is not None:
+                sheet = sheet.convert_alpha()
+            self.sheets[key] = sheet
+            self.loads += 1
+        return sheet
+    
+    def get_frames(self, filename: str, frame_width: int, frame_height: int) -> Tuple[pygame.Surface, ...]:
+        """Sheet'i kare boyutuna göre böler, aynı bölme tekrar hesaplanmaz"""
+        key = (os.path.abspath(filename), frame_width, frame_height)
+        frames = self.frames.get(key)
+        if frames is None:
+            sheet = self.get_sheet(filename)
+            sheet_width = sheet.get_width()
+            sheet_height = sheet.get_height()
+            if frame_width <= 0 or frame_height <= 0 or frame_width > sheet_width or frame_height > sheet_height:
+                raise ValueError(
+                    f"{filename} ({sheet_width}x{sheet_height}) içine "
+                    f"{frame_width}x{frame_height} boyutunda tam bir kare sığmıyor"
+                )
             
-    return frames
+            # Yalnızca sheet içine tam sığan kareler alınır
+            frames = self.frames[key] = tuple(
+                sheet.subsurface((x, y, frame_width, frame_height))
+                for y in range(0, sheet_height - frame_height + 1, frame_height)
+                for x in range(0, sheet_width - frame_width + 1, frame_width)
+            )
+        return frames
+    
+    def clear(self):
+        """Önbelleği temizler"""
+        self.sheets.clear()
+        self.frames.clear()
+
+# Global sprite sheet önbelleği, tüm yükleyiciler tarafından paylaşılır
+sprite_sheet_cache = SpriteSheetCache()
+
+def load_spritesheet(filename: str, frame_width: int, frame_height: int) -> List[pygame.Surface]:
+    """Sprite sheet'i yükler ve frame'lere böler
+    
+    Frame'ler önbellekteki sheet'in subsurface'leridir.
+    """
+    return list(sprite_sheet_cache.get_frames(filename, frame_width, frame_height))
     
 def create_animation_from_spritesheet(filename: str, frame_width: int, frame_height: int,
                                     frame_duration: float = 0.1, loop: bool = True) -> Animation:
@@ -383,23 +1229,28 @@ def create_animation_from_spritesheet(filename: str, frame_width: int, frame_hei
     frames = load_spritesheet(filename, frame_width, frame_height)
     return Animation(frames, frame_duration, loop)
     
-def load_animation_config(config_file: str) -> Dict[str, Animation]:
-    """JSON config dosyasından animasyonları yükler"""
-    animations = {}
+def load_animation_clips(config_file: str) -> Dict[str, AnimationClip]:
+    """JSON config dosyasından paylaşılabilir animasyon kliplerini yükler"""
+    clips = {}
     
     with open(config_file, 'r') as f:
         config = json.load(f)
         
     for anim_name, anim_data in config['animations'].items():
-        spritesheet = anim_data['spritesheet']
-        frame_width = anim_data['frame_width']
-        frame_height = anim_data['frame_height']
-        frame_duration = anim_data.get('frame_duration', 0.1)
-        loop = anim_data.get('loop', True)
-        
-        animation = create_animation_from_spritesheet(
-            spritesheet, frame_width, frame_height, frame_duration, loop
+        frames = load_spritesheet(anim_data['spritesheet'], anim_data['frame_width'],
+                                  anim_data['frame_height'])
+        clips[anim_name] = AnimationClip(
+            frames, anim_data.get('frame_duration', 0.1), anim_data.get('loop', True)
         )
-        animations[anim_name] = animation
         
-    return animations 
\ No newline at end of file
+    return clips
+        
+def load_animation_config(config_file: str,
+                          clips: Optional[Dict[str, AnimationClip]] = None) -> Dict[str, Animation]:
+    """JSON config dosyasından animasyonları yükler
+    
+    clips verilirse dosya okunmaz, oynatıcılar bu klipleri paylaşır.
+    """
+    if clips is None:
+        clips = load_animation_clips(config_file)
+    return {name: Animation.from_clip(clip) for name, clip in clips.items()}
@@ -0,0 +1,162 @@
+"""
+Toplu iskelet animasyonu değerlendirici.
+Aynı animasyonu oynatan çok sayıda iskeletin kemiklerini NumPy ile tek adımda hesaplar.
+"""
+
+import weakref
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from .animation import Skeleton, SkeletalAnimation
+
+# Değer satırlarının sırası
+CHANNELS = ('x', 'y', 'rotation', 'scale_x', 'scale_y')
+ROTATION = CHANNELS.index('rotation')
+
+class CompiledClip:
+    """Bir animasyonun tüm izlerinin tek düz dizide birleştirilmiş hali
+    
+    Her iz, zamanları iz indeksi * span kadar kaydırılarak ardışık yerleştirilir.
+    Böylece tüm kemikler ve örnekler için tek bir searchsorted çağrısı yeterlidir.
+    """
+    def __init__(self, animation: SkeletalAnimation):
+        tracks = animation.tracks
+        self.source = tracks
+        self.bone_names: List[str] = list(tracks.keys())
+        
+        times = [np.frombuffer(track.times, dtype=np.float64) for track in tracks.values()]
+        lengths = np.array([len(t) for t in times], dtype=np.int64)
+        self.starts = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.int64)
+        self.ends = self.starts + lengths
+        
+        all_times = np.concatenate(times) if times else np.zeros(0)
+        self.origin = min(float(all_times.min()), 0.0) if len(all_times) else 0.0
+        latest = max(float(all_times.max()), animation.duration) if len(all_times) else animation.duration
+        self.span = latest - self.origin + 1.0
+        
+        self.times = all_times
+        self.keys = np.concatenate([
+            t - self.origin + index * self.span for index, t in enumerate(times)
+        ]) if times else np.zeros(0)
+        self.values = np.array([
+            np.concatenate([np.frombuffer(getattr(track, channel), dtype=np.float64)
+                            for track in tracks.values()])
+            if tracks else np.zeros(0)
+            for channel in CHANNELS
+        ])
+    
+    def evaluate(self, sample_times: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Tüm kemikleri verilen zamanlarda değerlendirir
+        
+        Returns:
+            (değerler, geçerli): değerler (kanal, kemik, örnek) boyutunda,
+            geçerli ise (kemik, örnek) boyutunda; ilk kareden önceki örnekler
+            False olarak işaretlenir.
+        """
+        track_count = len(self.bone_names)
+        offsets = (np.arange(track_count) * self.span)[:, None]
+        queries = sample_times[None, :] - self.origin + offsets
+        
+        index = np.searchsorted(self.keys, queries, side='right') - 1
+        starts = self.starts[:, None]
+        ends = self.ends[:, None]
+        
+        # Kaydırmadaki yuvarlama hatasını ham zamanlarla düzelt
+        index -= (index >= starts) & (self.times[np.maximum(index, starts)] > sample_times[None, :])
+        following = np.minimum(index + 1, ends - 1)
+        index += (index + 1 < ends) & (self.times[np.maximum(following, starts)] <= sample_times[None, :])
+        
+        valid = index >= starts
+        index = np.maximum(index, starts)
+        following = np.minimum(index + 1, ends - 1)
+        
+        # İki kare arasındaki oran (son karede 0)
+        has_next = following > index
+        start_time = self.times[index]
+        length = np.where(has_next, self.times[following] - start_time, 1.0)
+        t = np.where(has_next, (sample_times[None, :] - start_time) / length, 0.0)
+        
+        current = self.values[:, index]
+        delta = self.values[:, following] - current
+        delta[ROTATION] = (delta[ROTATION] + 180) % 360 - 180
+        return current + delta * t, valid
+
+class BatchAnimationEvaluator:
+    """Aynı animasyonu paylaşan iskeletleri NumPy ile toplu değerlendirir
+    
+    Eklenen iskeletler batched olarak işaretlenir; zamanları ve kemikleri
+    Skeleton.update yerine bu sınıfın update metodunda güncellenir.
+    """
+    def __init__(self, write_back: bool = True):
+        self.write_back = write_back
+        self.skeletons: List[Skeleton] = []
+        # Aynı isimli farklı animasyonlar karışmasın diye nesnenin kendisi anahtar olarak kullanılır
+        self.results: Dict[SkeletalAnimation, Tuple[List[Skeleton], List[str], np.ndarray, np.ndarray]] = {}
+        self._clips: 'weakref.WeakKeyDictionary[SkeletalAnimation, CompiledClip]' = weakref.WeakKeyDictionary()
+    
+    def add_skeleton(self, skeleton: Skeleton):
+        """İskeleti toplu değerlendirmeye ekler"""
+        skeleton.batched = True
+        self.skeletons.append(skeleton)
+    
+    def remove_skeleton(self, skeleton: Skeleton):
+        """İskeleti toplu değerlendirmeden çıkarır"""
+        if skeleton in self.skeletons:
+            self.skeletons.remove(skeleton)
+            skeleton.batched = False
+    
+    def get_clip(self, animation: SkeletalAnimation) -> CompiledClip:
+        """Animasyonun düz dizilere derlenmiş halini döndürür"""
+        clip = self._clips.get(animation)
+        if clip is None or clip.source is not animation.tracks:
+            clip = self._clips[animation] = CompiledClip(animation)
+        return clip
+    
+    def update(self, dt: float):
+        """Tüm iskeletlerin zamanını ilerletir ve kemiklerini hesaplar"""
+        groups: Dict[int, Tuple[SkeletalAnimation, List[Skeleton]]] = {}
+        for skeleton in self.skeletons:
+            if not skeleton.enabled:
+                continue
+            animation = skeleton.advance_time(dt)
+            if animation is None:
+                continue
+            group = groups.get(id(animation))
+            if group is None:
+                group = groups[id(animation)] = (animation, [])
+            group[1].append(skeleton)
+        
+        self.results.clear()
+        for animation, skeletons in groups.values():
+            clip = self.get_clip(animation)
+            if not clip.bone_names:
+                continue
+            sample_times = np.fromiter((s.animation_time for s in skeletons),
+                                       dtype=np.float64, count=len(skeletons))
+            values, valid = clip.evaluate(sample_times)
+            self.results[animation] = (skeletons, clip.bone_names, values, valid)
+            if self.write_back:
+                self._write_back(skeletons, clip.bone_names, values, valid)
+    
+    def get_pose(self, animation: SkeletalAnimation) -> Optional[Tuple[List[Skeleton], List[str], np.ndarray, np.ndarray]]:
+        """Animasyonun son güncelleme sonuçlarını (iskeletler, kemikler, değerler, geçerli) döndürür"""
+        return self.results.get(animation)
+    
+    def get_poses(self, animation_name: str) -> List[Tuple[List[Skeleton], List[str], np.ndarray, np.ndarray]]:
+        """Verilen isimdeki tüm animasyonların son güncelleme sonuçlarını döndürür"""
+        return [result for animation, result in self.results.items() if animation.name == animation_name]
+    
+    @staticmethod
+    def _write_back(skeletons: List[Skeleton], bone_names: List[str],
+                    values: np.ndarray, valid: np.ndarray):
+        """Hesaplanan değerleri kemik nesnelerine yazar"""
+        # (örnek, kemik, kanal) sırasında Python listesine çevir
+        rows = values.transpose(2, 1, 0).tolist()
+        valid_rows = valid.T.tolist()
+        for skeleton, pose, pose_valid in zip(skeletons, rows, valid_rows):
+            bones = skeleton.bones
+            for bone_name, channels, is_valid in zip(bone_names, pose, pose_valid):
+                if not is_valid:
+                    continue
+                bone = bones.get(bone_name)
+                if bone is not None:
+                    bone.x, bone.y, bone.rotation, bone.scale_x, bone.scale_y = channels
@@ -0,0 +1,138 @@
+"""
+Görünürlüğe dayalı animasyon planlayıcı.
+Ekran dışındaki animasyonları dondurur, uzaktakileri seyrek günceller ve
+sahne başına animasyon güncelleme bütçesi uygular.
+"""
+
+import math
+import pygame
+from typing import Any, Callable, List, Optional, Tuple
+from ..core.base import GameSystem
+
+# Ekran dışı davranışları
+FREEZE = 'freeze'  # Hiç güncellenmez, geçen süre atılır
+CLOCK = 'clock'    # Yalnızca zaman ilerler; advance_time yoksa süre görünür olunca uygulanır
+
+class ScheduledAnimation:
+    """Planlayıcıya kayıtlı animasyonun durumu"""
+    __slots__ = ('target', 'get_bounds', 'offscreen', 'pending', 'frames_waiting', 'visible', 'distance')
+    
+    def __init__(self, target: Any, get_bounds: Callable[[], pygame.Rect], offscreen: str):
+        self.target = target
+        self.get_bounds = get_bounds
+        self.offscreen = offscreen
+        self.pending = 0.0  # Henüz uygulanmamış süre
+        self.frames_waiting = 0
+        self.visible = False
+        self.distance = 0.0
+
+class AnimationScheduler(GameSystem):
+    """Animasyon güncellemelerini görünürlük ve mesafeye göre planlar
+    
+    Kayıtlı hedeflerin update metodu yalnızca bu sistem tarafından
+    çağrılmalıdır; hedefler ayrıca sahne nesnesi olarak güncellenmemelidir.
+    
+    Args:
+        viewport: Dünya koordinatlarında görünür alan
+        margin: Görünür alanın her yönde genişletileceği piksel
+        lod_levels: (mesafe, aralık) çiftleri; görünür alanın merkezine bu
+            mesafeden uzak olanlar her 'aralık' karede bir güncellenir
+        budget: Kare başına en fazla güncelleme sayısı (None ise sınırsız)
+    """
+    def __init__(self, viewport: Optional[pygame.Rect] = None, margin: int = 64,
+                 lod_levels: Optional[List[Tuple[float, int]]] = None,
+                 budget: Optional[int] = None):
+        super().__init__("AnimationScheduler")
+        self.viewport = pygame.Rect(viewport) if viewport else None
+        self.margin = margin
+        self.lod_levels = sorted(lod_levels or [(800.0, 2), (1600.0, 4)])
+        self.budget = budget
+        self.entries: List[ScheduledAnimation] = []
+        self.frame = 0
+        
+        # Son karenin istatistikleri
+        self.updated = 0
+        self.culled = 0
+        self.deferred = 0
+    
+    def add(self, target: Any, get_bounds: Optional[Callable[[], pygame.Rect]] = None,
+            offscreen: str = CLOCK) -> ScheduledAnimation:
+        """Animasyonlu hedefi ekler
+        
+        Args:
+            target: update(dt) metodu olan nesne (Skeleton, AnimationManager...)
+            get_bounds: Hedefin dünya dikdörtgenini döndüren fonksiyon;
+                verilmezse target.get_bounds kullanılır
+            offscreen: Ekran dışında FREEZE veya CLOCK davranışı
+        """
+        entry = ScheduledAnimation(target, get_bounds or target.get_bounds, offscreen)
+        self.entries.append(entry)
+        return entry
+    
+    def remove(self, target: Any):
+        """Hedefi planlayıcıdan çıkarır"""
+        self.entries = [entry for entry in self.entries if entry.target is not target]
+    
+    def set_viewport(self, x: float, y: float, width: float, height: float):
+        """Görünür alanı (kamera konumu ve ekran boyutu) ayarlar"""
+        self.viewport = pygame.Rect(int(x), int(y), int(width), int(height))
+    
+    def get_interval(self, distance: float) -> int:
+        """Mesafeye göre güncelleme aralığını döndürür"""
+        interval = 1
+        for level_distance, level_interval in self.lod_levels:
+            if distance < level_distance:
+                break
+            interval = level_interval
+        return interval
+    
+    def update(self, dt: float):
+        """Görünür hedefleri LOD ve bütçeye göre günceller"""
+        if not self.enabled:
+            return
+        
+        self.frame += 1
+        self.updated = self.culled = self.deferred = 0
+        view = self.viewport.inflate(self.margin * 2, self.margin * 2) if self.viewport else None
+        center = self.viewport.center if self.viewport else (0, 0)
+        
+        due = []
+        for entry in self.entries:
+            entry.pending += dt
+            bounds = entry.get_bounds()
+            entry.visible = view is None or view.colliderect(bounds)
+            if not entry.visible:
+                self.culled += 1
+                self._skip_offscreen(entry)
+                continue
+            
+            entry.distance = math.hypot(bounds.centerx - center[0], bounds.centery - center[1])
+            interval = self.get_interval(entry.distance) if view is not None else 1
+            entry.frames_waiting += 1
+            if entry.frames_waiting >= interval:
+                due.append(entry)
+        
+        # Bütçe aşılırsa en uzun süredir bekleyenler ve yakındakiler önce
+        if self.budget is not None and len(due) > self.budget:
+            due.sort(key=lambda e: (-e.pending, e.distance))
+            self.deferred = len(due) - self.budget
+            due = due[:self.budget]
+        
+        for entry in due:
+            entry.target.update(entry.pending)
+            entry.pending = 0.0
+            entry.frames_waiting = 0
+        self.updated = len(due)
+    
+    @staticmethod
+    def _skip_offscreen(entry: ScheduledAnimation):
+        """Ekran dışındaki hedefin zamanını davranışına göre işler"""
+        if entry.offscreen == FREEZE:
+            entry.pending = 0.0
+            return
+        
+        # Saati ilerletebilen hedefler kare hesaplamadan ilerletilir
+        advance_time = getattr(entry.target, 'advance_time', None)
+        if advance_time is not None:
+            advance_time(entry.pending)
+            entry.pending = 0.0
@@ -1,10 +1,36 @@
 import pygame
 import math
-from .animation import Animation, AnimationManager
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from .animation import Animation, AnimationClip, AnimationManager
 
 class SpriteGenerator:
+    # Parametre anahtarlı önbellekler; dönen yüzeyler paylaşılır, değiştirilmemeli
+    _sprite_cache: Dict[tuple, pygame.Surface] = {}
+    _clip_cache: Dict[tuple, Dict[str, AnimationClip]] = {}
+    
+    @staticmethod
+    def _variant_key(width: int, height: int, base_color: tuple, detail_color: tuple) -> tuple:
+        """Önbellek anahtarını oluşturur"""
+        return (width, height, tuple(base_color), tuple(detail_color))
+    
+    @staticmethod
+    def clear_cache():
+        """Üretilmiş sprite ve klip önbelleğini temizler"""
+        SpriteGenerator._sprite_cache.clear()
+        SpriteGenerator._clip_cache.clear()
+    
     @staticmethod
     def create_character_sprite(width: int, height: int, base_color: tuple, detail_color: tuple, direction: str = 'up') -> pygame.Surface:
+        key = SpriteGenerator._variant_key(width, height, base_color, detail_color) + (direction,)
+        surface = SpriteGenerator._sprite_cache.get(key)
+        if surface is None:
+            surface = SpriteGenerator._sprite_cache[key] = SpriteGenerator._draw_character_sprite(
+                width, height, base_color, detail_color, direction)
+        return surface
+    
+    @staticmethod
+    def _draw_character_sprite(width: int, height: int, base_color: tuple, detail_color: tuple, direction: str) -> pygame.Surface:
         # Temel karakter sprite'ı oluştur
         surface = pygame.Surface((width, height), pygame.SRCALPHA)
         
@@ -37,6 +63,8 @@ class SpriteGenerator:
     @staticmethod
     def create_directional_sprites(width: int, height: int, base_color: tuple, detail_color: tuple) -> dict:
         # Dört yön için sprite'lar oluştur
+        key = SpriteGenerator._variant_key(width, height, base_color, detail_color)
+        cached = [SpriteGenerator._sprite_cache.get(key + (direction,)) for direction in ('right', 'left')]
         sprites = {}
         
         # Yukarı bakan sprite
@@ -45,17 +73,19 @@ class SpriteGenerator:
         # Aşağı bakan sprite (farklı göz pozisyonuyla)
         sprites['down'] = SpriteGenerator.create_character_sprite(width, height, base_color, detail_color, 'down')
         
-        # Sağa bakan sprite
-        sprites['right'] = pygame.transform.rotate(sprites['up'], -30)
-        
-        # Sola bakan sprite
-        sprites['left'] = pygame.transform.flip(sprites['right'], True, False)
+        if None in cached:
+            # Sağa bakan sprite
+            cached[0] = SpriteGenerator._sprite_cache[key + ('right',)] = pygame.transform.rotate(sprites['up'], -30)
+            
+            # Sola bakan sprite
+            cached[1] = SpriteGenerator._sprite_cache[key + ('left',)] = pygame.transform.flip(cached[0], True, False)
+        sprites['right'], sprites['left'] = cached
         
         return sprites 
     
     @staticmethod
-    def create_walking_animation(sprite: pygame.Surface, frames: int = 6) -> Animation:
-        """Yürüme animasyonu oluşturur"""
+    def create_walking_clip(sprite: pygame.Surface, frames: int = 6) -> AnimationClip:
+        """Paylaşılabilir yürüme animasyonu klibi oluşturur"""
         animation_frames = []
         
         for i in range(frames):
@@ -69,19 +99,91 @@ class SpriteGenerator:
             new_frame.blit(frame, (0, offset))
             animation_frames.append(new_frame)
         
-        return Animation(animation_frames, frame_duration=0.1)
+        return AnimationClip(animation_frames, frame_duration=0.1)
+    
+    @staticmethod
+    def create_walking_animation(sprite: pygame.Surface, frames: int = 6) -> Animation:
+        """Yürüme animasyonu oluşturur"""
+        return Animation.from_clip(SpriteGenerator.create_walking_clip(sprite, frames))
+    
+    @staticmethod
+    def create_character_clips(width: int, height: int, base_color: tuple, detail_color: tuple) -> dict:
+        """Karakterin yön başına yürüme kliplerini oluşturur (aynı parametreler önbellekten döner)
+        
+        Klipler ve kareleri önbellekle paylaşılır, salt okunurdur; değiştirilecekse
+        kareler kopyalanmalıdır.
+        """
+        key = SpriteGenerator._variant_key(width, height, base_color, detail_color)
+        clips = SpriteGenerator._clip_cache.get(key)
+        if clips is None:
+            directional_sprites = SpriteGenerator.create_directional_sprites(width, height, base_color, detail_color)
+            clips = SpriteGenerator._clip_cache[key] = {
+                f"walk_{direction}": SpriteGenerator.create_walking_clip(sprite)
+                for direction, sprite in directional_sprites.items()
+            }
+        return dict(clips)
     
     @staticmethod
-    def create_character_animations(width: int, height: int, base_color: tuple, detail_color: tuple) -> AnimationManager:
-        """Karakter için tüm animasyonları oluşturur"""
+    def generate_character_variants(variants: List[Tuple[int, int, tuple, tuple]],
+                                    workers: Optional[int] = None) -> List[Dict[str, AnimationClip]]:
+        """Birden fazla karakter varyantının kliplerini toplu üretir
+        
+        Önbellekte olmayan varyantlar süreç havuzunda çizilir; kareler ham
+        RGBA tamponları olarak ana sürece taşınır. workers 0 ise çizim bu
+        süreçte yapılır. Dönen klipler create_character_clips'teki gibi
+        paylaşılır ve salt okunurdur.
+        
+        Args:
+            variants: (genişlik, yükseklik, ana renk, detay rengi) listesi
+            workers: Süreç sayısı (None ise işlemci sayısı)
+        """
+        keys = [SpriteGenerator._variant_key(*variant) for variant in variants]
+        missing = list(dict.fromkeys(key for key in keys if key not in SpriteGenerator._clip_cache))
+        if workers == 0 or len(missing) == 1:
+            for key in missing:
+                SpriteGenerator.create_character_clips(*key)
+        elif missing:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                rendered = list(pool.map(_render_character_variant, missing))
+            
+            # Ham tamponlardan yüzeyleri yeniden oluştur
+            for key, clips in zip(missing, rendered):
+                SpriteGenerator._clip_cache[key] = {name: _clip_from_buffers(data) for name, data in clips.items()}
+        
+        return [dict(SpriteGenerator._clip_cache[key]) for key in keys]
+    
+    @staticmethod
+    def create_character_animations(width: int, height: int, base_color: tuple, detail_color: tuple,
+                                    clips: dict = None) -> AnimationManager:
+        """Karakter için tüm animasyonları oluşturur
+        
+        clips verilirse kareler yeniden üretilmez; tüm karakterler aynı klipleri paylaşır.
+        """
         manager = AnimationManager()
         
-        # Temel sprite'ları oluştur
-        directional_sprites = SpriteGenerator.create_directional_sprites(width, height, base_color, detail_color)
+        if clips is None:
+            clips = SpriteGenerator.create_character_clips(width, height, base_color, detail_color)
         
-        # Her yön için yürüme animasyonları oluştur
-        for direction, sprite in directional_sprites.items():
-            walk_anim = SpriteGenerator.create_walking_animation(sprite)
-            manager.add_animation(f"walk_{direction}", walk_anim)
+        # Her yön için oynatıcı ekle
+        for name, clip in clips.items():
+            manager.add_clip(name, clip)
         
-        return manager 
\ No newline at end of file
+        return manager
+
+ClipBuffers = Tuple[List[Tuple[Tuple[int, int], bytes]], float, bool]
+
+def _clip_to_buffers(clip: AnimationClip) -> ClipBuffers:
+    """Klibi süreçler arası taşınabilir (kareler, kare süresi, döngü) biçimine çevirir"""
+    frames = [(frame.get_size(), pygame.image.tobytes(frame, 'RGBA')) for frame in clip.frames]
+    return frames, clip.frame_duration, clip.loop
+
+def _clip_from_buffers(data: ClipBuffers) -> AnimationClip:
+    """_clip_to_buffers çıktısından klibi yeniden oluşturur"""
+    frames, frame_duration, loop = data
+    return AnimationClip([pygame.image.frombytes(pixels, size, 'RGBA') for size, pixels in frames],
+                         frame_duration, loop)
+
+def _render_character_variant(key: tuple) -> Dict[str, ClipBuffers]:
+    """Varyantın kliplerini çizer ve kareleri ham RGBA tamponları olarak döndürür"""
+    clips = SpriteGenerator.create_character_clips(*key)
+    return {name: _clip_to_buffers(clip) for name, clip in clips.items()}
@@ -1,8 +1,12 @@
 import pygame
-from typing import Dict, Tuple, Optional
+from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from .debug import debug_manager, DebugCategory
+from ..utils.texture_cache import hash_file, texture_cache
 
 @dataclass
 class TextureRegion:
@@ -12,82 +16,286 @@ class TextureRegion:
     width: int
     height: int
     name: str
+    page: int = 0
+    rotated: bool = False
+
+class SpriteHandle:
+    """Atlas bölgesine önceden hesaplanmış, tamsayı id ile erişilen tutamaç
+    
+    surface doğrudan blit edilebilir; source ve area ise Surface.blits
+    toplu çizimlerinde (source, hedef, area) biçiminde kullanılabilir.
+    Döndürülmüş bölgelerde source, düz çevrilmiş yüzeyin kendisidir.
+    """
+    __slots__ = ('id', 'name', 'source', 'area', 'surface')
+    
+    def __init__(self, handle_id: int, name: str, source: pygame.Surface,
+                 area: pygame.Rect, surface: pygame.Surface):
+        self.id = handle_id
+        self.name = name
+        self.source = source
+        self.area = area
+        self.surface = surface
+
+class MaxRectsPacker:
+    """Tek bir atlas sayfası için MaxRects yerleştirici (best short side fit)"""
+    def __init__(self, width: int, height: int, allow_rotation: bool = False):
+        self.width = width
+        self.height = height
+        self.allow_rotation = allow_rotation
+        self.free_rects: List[pygame.Rect] = [pygame.Rect(0, 0, width, height)]
+        self.used_area = 0
+    
+    def insert(self, width: int, height: int) -> Optional[Tuple[pygame.Rect, bool]]:
+        """Verilen boyut için yer bulur, (alan, döndürüldü_mü) döndürür"""
+        if width <= 0 or height <= 0:
+            return None
+        
+        candidates = [(width, height, False)]
+        if self.allow_rotation and width != height:
+            candidates.append((height, width, True))
+        
+        best = None
+        best_score = None
+        for free in self.free_rects:
+            for w, h, rotated in candidates:
+                if w > free.width or h > free.height:
+                    continue
+                
+                # Kalan kısa ve uzun kenara göre puanla
+                leftover_x = free.width - w
+                leftover_y = free.height - h
+                score = (min(leftover_x, leftover_y), max(leftover_x, leftover_y))
+                if best_score is None or score < best_score:
+                    best_score = score
+                    best = (pygame.Rect(free.x, free.y, w, h), rotated)
+        
+        if best is None:
+            return None  # Sayfa dolu
+        
+        self._place(best[0])
+        return best
+    
+    def occupancy(self) -> float:
+        """Sayfanın doluluk oranını döndürür"""
+        return self.used_area / float(self.width * self.height)
+    
+    def close(self):
+        """Sayfayı yeni yerleştirmelere kapatır"""
+        self.free_rects = []
+    
+    def _place(self, rect: pygame.Rect):
+        """Yerleştirilen alanı boş dikdörtgenlerden çıkarır"""
+        new_free: List[pygame.Rect] = []
+        for free in self.free_rects:
+            if not free.colliderect(rect):
+                new_free.append(free)
+                continue
+            
+            # Kesişen boş alanı dört parçaya böl
+            if rect.left > free.left:
+                new_free.append(pygame.Rect(free.left, free.top, rect.left - free.left, free.height))
+            if rect.right < free.right:
+                new_free.append(pygame.Rect(rect.right, free.top, free.right - rect.right, free.height))
+            if rect.top > free.top:
+                new_free.append(pygame.Rect(free.left, free.top, free.width, rect.top - free.top))
+            if rect.bottom < free.bottom:
+                new_free.append(pygame.Rect(free.left, rect.bottom, free.width, free.bottom - rect.bottom))
+        
+        # Başka bir boş alanın içinde kalan dikdörtgenleri at
+        self.free_rects = [
+            free for i, free in enumerate(new_free)
+            if not any(
+                j != i and other.contains(free) and (other != free or j < i)
+                for j, other in enumerate(new_free)
+            )
+        ]
+        self.used_area += rect.width * rect.height
 
 class TextureAtlas:
-    """Birden fazla sprite'ı tek bir texturede yöneten sistem"""
-    def __init__(self, texture_size: Tuple[int, int] = (1024, 1024)):
+    """Birden fazla sprite'ı bir veya daha fazla texture sayfasında yöneten sistem"""
+    def __init__(self, texture_size: Tuple[int, int] = (1024, 1024), allow_rotation: bool = False):
         self.texture_size = texture_size
-        self.surface = pygame.Surface(texture_size, pygame.SRCALPHA)
+        self.allow_rotation = allow_rotation
+        self.pages: List[pygame.Surface] = []
+        self.packers: List[MaxRectsPacker] = []
         self.regions: Dict[str, TextureRegion] = {}
-        self.next_x = 0
-        self.next_y = 0
-        self.row_height = 0
+        self.sources: Dict[str, str] = {}  # Bölge adı -> kaynak dosya hash'i
+        self.handles: List[SpriteHandle] = []
+        self.handle_ids: Dict[str, int] = {}
+        self._add_page()
+    
+    @property
+    def surface(self) -> pygame.Surface:
+        """İlk atlas sayfası (tek sayfalı kullanım için)"""
+        return self.pages[0]
+    
+    @surface.setter
+    def surface(self, surface: pygame.Surface):
+        self.pages[0] = surface
+    
+    @property
+    def page_count(self) -> int:
+        """Atlas sayfa sayısını döndürür"""
+        return len(self.pages)
+    
+    def _add_page(self, surface: Optional[pygame.Surface] = None) -> int:
+        """Yeni bir atlas sayfası ekler ve indeksini döndürür"""
+        if surface is None:
+            surface = pygame.Surface(self.texture_size, pygame.SRCALPHA)
+        self.pages.append(surface)
+        self.packers.append(MaxRectsPacker(*self.texture_size, allow_rotation=self.allow_rotation))
+        return len(self.pages) - 1
     
     def add_texture(self, name: str, surface: pygame.Surface) -> Optional[TextureRegion]:
         """Yeni bir texture ekle"""
         width, height = surface.get_size()
         
-        # Yeni satıra geçme kontrolü
-        if self.next_x + width > self.texture_size[0]:
-            self.next_x = 0
-            self.next_y += self.row_height
-            self.row_height = 0
+        # Sayfadan büyük texture'lar hiçbir sayfaya sığmaz
+        fits = width <= self.texture_size[0] and height <= self.texture_size[1]
+        if self.allow_rotation:
+            fits = fits or (height <= self.texture_size[0] and width <= self.texture_size[1])
+        if not fits:
+            return None
         
-        # Yükseklik kontrolü
-        if self.next_y + height > self.texture_size[1]:
-            return None  # Atlas dolu
+        # Mevcut sayfalarda yer ara, bulunamazsa yeni sayfa aç
+        placement = None
+        for page, packer in enumerate(self.packers):
+            placement = packer.insert(width, height)
+            if placement:
+                break
+        if placement is None:
+            page = self._add_page()
+            placement = self.packers[page].insert(width, height)
+            if placement is None:
+                return None
+        
+        rect, rotated = placement
         
         # Texture'ı kopyala
-        self.surface.blit(surface, (self.next_x, self.next_y))
+        if rotated:
+            self.pages[page].blit(pygame.transform.rotate(surface, 90), rect.topleft)
+        else:
+            self.pages[page].blit(surface, rect.topleft)
         
         # Bölgeyi kaydet
         region = TextureRegion(
-            x=self.next_x,
-            y=self.next_y,
+            x=rect.x,
+            y=rect.y,
             width=width,
             height=height,
-            name=name
+            name=name,
+            page=page,
+            rotated=rotated
         )
-        self.regions[name] = region
-        
-        # Sonraki pozisyonu güncelle
-        self.next_x += width
-        self.row_height = max(self.row_height, height)
+        self._register_region(region)
         
         return region
     
+    def _register_region(self, region: TextureRegion):
+        """Bölgeyi kaydeder ve sprite tutamacını önceden hesaplar"""
+        self.regions[region.name] = region
+        
+        source = self.pages[region.page]
+        if region.rotated:
+            # Sayfadaki pikseller döndürülmüş; blits için düz yüzeyin tamamı kullanılır
+            rotated_area = pygame.Rect(region.x, region.y, region.height, region.width)
+            surface = pygame.transform.rotate(source.subsurface(rotated_area), -90)
+            source = surface
+            area = surface.get_rect()
+        else:
+            area = pygame.Rect(region.x, region.y, region.width, region.height)
+            surface = source.subsurface(area)
+        
+        # Aynı isim yeniden eklenirse id ve tutamaç nesnesi korunur, alanları güncellenir
+        handle_id = self.handle_ids.get(region.name)
+        if handle_id is None:
+            handle_id = len(self.handles)
+            self.handle_ids[region.name] = handle_id
+            self.handles.append(SpriteHandle(handle_id, region.name, source, area, surface))
+            return
+        handle = self.handles[handle_id]
+        handle.source = source
+        handle.area = area
+        handle.surface = surface
+    
+    def add_textures(self, textures: Dict[str, pygame.Surface],
+                     sort: bool = True) -> Dict[str, Optional[TextureRegion]]:
+        """Birden fazla texture'ı ekle, isteğe bağlı olarak büyükten küçüğe sırala"""
+        items = list(textures.items())
+        if sort:
+            # Büyük kenarı ve alanı büyük olanlar önce yerleşirse boşluk azalır
+            items.sort(key=lambda item: (max(item[1].get_size()),
+                                         item[1].get_width() * item[1].get_height()),
+                       reverse=True)
+        return {name: self.add_texture(name, surface) for name, surface in items}
+    
     def get_region(self, name: str) -> Optional[TextureRegion]:
         """İsme göre texture bölgesini getir"""
         return self.regions.get(name)
     
     def get_texture(self, name: str) -> Optional[pygame.Surface]:
         """İsme göre texture'ı getir"""
-        region = self.get_region(name)
-        if region:
-            return self.surface.subsurface(pygame.Rect(
-                region.x, region.y, region.width, region.height
-            ))
+        handle = self.get_handle_by_name(name)
+        if handle:
+            return handle.surface
         return None
     
-    def save(self, atlas_path: str, metadata_path: str):
-        """Atlas'ı ve metadata'yı kaydet"""
-        # Atlas texture'ını kaydet
-        pygame.image.save(self.surface, atlas_path)
+    def get_handle_id(self, name: str) -> Optional[int]:
+        """İsme göre sprite tutamacı id'sini getir"""
+        return self.handle_ids.get(name)
+    
+    def get_handle(self, handle_id: int) -> SpriteHandle:
+        """Id'ye göre sprite tutamacını getir"""
+        return self.handles[handle_id]
+    
+    def get_handle_by_name(self, name: str) -> Optional[SpriteHandle]:
+        """İsme göre sprite tutamacını getir"""
+        handle_id = self.handle_ids.get(name)
+        if handle_id is None:
+            return None
+        return self.handles[handle_id]
+    
+    def get_occupancy(self) -> List[float]:
+        """Her sayfanın doluluk oranını döndürür"""
+        return [packer.occupancy() for packer in self.packers]
+    
+    @staticmethod
+    def _page_path(atlas_path: str, page: int) -> str:
+        """Sayfa indeksine göre dosya yolunu döndürür"""
+        if page == 0:
+            return atlas_path
+        root, ext = os.path.splitext(atlas_path)
+        return f"{root}_{page}{ext}"
+    
+    def save(self, atlas_path: str, metadata_path: str, pages: Optional[List[int]] = None):
+        """Atlas'ı ve metadata'yı kaydet, pages verilirse yalnızca o sayfaları yaz"""
+        # Atlas sayfalarını kaydet
+        page_files = []
+        for page, page_surface in enumerate(self.pages):
+            page_path = self._page_path(atlas_path, page)
+            if pages is None or page in pages:
+                pygame.image.save(page_surface, page_path)
+            page_files.append(os.path.basename(page_path))
         
         # Metadata'yı kaydet
         metadata = {
             'size': self.texture_size,
+            'pages': page_files,
             'regions': {
                 name: {
                     'x': region.x,
                     'y': region.y,
                     'width': region.width,
                     'height': region.height,
-                    'name': region.name
+                    'name': region.name,
+                    'page': region.page,
+                    'rotated': region.rotated
                 }
                 for name, region in self.regions.items()
             }
         }
+        if self.sources:
+            metadata['sources'] = self.sources
         
         with open(metadata_path, 'w') as f:
             json.dump(metadata, f, indent=2)
@@ -102,23 +310,30 @@ class TextureAtlas:
         # Atlas'ı oluştur
         atlas = cls(tuple(metadata['size']))
         
-        # Atlas texture'ını yükle
-        atlas.surface = pygame.image.load(atlas_path).convert_alpha()
+        # Atlas sayfalarını yükle (eski metadata tek sayfa içerir)
+        page_count = len(metadata.get('pages', [None]))
+        atlas.surface = texture_cache.load_image(atlas_path).convert_alpha()
+        for page in range(1, page_count):
+            atlas._add_page(texture_cache.load_image(cls._page_path(atlas_path, page)).convert_alpha())
         
         # Bölgeleri yükle
         for name, region_data in metadata['regions'].items():
-            atlas.regions[name] = TextureRegion(**region_data)
+            atlas._register_region(TextureRegion(**region_data))
+        atlas.sources = metadata.get('sources', {})
         
         return atlas
 
 class TextureManager:
     """Texture atlaslarını yöneten sistem"""
-    def __init__(self):
+    def __init__(self, decode_workers: Optional[int] = None):
         self.atlases: Dict[str, TextureAtlas] = {}
+        self.decode_workers = decode_workers  # None: ThreadPoolExecutor varsayılanı
+        self.last_load_timings: Dict[str, float] = {}
     
-    def create_atlas(self, name: str, size: Tuple[int, int] = (1024, 1024)) -> TextureAtlas:
+    def create_atlas(self, name: str, size: Tuple[int, int] = (1024, 1024),
+                     allow_rotation: bool = False) -> TextureAtlas:
         """Yeni bir atlas oluştur"""
-        atlas = TextureAtlas(size)
+        atlas = TextureAtlas(size, allow_rotation)
         self.atlases[name] = atlas
         return atlas
     
@@ -126,20 +341,132 @@ class TextureManager:
         """İsme göre atlas'ı getir"""
         return self.atlases.get(name)
     
+    def decode_images(self, paths: Dict[str, str]) -> Dict[str, pygame.Surface]:
+        """PNG dosyalarını iş parçacığı havuzunda çözer
+        
+        pygame.image.load libpng çalışırken GIL'i bıraktığı için çözme paralel
+        yürür. Doku önbelleği etkinse pikseller oradan okunur. Dönen yüzeyler
+        henüz ekran formatına dönüştürülmemiştir.
+        """
+        if self.decode_workers == 1 or len(paths) < 2:
+            return {name: texture_cache.load_image(path) for name, path in paths.items()}
+        
+        with ThreadPoolExecutor(max_workers=self.decode_workers) as executor:
+            return dict(zip(paths.keys(), executor.map(texture_cache.load_image, paths.values())))
+    
     def load_directory(self, directory: str, atlas_name: str) -> TextureAtlas:
         """Bir dizindeki tüm texture'ları yükle ve atlas oluştur"""
         atlas = self.create_atlas(atlas_name)
         
         # Dizindeki tüm .png dosyalarını tara
+        paths = {}
         for filename in os.listdir(directory):
             if filename.endswith('.png'):
-                path = os.path.join(directory, filename)
+                paths[os.path.splitext(filename)[0]] = os.path.join(directory, filename)
+        
+        # Dosyaları paralel çöz
+        start = time.perf_counter()
+        decoded = self.decode_images(paths)
+        decoded_at = time.perf_counter()
+        
+        # Ekran formatına dönüştürme ana iş parçacığında yapılmalı
+        textures = {name: surface.convert_alpha() for name, surface in decoded.items()}
+        converted_at = time.perf_counter()
+        
+        # Sıralı olarak atlas'a ekle
+        atlas.add_textures(textures)
+        packed_at = time.perf_counter()
+        
+        self.last_load_timings = {
+            'decode': decoded_at - start,
+            'convert': converted_at - decoded_at,
+            'pack': packed_at - converted_at,
+            'total': packed_at - start
+        }
+        debug_manager.log(
+            f"Atlas '{atlas_name}': {len(textures)} texture yüklendi "
+            f"(çözme {self.last_load_timings['decode'] * 1000:.1f} ms, "
+            f"dönüştürme {self.last_load_timings['convert'] * 1000:.1f} ms, "
+            f"yerleştirme {self.last_load_timings['pack'] * 1000:.1f} ms)",
+            DebugCategory.GRAPHICS
+        )
+        
+        return atlas
+    
+    def bake_directory(self, directory: str, atlas_name: str, output_directory: str,
+                       size: Tuple[int, int] = (1024, 1024),
+                       allow_rotation: bool = False) -> TextureAtlas:
+        """Dizini önceden pişirilmiş atlas'a dönüştür
+        
+        Kaynak PNG'lerin içerik hash'leri metadata ile karşılaştırılır. Hiçbir
+        şey değişmediyse pişirilmiş atlas yüklenir; değişen veya silinen
+        dosyaların bulunduğu sayfalar yeniden oluşturulur, diğerleri korunur.
+        """
+        atlas_path = os.path.join(output_directory, f"{atlas_name}.png")
+        metadata_path = os.path.join(output_directory, f"{atlas_name}.json")
+        
+        # Kaynak dosyaların hash'lerini hesapla
+        paths = {}
+        sources = {}
+        for filename in sorted(os.listdir(directory)):
+            if filename.endswith('.png'):
                 name = os.path.splitext(filename)[0]
-                
-                # Texture'ı yükle ve atlas'a ekle
-                surface = pygame.image.load(path).convert_alpha()
-                atlas.add_texture(name, surface)
+                paths[name] = os.path.join(directory, filename)
+                sources[name] = hash_file(paths[name])
+        
+        previous = None
+        if os.path.exists(metadata_path):
+            with open(metadata_path, 'r') as f:
+                previous = json.load(f)
+            if tuple(previous['size']) != tuple(size):
+                previous = None  # Sayfa boyutu değişti, tamamen yeniden oluştur
+        
+        # Hiçbir şey değişmediyse pişirilmiş atlas'ı kullan
+        if previous and previous.get('sources') == sources:
+            atlas = TextureAtlas.load(atlas_path, metadata_path)
+            self.atlases[atlas_name] = atlas
+            return atlas
         
+        # Değişmeyen sayfaları bul
+        old_regions = previous['regions'] if previous else {}
+        old_sources = previous.get('sources', {}) if previous else {}
+        page_count = len(previous.get('pages', [None])) if previous else 1
+        kept_pages = {region_data.get('page', 0) for region_data in old_regions.values()}
+        for name, region_data in old_regions.items():
+            if old_sources.get(name) is None or old_sources.get(name) != sources.get(name):
+                kept_pages.discard(region_data.get('page', 0))
+        
+        atlas = TextureAtlas(size, allow_rotation)
+        for _ in range(1, page_count):
+            atlas._add_page()
+        for page in kept_pages:
+            atlas.pages[page] = texture_cache.load_image(TextureAtlas._page_path(atlas_path, page)).convert_alpha()
+            atlas.packers[page].close()
+        
+        # Korunan bölgeleri aktar, geri kalan kaynakları yeniden yerleştir
+        changed = {}
+        for name, path in paths.items():
+            region_data = old_regions.get(name)
+            if region_data and region_data.get('page', 0) in kept_pages:
+                region = TextureRegion(**region_data)
+                atlas._register_region(region)
+                atlas.packers[region.page].used_area += region.width * region.height
+            else:
+                changed[name] = path
+        textures = {name: surface.convert_alpha()
+                    for name, surface in self.decode_images(changed).items()}
+        atlas.add_textures(textures)
+        atlas.sources = sources
+        
+        dirty_pages = [page for page in range(atlas.page_count) if page not in kept_pages]
+        atlas.save(atlas_path, metadata_path, pages=dirty_pages)
+        self.atlases[atlas_name] = atlas
+        
+        debug_manager.log(
+            f"Atlas '{atlas_name}' pişirildi: {len(textures)} texture, "
+            f"{len(dirty_pages)}/{atlas.page_count} sayfa yeniden oluşturuldu",
+            DebugCategory.GRAPHICS
+        )
         return atlas
     
     def save_atlas(self, name: str, directory: str):
@@ -156,4 +483,4 @@ class TextureManager:
         metadata_path = os.path.join(directory, f"{name}.json")
         
         atlas = TextureAtlas.load(atlas_path, metadata_path)
-        self.atlases[name] = atlas 
\ No newline at end of file
+        self.atlases[name] = atlas
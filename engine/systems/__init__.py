@@ -7,3 +7,4 @@ from .audio import *
 from .input import *
 from .isometric import *
 from .physics import *
+from .physics_regions import *
@@ -1,8 +1,8 @@
 import pygame
 from typing import Tuple, Dict, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import math
-from .texture_atlas import TextureAtlas, TextureRegion
+from .texture_atlas import TextureAtlas, TextureRegion, SpriteHandle
 
 @dataclass
 class Tile:
@@ -13,15 +13,27 @@ class Tile:
     walkable: bool = True
     elevation: float = 0.0
     properties: Dict = None
+    _handle_id: Optional[int] = field(default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.properties is None:
             self.properties = {}
     
+    @property
+    def handle(self) -> Optional[SpriteHandle]:
+        """Tile'ın sprite tutamacını getir (id ilk erişimde çözülür)"""
+        if self._handle_id is None:
+            self._handle_id = self.atlas.get_handle_id(self.region_name)
+            if self._handle_id is None:
+                return None
+        # Bölge yeniden eklenince tutamaç değişebilir, bu yüzden her seferinde id ile çözülür
+        return self.atlas.handles[self._handle_id]
+    
     @property
     def surface(self) -> pygame.Surface:
         """Tile'ın texture'ını getir"""
-        return self.atlas.get_texture(self.region_name)
+        handle = self.handle
+        return handle.surface if handle else None
 
 class IsometricGrid:
     """İzometrik grid sistemi"""
@@ -220,9 +232,12 @@ class IsometricRenderer:
                 # Görünür tile'ı listeye ekle (derinlik sıralaması için)
                 visible_tiles.append((layer, grid_x + grid_y, tile, screen_x, screen_y))
         
-        # Tile'ları derinliğe göre sırala ve arka tampona çiz
-        for layer, depth, tile, screen_x, screen_y in sorted(visible_tiles, key=lambda x: (x[0], x[1])):
-            self.back_buffer.blit(tile.surface, (screen_x, screen_y))
+        # Tile'ları derinliğe göre sırala ve arka tampona tek seferde çiz
+        visible_tiles.sort(key=lambda x: (x[0], x[1]))
+        self.back_buffer.blits(
+            [(tile.surface, (screen_x, screen_y)) for _, _, tile, screen_x, screen_y in visible_tiles],
+            doreturn=False
+        )
         
         # Shader efektlerini uygula
         if self.shader_system and self.current_shader:
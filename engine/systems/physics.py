@@ -3,10 +3,26 @@ Fizik sistemi modülü.
 Pymunk kullanarak 2D fizik simülasyonunu yönetir.
 """
 
+import math
+import sys
+import numpy as np
 import pymunk
-from typing import Dict, Optional, Tuple
+from array import array
+from itertools import chain, repeat
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from ..core.base import GameSystem, GameObject
 
+# Şekillerde gövdenin satırını tutan öznitelik; toplu sorgular satırı sözlüksüz okur
+_ROW_ATTR = "_physics_row"
+
+# Toplu ışın ve nokta sorguları pymunk'ın her sorguda Python nesneleri kuran
+# sarmalayıcısını atlayıp Chipmunk'ı doğrudan çağırır. Sonuçlar önceden ayrılmış
+# C dizisine yazılır ve bu yapılarla numpy üzerinden okunur.
+_SEGMENT_INFO = np.dtype([('shape', np.uintp), ('point', np.float64, 2),
+                          ('normal', np.float64, 2), ('alpha', np.float64)])
+_POINT_INFO = np.dtype([('shape', np.uintp), ('point', np.float64, 2),
+                        ('distance', np.float64), ('gradient', np.float64, 2)])
+
 class PhysicsBody:
     """Fizik nesnesi sınıfı"""
     
@@ -28,13 +44,31 @@ class PhysicsBody:
             
         self.shapes: list[pymunk.Shape] = []
         
+        # PhysicsSystem'e bağlı gövdelerde kuvvetler bir sonraki adıma kadar biriktirilir;
+        # her karenin kuvvetleri kare süresiyle ağırlıklandırılarak toplanır (bkz. accumulate)
+        self.system: Optional['PhysicsSystem'] = None
+        self.queued = False
+        self.force_sum = [0.0, 0.0]
+        self.point_forces: list[Tuple[Tuple[float, float], Tuple[float, float]]] = []
+        self.force_time = [0.0, 0.0]
+        self.point_force_time: list[Tuple[Tuple[float, float], Tuple[float, float]]] = []
+        self.impulses: list[Tuple[Tuple[float, float], Optional[Tuple[float, float]]]] = []
+        
+        # Çarpışma katmanı; filtre ve tip sonradan eklenen şekillere de uygulanır
+        self.layer: Optional[str] = None
+        self.shape_filter: Optional[pymunk.ShapeFilter] = None
+        self.collision_type: Optional[int] = None
+        
+        # PhysicsSystem.body_names içindeki satır (-1: kayıtlı değil); şekillere de yazılır
+        self.row = -1
+        
     def add_circle_shape(self, radius: float, offset: Tuple[float, float] = (0, 0), 
                         friction: float = 0.7, elasticity: float = 0.5):
         """Daire şekli ekler"""
         shape = pymunk.Circle(self.body, radius, offset)
         shape.friction = friction
         shape.elasticity = elasticity
-        self.shapes.append(shape)
+        self._attach(shape)
         return shape
         
     def add_box_shape(self, width: float, height: float, offset: Tuple[float, float] = (0, 0),
@@ -43,7 +77,7 @@ class PhysicsBody:
         shape = pymunk.Poly.create_box(self.body, size=(width, height))
         shape.friction = friction
         shape.elasticity = elasticity
-        self.shapes.append(shape)
+        self._attach(shape)
         return shape
         
     def add_poly_shape(self, vertices: list[Tuple[float, float]], offset: Tuple[float, float] = (0, 0),
@@ -52,9 +86,38 @@ class PhysicsBody:
         shape = pymunk.Poly(self.body, vertices, transform=pymunk.Transform.identity())
         shape.friction = friction
         shape.elasticity = elasticity
-        self.shapes.append(shape)
+        self._attach(shape)
         return shape
         
+    def set_shape_filter(self, shape_filter: pymunk.ShapeFilter, collision_type: Optional[int] = None):
+        """Tüm şekillere çarpışma filtresini ve (verilirse) çarpışma tipini uygular"""
+        self.shape_filter = shape_filter
+        self.collision_type = collision_type
+        for shape in self.shapes:
+            self._apply_filter(shape)
+            
+    def _attach(self, shape: pymunk.Shape):
+        """Şekle gövdenin filtresini ve satırını uygulayıp listeye ekler"""
+        self._apply_filter(shape)
+        setattr(shape, _ROW_ATTR, self.row)
+        self.shapes.append(shape)
+        if self.system is not None:
+            self.system.clear_query_cache()
+            
+    def set_row(self, row: int):
+        """Gövdenin sistemdeki satırını ayarlar ve şekillerine yazar"""
+        self.row = row
+        for shape in self.shapes:
+            setattr(shape, _ROW_ATTR, row)
+            
+    def _apply_filter(self, shape: pymunk.Shape):
+        """Gövdenin filtresini şekle uygular, şeklin grubunu korur"""
+        if self.shape_filter is not None:
+            group = shape.filter.group
+            shape.filter = self.shape_filter._replace(group=group) if group else self.shape_filter
+        if self.collision_type is not None:
+            shape.collision_type = self.collision_type
+            
     @property
     def position(self) -> Tuple[float, float]:
         """Pozisyonu döndürür"""
@@ -76,72 +139,1000 @@ class PhysicsBody:
         self.body.angle = angle
         
     def apply_force(self, force: Tuple[float, float], point: Tuple[float, float] = None):
-        """Kuvvet uygular"""
+        """Kuvvet uygular
+        
+        Sisteme bağlı gövdelerde kuvvet kuyruğa alınır ve bir sonraki
+        adım yapan güncellemede uygulanır. Adım yapılmayan karelerin
+        kuvvetleri süreleriyle ağırlıklandırılıp ortalamaya katılır.
+        """
+        if self.system is None:
+            if point:
+                self.body.apply_force_at_world_point(force, point)
+            else:
+                self.body.apply_force_at_local_point(force, (0, 0))
+            return
+            
         if point:
-            self.body.apply_force_at_world_point(force, point)
+            self.point_forces.append((force, point))
         else:
-            self.body.apply_force_at_local_point(force, (0, 0))
-            
-        # Kuvvet uygulandıktan sonra bir adım simülasyon yap
-        space = self.body.space
-        if space:
-            space.step(1/60.0)
+            self.force_sum[0] += force[0]
+            self.force_sum[1] += force[1]
+        self._enqueue()
         
     def apply_impulse(self, impulse: Tuple[float, float], point: Tuple[float, float] = None):
-        """Impuls uygular"""
-        if point:
-            self.body.apply_impulse_at_world_point(impulse, point)
+        """Impuls uygular
+        
+        Sisteme bağlı gövdelerde impuls bir sonraki adımdan hemen önce uygulanır.
+        """
+        if self.system is None:
+            if point:
+                self.body.apply_impulse_at_world_point(impulse, point)
+            else:
+                self.body.apply_impulse_at_local_point(impulse, (0, 0))
+            return
+            
+        self.impulses.append((impulse, point))
+        self._enqueue()
+        
+    def _enqueue(self):
+        """Gövdeyi sistemin bekleyen kuvvet listesine ekler"""
+        if not self.queued:
+            self.queued = True
+            self.system.pending_bodies.append(self)
+            
+    def accumulate(self, dt: float):
+        """Bu karenin kuvvetlerini kare süresiyle çarpıp biriktirir"""
+        fx, fy = self.force_sum
+        self.force_time[0] += fx * dt
+        self.force_time[1] += fy * dt
+        self.force_sum[0] = self.force_sum[1] = 0.0
+        for (fx, fy), point in self.point_forces:
+            self.point_force_time.append(((fx * dt, fy * dt), point))
+        self.point_forces.clear()
+        
+    def flush(self, include_impulses: bool, force_scale: float):
+        """Biriken kuvvetlerin zaman ortalamasını (ve istenirse impulsları) pymunk gövdesine uygular
+        
+        force_scale biriken süreye bölmek için 1 / süre olmalıdır.
+        """
+        body = self.body
+        fx, fy = self.force_time
+        if fx or fy:
+            body.apply_force_at_local_point((fx * force_scale, fy * force_scale), (0, 0))
+        for (fx, fy), point in self.point_force_time:
+            body.apply_force_at_world_point((fx * force_scale, fy * force_scale), point)
+        if include_impulses:
+            for impulse, point in self.impulses:
+                if point:
+                    body.apply_impulse_at_world_point(impulse, point)
+                else:
+                    body.apply_impulse_at_local_point(impulse, (0, 0))
+                    
+    def clear_pending(self):
+        """Biriken kuvvet ve impulsları siler"""
+        self.queued = False
+        self.force_sum[0] = self.force_sum[1] = 0.0
+        self.force_time[0] = self.force_time[1] = 0.0
+        self.point_forces.clear()
+        self.point_force_time.clear()
+        self.impulses.clear()
+
+class CollisionEventQueue:
+    """Çarpışma olaylarını adım sırasında kompakt dizilere kaydeder
+    
+    Geri çağrılar yalnızca kayıt yapar; oyun mantığı adımdan sonra olayları
+    toplu olarak işler. Kuyruk her PhysicsSystem.update başında temizlenir.
+    """
+    BEGIN = 0
+    POST_SOLVE = 1
+    SEPARATE = 2
+    
+    def __init__(self):
+        self.kinds = array('B')
+        self.types_a = array('Q')
+        self.types_b = array('Q')
+        self.points = array('d')    # Temas noktası (x, y) çiftleri
+        self.normals = array('d')   # Temas normali (x, y) çiftleri
+        self.impulses = array('d')  # Toplam impuls büyüklüğü (yalnızca post-solve)
+        self.shapes_a: List[pymunk.Shape] = []
+        self.shapes_b: List[pymunk.Shape] = []
+        
+    def __len__(self) -> int:
+        return len(self.kinds)
+        
+    def clear(self):
+        """Kayıtlı olayları siler"""
+        for values in (self.kinds, self.types_a, self.types_b, self.points, self.normals, self.impulses):
+            del values[:]
+        self.shapes_a.clear()
+        self.shapes_b.clear()
+        
+    def record(self, kind: int, arbiter: pymunk.Arbiter):
+        """Arbiter'dan bir olay kaydeder"""
+        shape_a, shape_b = arbiter.shapes
+        self.kinds.append(kind)
+        self.types_a.append(shape_a.collision_type)
+        self.types_b.append(shape_b.collision_type)
+        self.shapes_a.append(shape_a)
+        self.shapes_b.append(shape_b)
+        
+        if kind == self.SEPARATE:
+            self.points.extend((0.0, 0.0))
+            self.normals.extend((0.0, 0.0))
+            self.impulses.append(0.0)
+            return
+            
+        contacts = arbiter.contact_point_set
+        point = contacts.points[0].point_a if contacts.points else (0.0, 0.0)
+        self.points.extend(point)
+        self.normals.extend(contacts.normal)
+        self.impulses.append(arbiter.total_impulse.length if kind == self.POST_SOLVE else 0.0)
+        
+    def _on_begin(self, arbiter, space, data) -> bool:
+        self.record(self.BEGIN, arbiter)
+        return True
+        
+    def _on_post_solve(self, arbiter, space, data):
+        self.record(self.POST_SOLVE, arbiter)
+        
+    def _on_separate(self, arbiter, space, data):
+        self.record(self.SEPARATE, arbiter)
+        
+    def select(self, kind: Optional[int] = None, collision_type: Optional[int] = None) -> np.ndarray:
+        """Olay türü ve çarpışma tipine göre eşleşen olay indekslerini döndürür"""
+        mask = np.ones(len(self.kinds), dtype=bool)
+        if kind is not None:
+            mask &= np.frombuffer(self.kinds, dtype=np.uint8) == kind
+        if collision_type is not None:
+            mask &= ((np.frombuffer(self.types_a, dtype=np.uint64) == collision_type) |
+                     (np.frombuffer(self.types_b, dtype=np.uint64) == collision_type))
+        return np.flatnonzero(mask)
+        
+    def events(self, kind: Optional[int] = None,
+               collision_type: Optional[int] = None) -> Iterator[Tuple[int, pymunk.Shape, pymunk.Shape]]:
+        """Eşleşen olayları (tür, şekil a, şekil b) olarak döndürür"""
+        for index in self.select(kind, collision_type).tolist():
+            yield self.kinds[index], self.shapes_a[index], self.shapes_b[index]
+            
+    def as_arrays(self) -> Dict[str, np.ndarray]:
+        """Sayısal olay verilerini NumPy dizileri olarak döndürür (kopyalamaz)"""
+        return {
+            'kinds': np.frombuffer(self.kinds, dtype=np.uint8),
+            'types_a': np.frombuffer(self.types_a, dtype=np.uint64),
+            'types_b': np.frombuffer(self.types_b, dtype=np.uint64),
+            'points': np.frombuffer(self.points, dtype=np.float64).reshape(-1, 2),
+            'normals': np.frombuffer(self.normals, dtype=np.float64).reshape(-1, 2),
+            'impulses': np.frombuffer(self.impulses, dtype=np.float64),
+        }
+
+def _filter_rejects(a: pymunk.ShapeFilter, b: pymunk.ShapeFilter) -> bool:
+    """İki şekil filtresinin çarpışmayı engelleyip engellemediğini döndürür"""
+    return ((a.group != 0 and a.group == b.group) or
+            not (a.categories & b.mask) or not (b.categories & a.mask))
+
+def _body_state(body: pymunk.Body) -> Tuple[float, ...]:
+    """Gövdenin anlık görüntü satırını döndürür"""
+    (x, y), (vx, vy) = body.position, body.velocity
+    return x, y, vx, vy, body.angle, body.angular_velocity, float(body.is_sleeping)
+
+def _as_rows(values, width: int) -> np.ndarray:
+    """Girdiyi (N, width) boyutlu float64 diziye çevirir
+    
+    Demet listeleri np.asarray yerine fromiter ile düzleştirilir; bu yol
+    birkaç kat hızlıdır. Düz sayı listeleri ve diziler asarray'e düşer.
+    """
+    if not isinstance(values, np.ndarray):
+        try:
+            return np.fromiter(chain.from_iterable(values), dtype=np.float64).reshape(-1, width)
+        except TypeError:
+            pass
+    return np.ascontiguousarray(values, dtype=np.float64).reshape(-1, width)
+
+def _shape_address(shape: pymunk.Shape) -> int:
+    """Şeklin Chipmunk nesnesinin adresini döndürür"""
+    return int(pymunk.ffi.cast("uintptr_t", shape._shape))
+
+def _shape_rows(shapes: Iterable[pymunk.Shape]) -> Iterator[int]:
+    """Şekillerin gövde satırlarını döndürür (sisteme kayıtlı olmayanlar -1)"""
+    return map(getattr, shapes, repeat(_ROW_ATTR), repeat(-1))
+
+class PhysicsSnapshot:
+    """Fizik durumunun düz dizideki kopyası
+    
+    Her satır bir gövdedir: x, y, vx, vy, açı, açısal hız, uyku (0/1).
+    Temas önbelleği ve eklemler kaydedilmez.
+    """
+    FIELDS = 7
+    
+    def __init__(self):
+        self.names: List[str] = []
+        self.data = np.empty((0, self.FIELDS), dtype=np.float64)
+        self.accumulator = 0.0
+        
+    def __len__(self) -> int:
+        return len(self.names)
+
+class CollisionLayers:
+    """İsimli çarpışma katmanları ve katman matrisi
+    
+    Her katman bir ShapeFilter kategori biti alır; masks her katmanın
+    çarpıştığı katmanların bitlerini tutar. Yöntemler, filtresi değişen
+    katmanların isimlerini döndürür.
+    """
+    MAX_LAYERS = 32  # ShapeFilter kategorileri 32 bittir
+    
+    def __init__(self):
+        self.layers: Dict[str, int] = {}
+        self.masks: Dict[str, int] = {}
+        self.types: Dict[str, Optional[int]] = {}
+        
+    def copy(self) -> 'CollisionLayers':
+        """Bağımsız kopya döndürür"""
+        layers = CollisionLayers()
+        layers.layers.update(self.layers)
+        layers.masks.update(self.masks)
+        layers.types.update(self.types)
+        return layers
+        
+    def add(self, name: str, collision_type: Optional[int] = None) -> int:
+        """Katman tanımlar ve kategori bitini döndürür
+        
+        Yeni katman varsayılan olarak tüm katmanlarla çarpışır. collision_type
+        verilirse katmandaki şekillerin çarpışma tipi de ayarlanır.
+        """
+        if name in self.layers:
+            if collision_type is not None:
+                self.types[name] = collision_type
+            return self.layers[name]
+        if len(self.layers) >= self.MAX_LAYERS:
+            raise ValueError(f"En fazla {self.MAX_LAYERS} çarpışma katmanı tanımlanabilir")
+            
+        bit = 1 << len(self.layers)
+        self.layers[name] = bit
+        self.masks[name] = pymunk.ShapeFilter.ALL_MASKS()
+        self.types[name] = collision_type
+        return bit
+        
+    def set_collision(self, layer_a: str, layer_b: str, collide: bool = True) -> Tuple[str, ...]:
+        """İki katmanın birbiriyle çarpışıp çarpışmayacağını ayarlar"""
+        bit_a = self.add(layer_a)
+        bit_b = self.add(layer_b)
+        if collide:
+            self.masks[layer_a] |= bit_b
+            self.masks[layer_b] |= bit_a
         else:
-            self.body.apply_impulse_at_local_point(impulse, (0, 0))
+            self.masks[layer_a] &= ~bit_b
+            self.masks[layer_b] &= ~bit_a
+        return (layer_a, layer_b)
+        
+    def set_matrix(self, matrix: Dict[str, Iterable[str]]) -> Tuple[str, ...]:
+        """Katman matrisini ayarlar
+        
+        Her katman yalnızca listelenen katmanlarla çarpışır. Bir çift ancak iki
+        yönde de izin verilmişse çarpışır.
+        """
+        for layer, others in matrix.items():
+            self.add(layer)
+            mask = 0
+            for other in others:
+                mask |= self.add(other)
+            self.masks[layer] = mask
+        return tuple(matrix)
+        
+    def get_filter(self, layer: str) -> pymunk.ShapeFilter:
+        """Tanımlı katmanın şekil filtresini döndürür, bilinmeyen katmanda KeyError verir"""
+        return pymunk.ShapeFilter(categories=self.layers[layer], mask=self.masks[layer])
 
 class PhysicsSystem(GameSystem):
-    """Fizik sistemi"""
+    """Fizik sistemi
     
-    def __init__(self):
+    Simülasyon sabit zaman adımıyla ilerler; kare süresi bir biriktiricide
+    toplanır. Her sabit adımın alt adım sayısı en hızlı gövdenin bir alt
+    adımda alacağı yola göre seçilir ve kare başına adım bütçesiyle sınırlanır.
+    
+    Args:
+        fixed_dt: Sabit fizik adımı (saniye)
+        max_steps: Kare başına en fazla sabit adım; fazlası atılır
+        max_substeps: Sabit adım başına en fazla alt adım
+        step_budget: Kare başına en fazla space.step çağrısı
+        max_travel: Bir alt adımda izin verilen en fazla yol (piksel)
+        broadphase: "tree" (pymunk varsayılanı) veya "hash" (ayarlı uzamsal hash)
+        threads: Adım için iş parçacığı sayısı (pymunk en fazla 2 destekler)
+        thread_threshold: Bu sayıdan az gövde varken tek iş parçacığı kullanılır
+    """
+    
+    MAX_THREADS = 2
+    MAX_LAYERS = CollisionLayers.MAX_LAYERS
+    
+    # Uzamsal hash ayarı
+    HASH_SAMPLE_SIZE = 256     # Hücre boyutu için örneklenen şekil sayısı
+    HASH_CELLS_PER_SHAPE = 10  # Tablo boyutu / şekil sayısı
+    HASH_MIN_CELLS = 1000
+    HASH_RETUNE_RATIO = 2.0    # Şekil sayısı bu oranda değişirse yeniden ayarla
+    
+    def __init__(self, fixed_dt: float = 1 / 60.0, max_steps: int = 5, max_substeps: int = 8,
+                 step_budget: int = 20, max_travel: float = 5.0, broadphase: str = "tree",
+                 threads: int = 1, thread_threshold: int = 1000):
         super().__init__("PhysicsSystem")
-        self.space = pymunk.Space()
+        
+        # Çok iş parçacıklı adım yalnızca Linux/macOS'ta ve en fazla 2 iş parçacığıyla desteklenir
+        self.threads = max(1, min(threads, self.MAX_THREADS))
+        if sys.platform == "win32":
+            self.threads = 1
+        self.thread_threshold = thread_threshold
+        self.space = pymunk.Space(threaded=self.threads > 1)
         self.space.gravity = (0, 0)
         self.bodies: Dict[str, PhysicsBody] = {}
+        self.pending_bodies: List[PhysicsBody] = []
+        self.force_time = 0.0  # Bekleyen kuvvetlerin kapsadığı kare süresi
+        
+        # Toplu okuma için gövdeler sıralı listede tutulur (satır i -> body_names[i])
+        self.body_names: List[str] = []
+        self._body_list: List[pymunk.Body] = []
+        self._body_index: Dict[str, int] = {}
+        self._names_by_body: Dict[pymunk.Body, str] = {}
+        self._buffers: Dict[str, np.ndarray] = {}
+        self.shape_count = 0
+        
+        # Geniş faz (broadphase) durumu
+        self.broadphase = "tree"
+        self.hash_params: Optional[Tuple[float, int]] = None  # (hücre boyutu, hücre sayısı)
+        self.hash_tunes = 0
+        self._tuned_shape_count = 0
+        
+        # İsteğe bağlı toplu çarpışma olayları
+        self.collision_events: Optional[CollisionEventQueue] = None
+        
+        # İsimli çarpışma katmanları: katman -> kategori biti, çarpıştığı katmanların maskesi
+        self.collision_layers = CollisionLayers()
+        self.layers = self.collision_layers.layers
+        self.layer_masks = self.collision_layers.masks
+        self.layer_types = self.collision_layers.types
+        self.candidate_pairs = 0  # Son count_filtered_pairs sonucu
+        self.filtered_pairs = 0
+        
+        # Toplu sorguların kare içi önbelleği (None ise kapalı)
+        self.query_cache: Optional[Dict[tuple, object]] = None
+        self._shape_table: Optional[Tuple[np.ndarray, np.ndarray]] = None  # (sıralı şekil adresleri, satırlar)
+        self.query_cache_hits = 0
+        if broadphase != "tree":
+            self.set_broadphase(broadphase)
+            
+        self.fixed_dt = fixed_dt
+        self.max_steps = max_steps
+        self.max_substeps = max_substeps
+        self.step_budget = step_budget
+        self.max_travel = max_travel
+        self.accumulator = 0.0
+        
+        # Son güncellemenin istatistikleri
+        self.steps_taken = 0   # Yapılan space.step çağrısı
+        self.substeps = 1      # Sabit adım başına alt adım
+        self.dropped_time = 0.0
         
     def create_body(self, name: str, body_type: str = "dynamic", mass: float = 1.0, 
-                   moment: float = 100) -> PhysicsBody:
+                   moment: float = 100, default_shape: bool = True,
+                   layer: Optional[str] = None) -> PhysicsBody:
         """Yeni fizik gövdesi oluşturur"""
         body = PhysicsBody(body_type, mass, moment)
-        self.space.add(body.body)
-        self.bodies[name] = body
+        body.layer = layer
         
         # Şekil ekle (varsayılan olarak küçük bir kutu)
-        body.add_box_shape(10, 10)
-        for shape in body.shapes:
-            self.space.add(shape)
-            
+        if default_shape:
+            body.add_box_shape(10, 10)
+        return self.add_body(name, body)
+        
+    def add_body(self, name: str, body: PhysicsBody) -> PhysicsBody:
+        """Var olan gövdeyi şekilleriyle birlikte sisteme ekler
+        
+        Başka bir sistemden remove_body ile çıkarılmış gövdeler de eklenebilir.
+        """
+        self._register(name, body)
+        self.space.add(body.body, *body.shapes)
         return body
         
+    def create_bodies(self, names: List[str], positions, body_type: str = "dynamic",
+                      mass: float = 1.0, moment: float = 100,
+                      size: Optional[Tuple[float, float]] = (10, 10),
+                      layer: Optional[str] = None) -> List[PhysicsBody]:
+        """Dizilerden çok sayıda gövdeyi tek seferde oluşturur
+        
+        Args:
+            names: Gövde isimleri
+            positions: (N, 2) boyutlu konum dizisi
+            size: Her gövdeye eklenecek kutunun boyutu (None ise şekil eklenmez)
+            layer: Gövdelerin çarpışma katmanı
+            
+        Var olan isimler yeniden oluşturulur; aynı isim listede iki kez geçemez.
+        """
+        if len(set(names)) != len(names):
+            raise ValueError("create_bodies: isim listesinde tekrarlanan isimler var")
+        positions = np.asarray(positions, dtype=np.float64)
+        if positions.shape != (len(names), 2):
+            raise ValueError(f"create_bodies: konumlar ({len(names)}, 2) boyutlu olmalı, "
+                             f"{positions.shape} verildi")
+            
+        created = []
+        objects = []
+        for name, (x, y) in zip(names, positions.tolist()):
+            body = PhysicsBody(body_type, mass, moment)
+            body.layer = layer
+            body.body.position = (x, y)
+            if size is not None:
+                body.add_box_shape(*size)
+            self._register(name, body)
+            objects.append(body.body)
+            objects.extend(body.shapes)
+            created.append(body)
+            
+        # Tüm gövde ve şekiller tek çağrıda eklenir
+        self.space.add(*objects)
+        return created
+        
+    def _register(self, name: str, body: PhysicsBody):
+        """Gövdeyi isim sözlüğüne ve sıralı listeye ekler"""
+        if name in self.bodies:
+            self.remove_body(name)
+        body.system = self
+        self.clear_query_cache()
+        if body.layer is not None:
+            self._apply_layer(body)
+        self.bodies[name] = body
+        body.set_row(len(self.body_names))
+        self._body_index[name] = len(self.body_names)
+        self.body_names.append(name)
+        self._body_list.append(body.body)
+        self._names_by_body[body.body] = name
+        self.shape_count += len(body.shapes)
+        
     def remove_body(self, name: str):
         """Fizik gövdesini kaldırır"""
         if name in self.bodies:
             body = self.bodies[name]
             for shape in body.shapes:
-                self.space.remove(shape)
+                if shape.space is not None:
+                    self.space.remove(shape)
+                    self.shape_count -= 1
             self.space.remove(body.body)
+            if body.queued:
+                self.pending_bodies.remove(body)
+            body.clear_pending()
+            body.set_row(-1)
+            body.system = None
             del self.bodies[name]
             
+            self._names_by_body.pop(body.body, None)
+            self.clear_query_cache()
+            
+            # Son gövdeyi boşalan satıra taşı
+            index = self._body_index.pop(name)
+            last_name = self.body_names.pop()
+            last_body = self._body_list.pop()
+            if last_name != name:
+                self.bodies[last_name].set_row(index)
+                self.body_names[index] = last_name
+                self._body_list[index] = last_body
+                self._body_index[last_name] = index
+                
+    def _buffer(self, key: str, shape: Tuple[int, ...], out: Optional[np.ndarray]) -> np.ndarray:
+        """Verilen veya önceden ayrılmış diziyi döndürür"""
+        if out is not None:
+            return out
+        buffer = self._buffers.get(key)
+        if buffer is None or buffer.shape[0] < shape[0]:
+            # Büyürken yeniden ayırmayı azaltmak için iki katına çıkar
+            capacity = max(shape[0], 2 * (buffer.shape[0] if buffer is not None else 0), 16)
+            buffer = self._buffers[key] = np.empty((capacity,) + shape[1:], dtype=np.float64)
+        return buffer[:shape[0]]
+        
+    def get_positions(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Tüm gövdelerin konumlarını (N, 2) dizisi olarak döndürür
+        
+        Satırlar body_names sırasındadır. out verilmezse sistemin önceden
+        ayrılmış dizisi kullanılır ve bir sonraki çağrıda üzerine yazılır.
+        """
+        count = len(self._body_list)
+        result = self._buffer('positions', (count, 2), out)
+        result[:] = np.fromiter(chain.from_iterable(b.position for b in self._body_list),
+                                dtype=np.float64, count=count * 2).reshape(count, 2)
+        return result
+        
+    def get_velocities(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Tüm gövdelerin hızlarını (N, 2) dizisi olarak döndürür"""
+        count = len(self._body_list)
+        result = self._buffer('velocities', (count, 2), out)
+        result[:] = np.fromiter(chain.from_iterable(b.velocity for b in self._body_list),
+                                dtype=np.float64, count=count * 2).reshape(count, 2)
+        return result
+        
+    def get_angles(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Tüm gövdelerin açılarını (N,) dizisi olarak döndürür"""
+        count = len(self._body_list)
+        result = self._buffer('angles', (count,), out)
+        result[:] = np.fromiter((b.angle for b in self._body_list), dtype=np.float64, count=count)
+        return result
+        
+    def snapshot(self) -> PhysicsSnapshot:
+        """Tüm gövdelerin durumunu düz diziye kaydeder"""
+        snapshot = PhysicsSnapshot()
+        count = len(self._body_list)
+        snapshot.data = np.fromiter(chain.from_iterable(map(_body_state, self._body_list)),
+                                    dtype=np.float64,
+                                    count=count * PhysicsSnapshot.FIELDS).reshape(count, -1)
+        snapshot.names = list(self.body_names)
+        snapshot.accumulator = self.accumulator
+        return snapshot
+        
+    def restore(self, snapshot: PhysicsSnapshot):
+        """Anlık görüntüdeki durumu gövdelere geri yükler
+        
+        Gövde sırası değiştiyse isimle eşleştirilir; görüntüde olmayan gövdelere
+        dokunulmaz. Bekleyen kuvvetler ve impulslar silinir.
+        """
+        if snapshot.names == self.body_names:
+            bodies = self._body_list
+        else:
+            bodies = [self.bodies[name].body if name in self.bodies else None
+                      for name in snapshot.names]
+                      
+        can_sleep = self.space.sleep_time_threshold != float('inf')
+        static = pymunk.Body.STATIC
+        for body, (x, y, vx, vy, angle, spin, sleeping) in zip(bodies, snapshot.data.tolist()):
+            if body is None or body.body_type == static:
+                continue
+            # Konum veya hız atamak gövdeyi uyandırır, uyku en son uygulanır
+            body.position = x, y
+            body.velocity = vx, vy
+            body.angle = angle
+            body.angular_velocity = spin
+            if sleeping and can_sleep and body.space is not None:
+                body.sleep()
+                
+        for body in self.pending_bodies:
+            body.clear_pending()
+        self.pending_bodies.clear()
+        self.force_time = 0.0
+        self.accumulator = snapshot.accumulator
+        self.clear_query_cache()
+        
     def get_body(self, name: str) -> Optional[PhysicsBody]:
         """İsme göre fizik gövdesi döndürür"""
         return self.bodies.get(name)
         
     def update(self, dt: float):
         """Fizik sistemini günceller"""
-        # Daha hassas simülasyon için küçük adımlarla güncelle
-        steps = 10
-        step_dt = dt / steps
-        for _ in range(steps):
+        self.accumulate_forces(dt)
+        self.advance(dt)
+        
+    def accumulate_forces(self, dt: float):
+        """Bu karede uygulanan kuvvetleri kare süresiyle ağırlıklandırır
+        
+        Adımlarda kuvvetlerin son adımdan bu yana geçen süredeki ortalaması
+        uygulanır, böylece sonuç kare hızından bağımsızdır. update bunu
+        kendisi çağırır; advance'i doğrudan kullananlar (bkz.
+        RegionalPhysicsSystem) her kare çağırmalıdır.
+        """
+        for body in self.pending_bodies:
+            body.accumulate(dt)
+        self.force_time += dt
+        
+    def advance(self, dt: float):
+        """Biriktiriciye dt ekler ve gereken sabit adımları atar"""
+        if self.broadphase == "hash" and self._needs_retune():
+            self.tune_broadphase()
+        if self.collision_events is not None:
+            self.collision_events.clear()
+        if self.query_cache:
+            self.query_cache.clear()
+            
+        self.accumulator += dt
+        steps = int(self.accumulator / self.fixed_dt + 1e-9)
+        
+        # Çok geride kalındıysa veya adım bütçesi aşılıyorsa fazla zamanı at
+        self.dropped_time = 0.0
+        limit = max(1, min(self.max_steps, self.step_budget))
+        if steps > limit:
+            self.dropped_time = (steps - limit) * self.fixed_dt
+            steps = limit
+        self.accumulator = max(0.0, self.accumulator - (steps * self.fixed_dt + self.dropped_time))
+        
+        self.steps_taken = 0
+        if steps == 0:
+            return
+            
+        if self.threads > 1:
+            self._update_thread_count()
+            
+        # Alt adım sayısı bütçeyi aşmamalı
+        substeps = self.compute_substeps()
+        substeps = max(1, min(substeps, self.step_budget // steps))
+        self.substeps = substeps
+        step_dt = self.fixed_dt / substeps
+        pending = self.pending_bodies
+        force_scale = 1.0 / self.force_time if self.force_time > 0 else 0.0
+        for index in range(steps * substeps):
+            # pymunk her adımdan sonra kuvvetleri sıfırlar, bu yüzden her adımda yeniden uygula
+            for body in pending:
+                body.flush(index == 0, force_scale)
             self.space.step(step_dt)
+        self.steps_taken = steps * substeps
+        
+        for body in pending:
+            body.clear_pending()
+        pending.clear()
+        self.force_time = 0.0
+        
+    def _update_thread_count(self):
+        """Küçük sahnelerde iş parçacığı yükünden kaçınmak için sayıyı ayarlar"""
+        threads = self.threads if len(self._body_list) >= self.thread_threshold else 1
+        if self.space.threads != threads:
+            self.space.threads = threads
+            
+    @property
+    def active_threads(self) -> int:
+        """Son adımda kullanılan iş parçacığı sayısı"""
+        return self.space.threads if self.threads > 1 else 1
+        
+    def compute_substeps(self) -> int:
+        """En hızlı dinamik gövdeye göre sabit adım başına alt adım sayısını hesaplar"""
+        max_speed_sq = 0.0
+        for body in self.space.bodies:
+            if body.body_type == pymunk.Body.DYNAMIC:
+                speed_sq = body.velocity.get_length_sqrd()
+                if speed_sq > max_speed_sq:
+                    max_speed_sq = speed_sq
+                    
+        travel = math.sqrt(max_speed_sq) * self.fixed_dt
+        return max(1, min(self.max_substeps, math.ceil(travel / self.max_travel)))
+        
+    @property
+    def alpha(self) -> float:
+        """Çizimde iki fizik adımı arasında interpolasyon için oran"""
+        return self.accumulator / self.fixed_dt
+        
+    def set_broadphase(self, mode: str):
+        """Geniş faz yöntemini ayarlar
+        
+        "hash" seçildiğinde uzamsal hash parametreleri şekillerden hesaplanır
+        ve gövde sayısı çok değiştiğinde yeniden ayarlanır. pymunk ağaç
+        yapısına geri dönmeye izin vermez.
+        """
+        if mode not in ("tree", "hash"):
+            raise ValueError(f"Unknown broadphase: {mode}")
+        if mode == "tree" and self.broadphase == "hash":
+            raise ValueError("pymunk cannot switch back from spatial hash to tree")
+        self.broadphase = mode
+        if mode == "hash":
+            self.tune_broadphase()
+            
+    def _needs_retune(self) -> bool:
+        """Şekil sayısı son ayardan bu yana belirgin değişti mi"""
+        tuned = max(self._tuned_shape_count, 1)
+        count = max(self.shape_count, 1)
+        return count > tuned * self.HASH_RETUNE_RATIO or count * self.HASH_RETUNE_RATIO < tuned
+        
+    def compute_hash_params(self) -> Tuple[float, int]:
+        """Örneklenen şekil boyutlarından (hücre boyutu, hücre sayısı) hesaplar
+        
+        Hücre boyutu örneklerin medyan sınır kutusu boyutudur; hücre sayısı
+        şekil sayısının HASH_CELLS_PER_SHAPE katıdır.
+        """
+        shapes = self.space.shapes
+        step = max(1, len(shapes) // self.HASH_SAMPLE_SIZE)
+        sizes = []
+        for shape in shapes[::step]:
+            bb = shape.cache_bb()
+            sizes.append(max(bb.right - bb.left, bb.top - bb.bottom))
+            
+        dim = float(np.median(sizes)) if sizes else 10.0
+        count = max(self.HASH_MIN_CELLS, len(shapes) * self.HASH_CELLS_PER_SHAPE)
+        return max(dim, 1.0), count
+        
+    def tune_broadphase(self) -> Tuple[float, int]:
+        """Uzamsal hash parametrelerini hesaplar ve uygular"""
+        dim, count = self.compute_hash_params()
+        self.space.use_spatial_hash(dim, count)
+        self.hash_params = (dim, count)
+        self.hash_tunes += 1
+        self._tuned_shape_count = self.shape_count
+        return dim, count
+        
+    def apply_forces(self, names: Iterable[str], vectors: Iterable[Tuple[float, float]]):
+        """Birden fazla gövdeye merkezlerinden kuvvet uygular (kuyruğa alınır)"""
+        bodies = self.bodies
+        for name, vector in zip(names, vectors):
+            body = bodies.get(name)
+            if body is not None:
+                body.apply_force(vector)
+                
+    def apply_impulses(self, names: Iterable[str], vectors: Iterable[Tuple[float, float]]):
+        """Birden fazla gövdeye merkezlerinden impuls uygular (kuyruğa alınır)"""
+        bodies = self.bodies
+        for name, vector in zip(names, vectors):
+            body = bodies.get(name)
+            if body is not None:
+                body.apply_impulse(vector)
+                
+    def add_layer(self, name: str, collision_type: Optional[int] = None) -> int:
+        """Çarpışma katmanı tanımlar ve kategori bitini döndürür (bkz. CollisionLayers.add)"""
+        known = name in self.layers
+        bit = self.collision_layers.add(name, collision_type)
+        if known and collision_type is not None:
+            self._refresh_layers((name,))
+        return bit
+        
+    def set_layer_collision(self, layer_a: str, layer_b: str, collide: bool = True):
+        """İki katmanın birbiriyle çarpışıp çarpışmayacağını ayarlar"""
+        self._refresh_layers(self.collision_layers.set_collision(layer_a, layer_b, collide))
+        
+    def set_layer_matrix(self, matrix: Dict[str, Iterable[str]]):
+        """Katman matrisini ayarlar (bkz. CollisionLayers.set_matrix)"""
+        self._refresh_layers(self.collision_layers.set_matrix(matrix))
+        
+    def set_collision_layers(self, layers: 'CollisionLayers'):
+        """Katman durumunu verilen tablonun kopyasıyla değiştirir ve tüm gövdelere uygular"""
+        self.collision_layers = layers.copy()
+        self.layers = self.collision_layers.layers
+        self.layer_masks = self.collision_layers.masks
+        self.layer_types = self.collision_layers.types
+        self._refresh_layers(tuple(self.layers))
+        
+    def layers_collide(self, layer_a: str, layer_b: str) -> bool:
+        """İki katmanın çarpışıp çarpışmadığını döndürür (bilinmeyen katmanda KeyError)"""
+        return not _filter_rejects(self.get_layer_filter(layer_a), self.get_layer_filter(layer_b))
         
+    def get_layer_filter(self, layer: str) -> pymunk.ShapeFilter:
+        """Tanımlı katmanın şekil filtresini döndürür
+        
+        Katman tanımlamaz; bilinmeyen katman adı KeyError verir.
+        """
+        return self.collision_layers.get_filter(layer)
+        
+    def set_body_layer(self, name: str, layer: str):
+        """Gövdenin çarpışma katmanını değiştirir"""
+        body = self.bodies[name]
+        body.layer = layer
+        self._apply_layer(body)
+        self.clear_query_cache()
+        
+    def _apply_layer(self, body: PhysicsBody):
+        """Gövdenin katmanına ait filtreyi şekillerine uygular, katman yoksa tanımlar"""
+        self.add_layer(body.layer)
+        body.set_shape_filter(self.get_layer_filter(body.layer), self.layer_types[body.layer])
+        
+    def _refresh_layers(self, layers: Tuple[str, ...]):
+        """Verilen katmanlardaki gövdelerin filtrelerini günceller"""
+        self.clear_query_cache()
+        for body in self.bodies.values():
+            if body.layer in layers:
+                self._apply_layer(body)
+                
+    def count_filtered_pairs(self) -> Tuple[int, int]:
+        """Sınırlayıcı kutuları örtüşen şekil çiftlerini ve filtrelerin elediklerini sayar
+        
+        Chipmunk filtre elemesini dar fazdan önce C içinde yapar ve geri çağrı
+        tetiklemez; bu yüzden sayım son adımın sınırlayıcı kutularıyla ayrı bir
+        sorgu geçişinde yapılır. Maliyetlidir, tanılama için kullanılmalıdır.
+        
+        Returns:
+            (aday çift sayısı, filtrelerin elediği çift sayısı)
+        """
+        candidates = filtered = 0
+        everything = pymunk.ShapeFilter()
+        dynamic = pymunk.Body.DYNAMIC
+        for shape in self.space.shapes:
+            if shape.body.body_type != dynamic:
+                continue
+            for other in self.space.bb_query(shape.bb, everything):
+                if other.body is shape.body:
+                    continue
+                # Dinamik-dinamik çiftler bir kez sayılır
+                if other.body.body_type == dynamic and id(other) < id(shape):
+                    continue
+                candidates += 1
+                if _filter_rejects(shape.filter, other.filter):
+                    filtered += 1
+        self.candidate_pairs = candidates
+        self.filtered_pairs = filtered
+        return candidates, filtered
+        
+    def enable_query_cache(self, enabled: bool = True):
+        """Aynı karede tekrarlanan özdeş sorguların sonuçlarını önbelleğe alır
+        
+        Önbellek her update başında ve gövde satırlarını veya filtrelerini
+        değiştiren işlemlerde (ekleme, kaldırma, restore, katman değişimi)
+        temizlenir. Gövdeler update dışında taşınırsa clear_query_cache
+        çağrılmalıdır. Önbellekten dönen diziler paylaşılır, değiştirilmemelidir.
+        """
+        self.query_cache = {} if enabled else None
+        
+    def clear_query_cache(self):
+        """Sorgu önbelleğini ve şekil adresi -> satır tablosunu temizler"""
+        self._shape_table = None
+        if self.query_cache:
+            self.query_cache.clear()
+            
+    def _query_filter(self, shape_filter: Union[str, pymunk.ShapeFilter, None]) -> pymunk.ShapeFilter:
+        """Katman adını veya filtreyi sorgu filtresine çevirir (None: her şey)
+        
+        Sorgular katman tanımlamaz; bilinmeyen katman adı KeyError verir.
+        """
+        if shape_filter is None:
+            return pymunk.ShapeFilter()
+        if isinstance(shape_filter, str):
+            return self.get_layer_filter(shape_filter)
+        return shape_filter
+        
+    def _rows_at(self, addresses: np.ndarray) -> np.ndarray:
+        """Chipmunk şekil adreslerini gövde satırlarına çevirir (boş veya kayıtsız şekil: -1)
+        
+        Tablo gövdeler değişene kadar saklanır; arama searchsorted ile toplu yapılır.
+        """
+        if self._shape_table is None:
+            pairs = sorted((_shape_address(shape), body.row)
+                           for body in self.bodies.values() for shape in body.shapes)
+            self._shape_table = (np.array([pair[0] for pair in pairs], dtype=np.uintp),
+                                 np.array([pair[1] for pair in pairs], dtype=np.int64))
+        table, rows = self._shape_table
+        if not len(table):
+            return np.full(len(addresses), -1, dtype=np.int64)
+        index = np.minimum(np.searchsorted(table, addresses), len(table) - 1)
+        return np.where(table[index] == addresses, rows[index], -1)
+        
+    def _cached(self, key: tuple, compute):
+        """Sonucu önbellekten döndürür veya hesaplayıp saklar (önbellek açık olmalı)"""
+        cache = self.query_cache
+        result = cache.get(key)
+        if result is None:
+            result = cache[key] = compute()
+        else:
+            self.query_cache_hits += 1
+        return result
+        
+    def raycast(self, starts, ends, shape_filter: Union[str, pymunk.ShapeFilter, None] = None,
+                radius: float = 0.0) -> Dict[str, np.ndarray]:
+        """Çok sayıda ışını tek çağrıda atar, her ışının ilk isabetini döndürür
+        
+        Args:
+            starts: (N, 2) başlangıç noktaları
+            ends: (N, 2) bitiş noktaları
+            shape_filter: Katman adı veya ShapeFilter; katmanın çarpıştığı şekiller isabet alır
+            radius: Işın kalınlığı (süpürme sorguları için)
+            
+        Returns:
+            'hit' (N,) bool, 'points' ve 'normals' (N, 2), 'alpha' (N,) ışın
+            boyunca isabet oranı, 'rows' (N,) isabet alan gövdenin satırı (-1: yok)
+        """
+        starts = _as_rows(starts, 2)
+        ends = _as_rows(ends, 2)
+        query_filter = self._query_filter(shape_filter)
+        if self.query_cache is None:
+            return self._raycast(starts, ends, query_filter, radius)
+        key = ('ray', starts.tobytes(), ends.tobytes(), query_filter, radius)
+        return self._cached(key, lambda: self._raycast(starts, ends, query_filter, radius))
+        
+    def _raycast(self, starts: np.ndarray, ends: np.ndarray, query_filter: pymunk.ShapeFilter,
+                 radius: float) -> Dict[str, np.ndarray]:
+        """Işınları Chipmunk'a tek tek sorar, sonuçları önceden ayrılmış diziye yazdırır"""
+        count = len(starts)
+        infos = pymunk.ffi.new("cpSegmentQueryInfo[]", count)
+        query_filter = pymunk.ffi.new("cpShapeFilter *", query_filter)[0]
+        # Her sorgunun sonucu infos dizisindeki kendi elemanına yazılır
+        for _ in map(pymunk.cp.cpSpaceSegmentQueryFirst, repeat(self.space._space),
+                     starts.tolist(), ends.tolist(), repeat(radius), repeat(query_filter),
+                     map(infos.__add__, range(count))):
+            pass
+            
+        data = np.frombuffer(pymunk.ffi.buffer(infos), dtype=_SEGMENT_INFO)
+        hit = data['shape'] != 0
+        column = hit[:, None]
+        return {'hit': hit,
+                'points': np.where(column, data['point'], ends),
+                'normals': np.where(column, data['normal'], 0.0),
+                'alpha': np.where(hit, data['alpha'], 1.0),
+                'rows': self._rows_at(data['shape'])}
+        
+    def point_query(self, points, max_distance: float = 0.0,
+                    shape_filter: Union[str, pymunk.ShapeFilter, None] = None) -> Dict[str, np.ndarray]:
+        """Her noktaya max_distance içindeki en yakın şekli bulur
+        
+        Returns:
+            'hit' (N,) bool, 'points' (N, 2) şekil üzerindeki en yakın nokta,
+            'distances' (N,) (şeklin içindeyse negatif), 'rows' (N,) gövde satırı
+        """
+        points = _as_rows(points, 2)
+        query_filter = self._query_filter(shape_filter)
+        if self.query_cache is None:
+            return self._point_query(points, max_distance, query_filter)
+        key = ('point', points.tobytes(), query_filter, max_distance)
+        return self._cached(key, lambda: self._point_query(points, max_distance, query_filter))
+        
+    def _point_query(self, points: np.ndarray, max_distance: float,
+                     query_filter: pymunk.ShapeFilter) -> Dict[str, np.ndarray]:
+        """Noktaları Chipmunk'a tek tek sorar, sonuçları önceden ayrılmış diziye yazdırır"""
+        count = len(points)
+        infos = pymunk.ffi.new("cpPointQueryInfo[]", count)
+        query_filter = pymunk.ffi.new("cpShapeFilter *", query_filter)[0]
+        # Her sorgunun sonucu infos dizisindeki kendi elemanına yazılır
+        for _ in map(pymunk.cp.cpSpacePointQueryNearest, repeat(self.space._space),
+                     points.tolist(), repeat(max_distance), repeat(query_filter),
+                     map(infos.__add__, range(count))):
+            pass
+            
+        data = np.frombuffer(pymunk.ffi.buffer(infos), dtype=_POINT_INFO)
+        hit = data['shape'] != 0
+        return {'hit': hit,
+                'points': np.where(hit[:, None], data['point'], points),
+                'distances': np.where(hit, data['distance'], np.inf),
+                'rows': self._rows_at(data['shape'])}
+        
+    def bb_query(self, boxes, shape_filter: Union[str, pymunk.ShapeFilter, None] = None) -> Dict[str, np.ndarray]:
+        """Her kutuyla örtüşen gövdeleri bulur
+        
+        Args:
+            boxes: (N, 4) left, bottom, right, top dizisi
+            
+        Returns:
+            'offsets' (N + 1,) ve 'rows': kutu i'nin gövde satırları
+            rows[offsets[i]:offsets[i + 1]] aralığındadır. Bir gövdenin birden
+            fazla şekli örtüşse de gövde bir kez yazılır.
+        """
+        boxes = _as_rows(boxes, 4)
+        query_filter = self._query_filter(shape_filter)
+        if self.query_cache is None:
+            return self._bb_query(boxes, query_filter)
+        key = ('bb', boxes.tobytes(), query_filter)
+        return self._cached(key, lambda: self._bb_query(boxes, query_filter))
+        
+    def _bb_query(self, boxes: np.ndarray, query_filter: pymunk.ShapeFilter) -> Dict[str, np.ndarray]:
+        """Kutuları tek tek sorgular"""
+        offsets = array('q', [0])
+        rows = array('q')
+        query = self.space.bb_query
+        for box in boxes.tolist():
+            found = set(_shape_rows(query(pymunk.BB(*box), query_filter)))
+            found.discard(-1)
+            rows.extend(sorted(found))
+            offsets.append(len(rows))
+        return {'offsets': np.frombuffer(offsets, dtype=np.int64),
+                'rows': np.frombuffer(rows, dtype=np.int64)}
+                
     def add_collision_handler(self, type_a: int, type_b: int):
         """Çarpışma yöneticisi ekler"""
         return self.space.add_collision_handler(type_a, type_b)
         
+    def enable_collision_events(self, type_a: Optional[int] = None, type_b: Optional[int] = None,
+                                begin: bool = True, post_solve: bool = False,
+                                separate: bool = True) -> CollisionEventQueue:
+        """Çarpışma olaylarını geri çağrı yerine kuyruğa kaydeder
+        
+        type_a ve type_b verilmezse tüm çarpışmalar, yalnızca type_a verilirse
+        bu tipin tüm çarpışmaları kaydedilir. Aynı tip çifti için önceden
+        ayarlanmış pymunk geri çağrılarının yerini alır.
+        """
+        if self.collision_events is None:
+            self.collision_events = CollisionEventQueue()
+        queue = self.collision_events
+        
+        if type_a is None:
+            handler = self.space.add_default_collision_handler()
+        elif type_b is None:
+            handler = self.space.add_wildcard_collision_handler(type_a)
+        else:
+            handler = self.space.add_collision_handler(type_a, type_b)
+            
+        if begin:
+            handler.begin = queue._on_begin
+        if post_solve:
+            handler.post_solve = queue._on_post_solve
+        if separate:
+            handler.separate = queue._on_separate
+        return queue
+        
+    def get_body_name(self, body: pymunk.Body) -> Optional[str]:
+        """pymunk gövdesinin sistemdeki adını döndürür"""
+        return self._names_by_body.get(body)
+        
     def set_gravity(self, x: float, y: float):
         """Yerçekimini ayarlar"""
         self.space.gravity = (x, y)
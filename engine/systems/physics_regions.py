@@ -0,0 +1,237 @@
+"""
+Bölgesel fizik sistemi.
+Dünyayı ızgara bölgelerine ayırır; her bölge kendi PhysicsSystem'i ile adımlanır.
+Odaktan uzak bölgeler seyrek ve kaba adımlarla güncellenir, çok uzaktakiler uyutulur.
+"""
+
+import math
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from ..core.base import GameSystem
+from .physics import CollisionLayers, PhysicsBody, PhysicsSystem
+
+RegionKey = Tuple[int, int]
+
+class PhysicsRegion:
+    """Izgaradaki tek bir fizik bölgesi"""
+    __slots__ = ('key', 'bounds', 'physics', 'phase', 'pending', 'interval', 'sleeping')
+    
+    def __init__(self, key: RegionKey, size: float, physics: PhysicsSystem, phase: int):
+        self.key = key
+        self.bounds = (key[0] * size, key[1] * size, (key[0] + 1) * size, (key[1] + 1) * size)
+        self.physics = physics
+        self.phase = phase     # Seyrek güncellemeleri karelere dağıtmak için
+        self.pending = 0.0     # Henüz adımlanmamış süre
+        self.interval = 1
+        self.sleeping = False
+    
+    def distance_to(self, x: float, y: float) -> float:
+        """Noktanın bölge dikdörtgenine uzaklığı (içindeyse 0)"""
+        left, top, right, bottom = self.bounds
+        dx = max(left - x, 0.0, x - right)
+        dy = max(top - y, 0.0, y - bottom)
+        return math.hypot(dx, dy)
+
+class RegionalPhysicsSystem(GameSystem):
+    """Izgara bölgelerine ayrılmış fizik sistemi
+    
+    Her bölgenin ayrı pymunk uzayı vardır; farklı bölgelerdeki gövdeler
+    birbiriyle çarpışmaz ve aralarında eklem kurulamaz. Bölge sınırını
+    handoff_margin kadar aşan gövdeler yeni bölgeye taşınır.
+    
+    Args:
+        region_size: Kare bölgenin kenar uzunluğu (piksel)
+        lod_levels: (mesafe, aralık) çiftleri; odağa bu mesafeden uzak
+            bölgeler her 'aralık' karede bir, aralık kat büyük sabit adımla
+            güncellenir
+        sleep_distance: Bu mesafeden uzak bölgeler hiç adımlanmaz, süreleri atılır
+        handoff_margin: Bölge değişimi için sınırın aşılması gereken mesafe
+        **physics_options: Bölgelerin PhysicsSystem'lerine geçirilen ayarlar
+    """
+    def __init__(self, region_size: float = 1024.0,
+                 lod_levels: Optional[List[Tuple[float, int]]] = None,
+                 sleep_distance: float = 4096.0, handoff_margin: float = 16.0,
+                 **physics_options):
+        super().__init__("RegionalPhysicsSystem")
+        self.region_size = region_size
+        self.lod_levels = sorted(lod_levels or [(1024.0, 2), (2048.0, 4)])
+        self.sleep_distance = sleep_distance
+        self.handoff_margin = handoff_margin
+        self.physics_options = physics_options
+        self.fixed_dt = physics_options.get('fixed_dt', 1 / 60.0)
+        self.gravity = (0.0, 0.0)
+        self.focus: Optional[Tuple[float, float]] = None
+        self.regions: Dict[RegionKey, PhysicsRegion] = {}
+        self.body_regions: Dict[str, RegionKey] = {}
+        self.frame = 0
+        
+        # Tüm bölgeler aynı katman tablosunun kopyasını kullanır, böylece kategori bitleri eşleşir
+        self.collision_layers = CollisionLayers()
+        self.layers = self.collision_layers.layers
+        
+        # Son karenin istatistikleri
+        self.stepped = 0    # Adımlanan bölge sayısı
+        self.deferred = 0   # Sırası gelmediği için bekleyen bölge sayısı
+        self.sleeping = 0   # Uyuyan bölge sayısı
+        self.handoffs = 0   # Bölge değiştiren gövde sayısı
+        self.steps_taken = 0
+    
+    def region_key(self, x: float, y: float) -> RegionKey:
+        """Noktanın bulunduğu bölgenin anahtarını döndürür"""
+        return (math.floor(x / self.region_size), math.floor(y / self.region_size))
+    
+    def get_region(self, key: RegionKey) -> PhysicsRegion:
+        """Bölgeyi döndürür, yoksa oluşturur"""
+        region = self.regions.get(key)
+        if region is None:
+            physics = PhysicsSystem(**self.physics_options)
+            physics.set_gravity(*self.gravity)
+            physics.set_collision_layers(self.collision_layers)
+            region = PhysicsRegion(key, self.region_size, physics, len(self.regions))
+            self.regions[key] = region
+        return region
+    
+    def create_body(self, name: str, position: Tuple[float, float], body_type: str = "dynamic",
+                    mass: float = 1.0, moment: float = 100,
+                    default_shape: bool = True, layer: Optional[str] = None) -> PhysicsBody:
+        """Verilen konumda yeni fizik gövdesi oluşturur"""
+        body = PhysicsBody(body_type, mass, moment)
+        body.layer = layer
+        body.body.position = position
+        if default_shape:
+            body.add_box_shape(10, 10)
+        return self.add_body(name, body)
+    
+    def add_body(self, name: str, body: PhysicsBody) -> PhysicsBody:
+        """Gövdeyi konumunun bulunduğu bölgeye ekler"""
+        if name in self.body_regions:
+            self.remove_body(name)
+        if body.layer is not None and body.layer not in self.layers:
+            self.add_layer(body.layer)
+        key = self.region_key(*body.position)
+        self.get_region(key).physics.add_body(name, body)
+        self.body_regions[name] = key
+        return body
+    
+    def remove_body(self, name: str):
+        """Fizik gövdesini kaldırır"""
+        key = self.body_regions.pop(name, None)
+        if key is not None:
+            self.regions[key].physics.remove_body(name)
+    
+    def get_body(self, name: str) -> Optional[PhysicsBody]:
+        """İsme göre fizik gövdesi döndürür"""
+        key = self.body_regions.get(name)
+        return self.regions[key].physics.get_body(name) if key is not None else None
+    
+    def set_focus(self, x: float, y: float):
+        """Ayrıntı seviyesinin merkezini (oyuncu veya kamera) ayarlar"""
+        self.focus = (x, y)
+    
+    def set_gravity(self, x: float, y: float):
+        """Tüm bölgelerin yerçekimini ayarlar"""
+        self.gravity = (x, y)
+        for region in self.regions.values():
+            region.physics.set_gravity(x, y)
+    
+    def _sync_layers(self):
+        """Güncel katman tablosunu tüm bölgelere uygular"""
+        for region in self.regions.values():
+            region.physics.set_collision_layers(self.collision_layers)
+    
+    def add_layer(self, name: str, collision_type: Optional[int] = None) -> int:
+        """Tüm bölgelerde çarpışma katmanı tanımlar (bkz. PhysicsSystem.add_layer)"""
+        known = name in self.layers
+        bit = self.collision_layers.add(name, collision_type)
+        if not known or collision_type is not None:
+            self._sync_layers()
+        return bit
+    
+    def set_layer_collision(self, layer_a: str, layer_b: str, collide: bool = True):
+        """Tüm bölgelerde iki katmanın çarpışmasını ayarlar"""
+        self.collision_layers.set_collision(layer_a, layer_b, collide)
+        self._sync_layers()
+    
+    def set_layer_matrix(self, matrix: Dict[str, List[str]]):
+        """Tüm bölgelerde katman matrisini ayarlar"""
+        self.collision_layers.set_matrix(matrix)
+        self._sync_layers()
+    
+    def get_interval(self, distance: float) -> int:
+        """Mesafeye göre güncelleme aralığını döndürür (0: uyku)"""
+        if distance > self.sleep_distance:
+            return 0
+        interval = 1
+        for level_distance, level_interval in self.lod_levels:
+            if distance >= level_distance:
+                interval = level_interval
+        return interval
+    
+    def update(self, dt: float):
+        """Bölgeleri odağa uzaklıklarına göre günceller"""
+        if not self.enabled:
+            return
+        
+        self.frame += 1
+        self.stepped = self.deferred = self.sleeping = self.handoffs = self.steps_taken = 0
+        
+        stepped = []
+        for region in self.regions.values():
+            if not region.physics.bodies:
+                region.pending = 0.0
+                continue
+            
+            distance = region.distance_to(*self.focus) if self.focus else 0.0
+            interval = self.get_interval(distance)
+            region.sleeping = interval == 0
+            if region.sleeping:
+                region.pending = 0.0
+                self.sleeping += 1
+                continue
+            
+            # Kuvvetler adım yapılmayan karelerde de kare süresiyle ağırlıklandırılır
+            region.pending += dt
+            region.physics.accumulate_forces(dt)
+            if (self.frame + region.phase) % interval:
+                self.deferred += 1
+                continue
+            
+            # Seyrek bölgeler biriken süreyi daha büyük tek adımlarla işler
+            region.interval = interval
+            region.physics.fixed_dt = self.fixed_dt * interval
+            region.physics.advance(region.pending)
+            region.pending = 0.0
+            self.steps_taken += region.physics.steps_taken
+            self.stepped += 1
+            stepped.append(region)
+        
+        for region in stepped:
+            self._handoff(region)
+    
+    def _handoff(self, region: PhysicsRegion):
+        """Bölgesinin dışına çıkan gövdeleri yeni bölgelerine taşır"""
+        physics = region.physics
+        positions = physics.get_positions()
+        left, top, right, bottom = region.bounds
+        margin = self.handoff_margin
+        outside = ((positions[:, 0] < left - margin) | (positions[:, 0] >= right + margin) |
+                   (positions[:, 1] < top - margin) | (positions[:, 1] >= bottom + margin))
+        if not outside.any():
+            return
+        
+        # remove_body satırların sırasını değiştirdiği için önce isimleri topla
+        names = [physics.body_names[index] for index in np.flatnonzero(outside).tolist()]
+        for name in names:
+            body = physics.bodies[name]
+            physics.remove_body(name)
+            key = self.region_key(*body.position)
+            self.get_region(key).physics.add_body(name, body)
+            self.body_regions[name] = key
+        self.handoffs += len(names)
+    
+    def clear(self):
+        """Tüm bölgeleri ve gövdeleri temizler"""
+        for region in self.regions.values():
+            region.physics.clear()
+        self.regions.clear()
+        self.body_regions.clear()
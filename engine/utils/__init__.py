@@ -5,5 +5,6 @@ Yardımcı araçlar ve yöneticileri içerir.
 
 from .resource_manager import ResourceManager
 from .debug import DebugSystem, DebugLevel
+from .texture_cache import TextureCache, texture_cache
 
-__all__ = ['ResourceManager', 'DebugSystem', 'DebugLevel']
+__all__ = ['ResourceManager', 'DebugSystem', 'DebugLevel', 'TextureCache', 'texture_cache']
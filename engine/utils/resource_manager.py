@@ -7,6 +7,7 @@ import os
 import pygame
 from typing import Dict, Optional, Any
 from ..core.base import GameSystem
+from .texture_cache import texture_cache
 
 class ResourceManager(GameSystem):
     """Kaynak yönetim sistemi"""
@@ -31,7 +32,7 @@ class ResourceManager(GameSystem):
         """Texture yükler"""
         try:
             full_path = self.get_full_path(file_path)
-            texture = pygame.image.load(full_path).convert_alpha()
+            texture = texture_cache.load_image(full_path).convert_alpha()
             self._textures[name] = texture
             return texture
         except Exception as e:
@@ -0,0 +1,157 @@
+"""
+Doku önbelleği.
+Çözülmüş texture piksellerini lz4 ile sıkıştırılmış ham RGBA dosyaları olarak saklar.
+Sıcak başlangıçlarda PNG açma ve filtreleme adımı atlanır.
+"""
+
+import hashlib
+import os
+import struct
+import pygame
+from typing import Optional
+
+try:
+    import lz4.frame
+except ImportError:  # lz4 kurulu değilse önbellek devre dışı kalır
+    lz4 = None
+
+def hash_file(path: str) -> str:
+    """Dosya içeriğinin SHA-1 hash'ini döndürür"""
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class TextureCache:
+    """lz4 sıkıştırmalı ham piksel önbelleği
+    
+    Dosya yapısı: başlık (sihirli sayı, sürüm, format, boyut, kaynak dosyanın
+    mtime'ı, boyutu ve SHA-1 hash'i) ve ardından lz4 frame ile sıkıştırılmış
+    pikseller.
+    """
+    MAGIC = b'FTXC'
+    VERSION = 1
+    FORMAT = 'RGBA'
+    HEADER = struct.Struct('<4sH4sIIQQ20s')
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+    
+    @property
+    def enabled(self) -> bool:
+        """Önbelleğin kullanılabilir olup olmadığını döndürür"""
+        return self.cache_dir is not None and lz4 is not None
+    
+    def enable(self, cache_dir: str):
+        """Önbelleği verilen dizinde etkinleştirir"""
+        os.makedirs(cache_dir, exist_ok=True)
+        self.cache_dir = cache_dir
+    
+    def disable(self):
+        """Önbelleği devre dışı bırakır"""
+        self.cache_dir = None
+    
+    def get_cache_path(self, source_path: str) -> str:
+        """Kaynak dosyanın önbellek dosyası yolunu döndürür"""
+        key = hashlib.sha1(os.path.abspath(source_path).encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.lz4")
+    
+    def load(self, source_path: str) -> Optional[pygame.Surface]:
+        """Önbellekteki yüzeyi döndürür, geçersizse None döndürür"""
+        if not self.enabled:
+            return None
+        
+        try:
+            stat = os.stat(source_path)
+            with open(self.get_cache_path(source_path), 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
+        
+        if len(data) < self.HEADER.size:
+            return None
+        magic, version, fmt, width, height, mtime, size, digest = self.HEADER.unpack_from(data)
+        if magic != self.MAGIC or version != self.VERSION:
+            return None
+        
+        # mtime değiştiyse içeriği hash ile doğrula
+        if size != stat.st_size:
+            return None
+        touched = mtime != stat.st_mtime_ns
+        if touched and bytes.fromhex(hash_file(source_path)) != digest:
+            return None
+        
+        try:
+            pixels = lz4.frame.decompress(memoryview(data)[self.HEADER.size:])
+            surface = pygame.image.frombytes(pixels, (width, height), fmt.decode('ascii'))
+        except (RuntimeError, ValueError):
+            return None
+        
+        # İçerik aynıysa sonraki yüklemeler yeniden hash hesaplamasın
+        if touched:
+            self.refresh_header(source_path, stat, width, height, digest)
+        return surface
+    
+    def refresh_header(self, source_path: str, stat: os.stat_result, width: int, height: int,
+                       digest: bytes):
+        """Önbellek dosyasının başlığını kaynağın güncel mtime değeriyle yeniden yazar"""
+        header = self.HEADER.pack(
+            self.MAGIC, self.VERSION, self.FORMAT.encode('ascii'), width, height,
+            stat.st_mtime_ns, stat.st_size, digest
+        )
+        try:
+            with open(self.get_cache_path(source_path), 'r+b') as f:
+                f.write(header)
+        except OSError:
+            pass
+    
+    def store(self, source_path: str, surface: pygame.Surface):
+        """Yüzeyin piksellerini önbelleğe yazar"""
+        if not self.enabled:
+            return
+        
+        stat = os.stat(source_path)
+        width, height = surface.get_size()
+        header = self.HEADER.pack(
+            self.MAGIC, self.VERSION, self.FORMAT.encode('ascii'), width, height,
+            stat.st_mtime_ns, stat.st_size, bytes.fromhex(hash_file(source_path))
+        )
+        pixels = lz4.frame.compress(pygame.image.tobytes(surface, self.FORMAT))
+        
+        # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yaz
+        cache_path = self.get_cache_path(source_path)
+        temp_path = f"{cache_path}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.write(header)
+            f.write(pixels)
+        os.replace(temp_path, cache_path)
+    
+    def load_image(self, source_path: str) -> pygame.Surface:
+        """Görüntüyü önbellekten, yoksa dosyadan yükler ve önbelleğe yazar
+        
+        Dönen yüzey ekran formatına dönüştürülmemiştir.
+        """
+        surface = self.load(source_path)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        
+        surface = pygame.image.load(source_path)
+        if self.enabled:
+            self.misses += 1
+            self.store(source_path, surface)
+        return surface
+    
+    def clear(self):
+        """Önbellek dosyalarını siler"""
+        if not self.cache_dir or not os.path.isdir(self.cache_dir):
+            return
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith('.lz4'):
+                os.remove(os.path.join(self.cache_dir, filename))
+
+# Global doku önbelleği, texture_cache.enable(dizin) ile etkinleştirilir
+texture_cache = TextureCache()
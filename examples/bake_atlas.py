@@ -0,0 +1,39 @@
+"""
+Atlas pişirme aracı.
+Bir dizindeki PNG dosyalarını önceden pişirilmiş atlas sayfalarına dönüştürür.
+Kaynaklar değişmediyse hiçbir şey yeniden oluşturulmaz.
+
+Kullanım:
+    python examples/bake_atlas.py assets/tiles assets/baked tiles
+"""
+
+import os
+import sys
+import argparse
+
+# Proje kök dizinini Python yoluna ekle
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+import pygame
+from engine.graphics.texture_atlas import TextureManager
+
+parser = argparse.ArgumentParser(description="PNG dizinini atlas'a pişirir")
+parser.add_argument("source", help="Kaynak PNG dizini")
+parser.add_argument("output", help="Pişirilmiş atlas dizini")
+parser.add_argument("name", help="Atlas adı")
+parser.add_argument("--size", type=int, default=1024, help="Sayfa boyutu (piksel)")
+parser.add_argument("--rotate", action="store_true", help="Döndürerek yerleştirmeye izin ver")
+args = parser.parse_args()
+
+# convert_alpha için gizli bir pencere gerekir
+pygame.init()
+pygame.display.set_mode((1, 1), pygame.HIDDEN)
+
+os.makedirs(args.output, exist_ok=True)
+manager = TextureManager()
+atlas = manager.bake_directory(args.source, args.name, args.output,
+                               size=(args.size, args.size), allow_rotation=args.rotate)
+
+print(f"{len(atlas.regions)} texture, {atlas.page_count} sayfa: {args.output}")
+pygame.quit()
@@ -0,0 +1,195 @@
+"""
+Fizik performans ölçümü.
+PhysicsSystem ayarlarını aynı sahne üzerinde karşılaştırır.
+
+Kullanım:
+    python examples/physics_benchmark.py broadphase --bodies 2000 --frames 300
+    python examples/physics_benchmark.py threads --bodies 10000
+    python examples/physics_benchmark.py snapshot --bodies 1000 --frames 100
+    python examples/physics_benchmark.py regions --bodies 10000
+    python examples/physics_benchmark.py queries --bodies 2000 --frames 100
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+import pymunk
+
+# Proje kök dizinini Python yoluna ekle
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from engine.systems.physics import PhysicsSystem
+from engine.systems.physics_regions import RegionalPhysicsSystem
+
+def fill_scene(physics: PhysicsSystem, count: int, seed: int = 1, spacing: float = 40):
+    """Rastgele hızlı, benzer boyutlu kutulardan oluşan sahne kurar"""
+    rng = random.Random(seed)
+    side = int(count ** 0.5) + 1
+    jitter = (spacing - 10) / 6
+    names = [f"body{i}" for i in range(count)]
+    positions = [((i % side) * spacing + rng.uniform(-jitter, jitter),
+                  (i // side) * spacing + rng.uniform(-jitter, jitter))
+                 for i in range(count)]
+    for body in physics.create_bodies(names, positions):
+        body.body.velocity = (rng.uniform(-60, 60), rng.uniform(-60, 60))
+
+def run_frames(physics: PhysicsSystem, frames: int) -> float:
+    """Sabit adımla verilen sayıda kare çalıştırır, geçen süreyi döndürür"""
+    start = time.perf_counter()
+    for _ in range(frames):
+        physics.update(physics.fixed_dt)
+    return time.perf_counter() - start
+
+def report(label: str, elapsed: float, frames: int, baseline: float = None, unit: str = "kare"):
+    """Sonuç satırını yazdırır"""
+    line = f"{label:<24} {elapsed * 1000 / frames:8.3f} ms/{unit}"
+    if baseline:
+        line += f"  ({baseline / elapsed:.2f}x)"
+    print(line)
+
+def best_of(setup, args) -> float:
+    """Sahneyi her tekrarda yeniden kurar, en iyi süreyi döndürür"""
+    best = None
+    for _ in range(args.repeat):
+        physics = setup()
+        elapsed = run_frames(physics, args.frames)
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def bench_broadphase(args):
+    """Varsayılan ağaç ile ayarlı uzamsal hash karşılaştırması"""
+    def setup_tree():
+        physics = PhysicsSystem()
+        fill_scene(physics, args.bodies)
+        return physics
+    
+    def setup_hash():
+        physics = setup_tree()
+        physics.set_broadphase("hash")
+        return physics
+    
+    baseline = best_of(setup_tree, args)
+    report("tree", baseline, args.frames)
+    params = setup_hash().hash_params
+    report("hash dim=%.1f count=%d" % params, best_of(setup_hash, args), args.frames, baseline)
+
+def bench_threads(args):
+    """Tek ve çok iş parçacıklı adım karşılaştırması (sık temaslı sahne)"""
+    def setup(threads):
+        def build():
+            physics = PhysicsSystem(threads=threads, thread_threshold=0)
+            fill_scene(physics, args.bodies, spacing=11)
+            return physics
+        return build
+    
+    print(f"İşlemci sayısı: {os.cpu_count()}")
+    baseline = best_of(setup(1), args)
+    report("1 thread", baseline, args.frames)
+    if PhysicsSystem(threads=2).threads == 1:
+        print("Bu platformda çok iş parçacıklı adım desteklenmiyor")
+        return
+    report("2 threads", best_of(setup(2), args), args.frames, baseline)
+
+def time_calls(function, count: int) -> float:
+    """Fonksiyonu verilen sayıda çağırır, en iyi tekrarın süresini döndürür"""
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        for _ in range(count):
+            function()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def bench_snapshot(args):
+    """Anlık görüntü alma/geri yükleme ile space.copy karşılaştırması"""
+    physics = PhysicsSystem()
+    fill_scene(physics, args.bodies)
+    run_frames(physics, 10)
+    snapshot = physics.snapshot()
+    count = args.frames
+    
+    baseline = time_calls(physics.space.copy, max(1, count // 10)) * 10
+    report("space.copy", baseline, count, unit="çağrı")
+    report("snapshot", time_calls(physics.snapshot, count), count, baseline, unit="çağrı")
+    report("restore", time_calls(lambda: physics.restore(snapshot), count), count, baseline,
+           unit="çağrı")
+    print(f"Anlık görüntü boyutu: {snapshot.data.nbytes / 1024:.1f} KiB")
+
+def bench_regions(args):
+    """Tek uzay ile odak köşedeyken bölgesel fizik karşılaştırması"""
+    def setup_single():
+        physics = PhysicsSystem()
+        fill_scene(physics, args.bodies)
+        return physics
+    
+    def setup_regions():
+        physics = setup_single()
+        regional = RegionalPhysicsSystem(region_size=512, lod_levels=[(512, 2), (1024, 4)],
+                                         sleep_distance=2048)
+        for name, body in list(physics.bodies.items()):
+            physics.remove_body(name)
+            regional.add_body(name, body)
+        regional.set_focus(0, 0)
+        return regional
+    
+    baseline = best_of(setup_single, args)
+    report("single space", baseline, args.frames)
+    regional = setup_regions()
+    report(f"regions ({len(regional.regions)})", best_of(setup_regions, args), args.frames, baseline)
+
+def bench_queries(args):
+    """Tek tek space sorguları ile toplu raycast karşılaştırması (yarısı tekrarlı)"""
+    physics = PhysicsSystem()
+    fill_scene(physics, args.bodies)
+    run_frames(physics, 10)
+    rng = random.Random(2)
+    extent = (int(args.bodies ** 0.5) + 1) * 40
+    rays = [((rng.uniform(0, extent), rng.uniform(0, extent)),
+             (rng.uniform(0, extent), rng.uniform(0, extent))) for _ in range(500)]
+    starts = [ray[0] for ray in rays]
+    ends = [ray[1] for ray in rays]
+    everything = pymunk.ShapeFilter()
+    
+    def single():
+        for start, end in rays:
+            info = physics.space.segment_query_first(start, end, 0.0, everything)
+            if info is not None:
+                physics.get_body_name(info.shape.body)
+                
+    def batch():
+        physics.clear_query_cache()
+        physics.raycast(starts, ends)
+        physics.raycast(starts, ends)
+        
+    count = args.frames
+    baseline = time_calls(lambda: (single(), single()), count)
+    report("2x500 segment_query", baseline, count, unit="çağrı")
+    report("2x500 raycast", time_calls(batch, count), count, baseline, unit="çağrı")
+    physics.enable_query_cache()
+    report("2x500 raycast (cache)", time_calls(batch, count), count, baseline, unit="çağrı")
+
+SCENARIOS = {
+    'broadphase': bench_broadphase,
+    'threads': bench_threads,
+    'snapshot': bench_snapshot,
+    'regions': bench_regions,
+    'queries': bench_queries,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="PhysicsSystem performans ölçümü")
+    parser.add_argument("scenario", choices=sorted(SCENARIOS), help="Ölçülecek senaryo")
+    parser.add_argument("--bodies", type=int, default=2000, help="Gövde sayısı")
+    parser.add_argument("--frames", type=int, default=300, help="Kare sayısı")
+    parser.add_argument("--repeat", type=int, default=3, help="Tekrar sayısı (en iyisi raporlanır)")
+    args = parser.parse_args()
+    
+    print(f"{args.scenario}: {args.bodies} gövde, {args.frames} kare")
+    SCENARIOS[args.scenario](args)
+
+if __name__ == "__main__":
+    main()
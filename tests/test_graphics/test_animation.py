@@ -1,6 +1,12 @@
+import json
 import pytest
 import pygame
-from engine.graphics.animation import Animation, AnimationManager
+from engine.graphics.animation import (
+    Animation, AnimationClip, AnimationManager, AnimationPlayer, AnimationPlayerPool,
+    Bone, ClockedAnimationPlayer, Keyframe, SkeletalAnimation, Skeleton,
+    load_animation_clips, load_spritesheet, sprite_sheet_cache
+)
+from engine.core.timing import GameClock
 
 @pytest.fixture
 def animation_frames():
@@ -59,6 +65,125 @@ def test_animation_no_loop(animation_frames):
     # Son frame'de kalmalı ve bitmiş olmalı
     assert animation.current_frame == len(animation_frames) - 1
     assert animation.finished
+
+class TestAnimationClip:
+    """Paylaşılan klip ve oynatıcı test sınıfı"""
+    
+    def test_players_share_frames(self, animation_frames):
+        """Aynı klibi oynatan örnekler kareleri paylaşmalı ama durumu paylaşmamalı"""
+        clip = AnimationClip(animation_frames, frame_duration=0.1)
+        first = Animation.from_clip(clip)
+        second = AnimationPlayer(clip)
+        first.update(0.1)
+        assert first.frames is second.frames
+        assert first.current_frame == 1
+        assert second.current_frame == 0
+    
+    def test_clip_is_immutable(self, animation_frames):
+        """Klip değiştirilememeli"""
+        clip = AnimationClip(animation_frames)
+        with pytest.raises(AttributeError):
+            clip.loop = False
+    
+    def test_pool_matches_player(self, animation_frames):
+        """Dizi tabanlı havuz tekil oynatıcı ile aynı kareleri üretmeli"""
+        clip = AnimationClip(animation_frames, frame_duration=0.1, loop=False)
+        player = AnimationPlayer(clip)
+        pool = AnimationPlayerPool()
+        index = pool.add(clip)
+        for _ in range(5):
+            player.update(0.1)
+            pool.update(0.1)
+            assert pool.get_frame(index) is player.get_current_frame()
+        assert pool.is_finished(index) and player.is_finished()
+    
+    def test_pool_reuses_slots(self, animation_frames):
+        """Silinen örneğin yeri yeniden kullanılmalı"""
+        clip = AnimationClip(animation_frames)
+        pool = AnimationPlayerPool()
+        indices = [pool.add(clip) for _ in range(3)]
+        pool.remove(indices[1])
+        assert len(pool) == 2
+        assert pool.add(clip) == indices[1]
+        assert pool.clips == [clip]
+
+class TestClockedAnimation:
+    """Saat tabanlı oynatıcı test sınıfı"""
+    
+    def test_samples_from_clock(self, animation_frames):
+        """Kare saat zamanı ve başlangıç ofsetinden hesaplanmalı"""
+        clock = GameClock()
+        clip = AnimationClip(animation_frames, frame_duration=0.1)
+        first = ClockedAnimationPlayer(clip, clock=clock)
+        second = ClockedAnimationPlayer(clip, start_time=-0.1, clock=clock)
+        
+        clock.advance(0.15)
+        assert first.current_frame == 1
+        assert second.current_frame == 2
+        clock.advance(0.2)
+        assert first.current_frame == 0  # 0.35 s -> 3. kare, döngü
+        assert first.get_current_frame() is animation_frames[0]
+    
+    def test_no_loop_finishes(self, animation_frames):
+        """Döngüsüz klip son karede kalmalı"""
+        clock = GameClock()
+        player = ClockedAnimationPlayer(AnimationClip(animation_frames, 0.1, loop=False), clock=clock)
+        clock.advance(1.0)
+        assert player.current_frame == 2
+        assert player.is_finished()
+        
+        player.reset()
+        assert player.current_frame == 0 and not player.is_finished()
+    
+    def test_manager_with_clock(self, animation_frames):
+        """Yönetici saat tabanlı oynatıcıları güncellemeden oynatmalı"""
+        clock = GameClock()
+        manager = AnimationManager()
+        manager.add_clip("idle", AnimationClip(animation_frames, 0.1), clock=clock)
+        clock.advance(0.25)
+        assert manager.get_current_frame() is animation_frames[2]
+
+class TestSpriteSheet:
+    """Sprite sheet önbelleği test sınıfı"""
+    
+    @pytest.fixture
+    def sheet_path(self, tmp_path):
+        """Üç kareli, kare başına farklı renkli sheet dosyası"""
+        sheet = pygame.Surface((48, 16), pygame.SRCALPHA)
+        for i in range(3):
+            sheet.fill((i * 100, 0, 0, 255), (i * 16, 0, 16, 16))
+        path = tmp_path / "sheet.png"
+        pygame.image.save(sheet, str(path))
+        sprite_sheet_cache.clear()
+        return path
+    
+    def test_frames_are_subsurfaces(self, sheet_path):
+        """Kareler tek sheet üzerindeki subsurface'ler olmalı"""
+        frames = load_spritesheet(str(sheet_path), 16, 16)
+        assert len(frames) == 3
+        assert frames[0].get_parent() is frames[2].get_parent()
+        assert frames[1].get_at((0, 0))[:3] == (100, 0, 0)
+    
+    def test_config_decodes_sheet_once(self, sheet_path, tmp_path):
+        """Aynı sheet'i kullanan klipler sheet'i bir kez yüklemeli"""
+        config = {'animations': {
+            name: {'spritesheet': str(sheet_path), 'frame_width': 16, 'frame_height': 16}
+            for name in ('idle', 'walk', 'run')
+        }}
+        config_path = tmp_path / "animations.json"
+        config_path.write_text(json.dumps(config))
+        
+        loads = sprite_sheet_cache.loads
+        clips = load_animation_clips(str(config_path))
+        assert sprite_sheet_cache.loads == loads + 1
+        assert clips['idle'].frames[0] is clips['run'].frames[0]
+    
+    def test_sheet_smaller_than_frame(self, sheet_path):
+        """Tam kare sığmayan sheet açık bir hata vermeli"""
+        with pytest.raises(ValueError):
+            load_spritesheet(str(sheet_path), 64, 16)
+        with pytest.raises(ValueError):
+            load_spritesheet(str(sheet_path), 16, 32)
     
 class TestAnimationManager:
     """AnimationManager test sınıfı"""
@@ -104,4 +229,215 @@ class TestAnimationManager:
         
         # Sıfırla
         animation_manager.reset_current()
-        assert animation_manager.animations["walk"].current_frame == 0 
\ No newline at end of file
+        assert animation_manager.animations["walk"].current_frame == 0 
+    
+class TestSkeletalAnimation:
+    """İskelet animasyonu test sınıfı"""
+    
+    @pytest.fixture
+    def skeleton(self):
+        """İki kemikli, walk animasyonlu iskelet fixture'ı"""
+        skeleton = Skeleton()
+        skeleton.add_bone(Bone("body", None, 0, 0, 0))
+        skeleton.add_bone(Bone("arm", "body", 0, 0, 0))
+        walk = SkeletalAnimation("walk", duration=1.0)
+        # Sırasız ekleme de doğru sıralanmalı
+        walk.add_keyframe(Keyframe(1.0, "body", 10, 0, 0))
+        walk.add_keyframe(Keyframe(0.0, "body", 0, 0, 0))
+        walk.add_keyframe(Keyframe(0.0, "arm", 0, 0, 350))
+        walk.add_keyframe(Keyframe(0.5, "arm", 0, 0, 10, scale_x=2.0))
+        skeleton.add_animation(walk)
+        return skeleton
+        
+    def test_compiled_tracks(self, skeleton):
+        """Anahtar kareler kemik başına sıralı izlere derlenmeli"""
+        walk = skeleton.get_animation("walk")
+        assert set(walk.tracks) == {"body", "arm"}
+        assert list(walk.get_track("body").times) == [0.0, 1.0]
+        assert list(walk.get_track("body").x) == [0.0, 10.0]
+        
+    def test_track_find(self, skeleton):
+        """İmleçli arama ikili arama ile aynı sonucu vermeli"""
+        track = skeleton.get_animation("walk").get_track("arm")
+        assert track.find(-0.1) == -1
+        assert track.find(0.25) == 0
+        assert track.find(0.25, cursor=0) == 0
+        assert track.find(0.75, cursor=0) == 1
+        assert track.find(0.1, cursor=1) == 0
+        
+    def test_update_interpolates(self, skeleton):
+        """Güncelleme kemikleri interpolasyonla ayarlamalı"""
+        skeleton.play_animation("walk")
+        skeleton.update(0.25)
+        body = skeleton.get_bone("body")
+        arm = skeleton.get_bone("arm")
+        assert body.x == pytest.approx(2.5)
+        assert arm.rotation == pytest.approx(360.0)  # 350 -> 10 kısa yoldan
+        assert arm.scale_x == pytest.approx(1.5)
+        
+        skeleton.update(0.5)
+        assert body.x == pytest.approx(7.5)
+        assert arm.rotation == pytest.approx(10.0)  # Son kare tutulur
+        
+    def test_keyframe_added_after_compile(self, skeleton):
+        """Derlemeden sonra eklenen kare izleri yenilemeli"""
+        walk = skeleton.get_animation("walk")
+        assert len(walk.get_track("body").times) == 2
+        walk.add_keyframe(Keyframe(0.5, "body", 100, 0, 0))
+        assert list(walk.get_track("body").times) == [0.0, 0.5, 1.0]
+        
+    def test_save_load(self, skeleton, tmp_path):
+        """İskelet kaydetme/yükleme testi"""
+        path = tmp_path / "skeleton.json"
+        skeleton.save(str(path))
+        loaded = Skeleton.load(str(path))
+        assert isinstance(loaded.get_animation("walk"), SkeletalAnimation)
+        assert [k.time for k in loaded.get_animation("walk").keyframes] == [0.0, 0.0, 0.5, 1.0]
+
+    @pytest.mark.parametrize("compress, use_mmap", [(False, False), (True, False), (False, True)])
+    def test_binary_roundtrip(self, skeleton, tmp_path, compress, use_mmap):
+        """İkili kaydetme/yükleme izleri ve kemikleri korumalı"""
+        path = tmp_path / "skeleton.skb"
+        skeleton.save_binary(str(path), compress=compress)
+        loaded = Skeleton.load_binary(str(path), use_mmap=use_mmap)
+        
+        assert loaded.get_bone("arm").parent == "body"
+        original = skeleton.get_animation("walk")
+        walk = loaded.get_animation("walk")
+        assert walk.duration == original.duration and walk.loop == original.loop
+        for bone_name, track in original.tracks.items():
+            assert list(walk.get_track(bone_name).times) == list(track.times)
+            assert list(walk.get_track(bone_name).rotation) == list(track.rotation)
+        
+        loaded.play_animation("walk")
+        loaded.update(0.25)
+        assert loaded.get_bone("arm").scale_x == pytest.approx(1.5)
+    
+    def test_binary_keyframes_on_demand(self, skeleton, tmp_path):
+        """İkili dosyadan yüklenen animasyon anahtar kareleri gerektiğinde oluşturmalı"""
+        path = tmp_path / "skeleton.skb"
+        skeleton.save_binary(str(path))
+        walk = Skeleton.load_binary(str(path)).get_animation("walk")
+        assert [k.time for k in walk.keyframes] == [0.0, 0.0, 0.5, 1.0]
+        
+        walk.add_keyframe(Keyframe(0.5, "body", 100, 0, 0))
+        assert list(walk.get_track("body").x) == [0.0, 100.0, 10.0]
+    
+    def test_binary_invalid_file(self, tmp_path):
+        """Geçersiz ikili dosya hata vermeli"""
+        path = tmp_path / "broken.skb"
+        path.write_bytes(bytes(64))
+        with pytest.raises(ValueError):
+            Skeleton.load_binary(str(path))
+
+class TestBoneHierarchy:
+    """Hiyerarşik kemik dönüşümü test sınıfı"""
+    
+    @pytest.fixture
+    def skeleton(self):
+        """Gövde, kol ve el kemikli iskelet fixture'ı"""
+        skeleton = Skeleton()
+        skeleton.add_bone(Bone("body", None, 100, 50, 90))
+        skeleton.add_bone(Bone("arm", "body", 10, 0, 0, scale_x=2.0, scale_y=2.0))
+        skeleton.add_bone(Bone("hand", "arm", 5, 0, 0))
+        skeleton.add_bone(Bone("prop", None, 0, 0, 0))
+        return skeleton
+    
+    def test_world_pose_follows_parent(self, skeleton):
+        """Çocuk kemikler ebeveynin dönüşümünü miras almalı"""
+        x, y, rotation, scale_x, scale_y = skeleton.get_world_pose("arm")
+        assert (x, y) == pytest.approx((100, 60))
+        assert rotation == pytest.approx(90)
+        assert (scale_x, scale_y) == pytest.approx((2, 2))
+        assert skeleton.get_world_pose("hand")[:2] == pytest.approx((100, 70))
+        assert skeleton.get_world_pose("body") == (100, 50, 90, 1.0, 1.0)
+    
+    def test_only_dirty_subtree_recomputed(self, skeleton):
+        """Yalnızca değişen kemik ve alt ağacı yeniden hesaplanmalı"""
+        assert skeleton.update_transforms() == 4
+        assert skeleton.update_transforms() == 0
+        
+        skeleton.get_bone("arm").rotation = 45
+        assert skeleton.update_transforms() == 2
+        skeleton.get_bone("body").x = 0
+        assert skeleton.update_transforms() == 3
+        assert skeleton.get_world_pose("hand")[:2] == pytest.approx((0 - 10 * 2 ** 0.5 / 2, 60 + 10 * 2 ** 0.5 / 2))
+    
+    def test_parent_added_after_child(self):
+        """Ebeveyni sonradan eklenen kemik doğru sıralanmalı"""
+        skeleton = Skeleton()
+        skeleton.add_bone(Bone("child", "root", 1, 0, 0))
+        assert skeleton.get_world_pose("child")[:2] == (1, 0)
+        skeleton.add_bone(Bone("root", None, 10, 10, 0))
+        assert skeleton.get_world_pose("child")[:2] == pytest.approx((11, 10))
+    
+    def test_hit_test(self, skeleton):
+        """Nokta testi dünya matrislerini kullanmalı"""
+        skeleton.set_sprite(pygame.Surface((4, 2)))
+        assert skeleton.hit_test((100, 70)) == "hand"
+        assert skeleton.hit_test((100, 50)) == "body"
+        assert skeleton.hit_test((0, 0)) == "prop"
+        assert skeleton.hit_test((50, 50)) is None
+
+class TestBakedAnimation:
+    """Pişmiş iskelet animasyonu test sınıfı"""
+    
+    @pytest.fixture
+    def skeleton(self):
+        """Sprite'lı, dönen kollu iskelet fixture'ı"""
+        skeleton = Skeleton()
+        skeleton.add_bone(Bone("body", None, 40, 40, 0))
+        skeleton.add_bone(Bone("arm", "body", 50, 30, 0))
+        spin = SkeletalAnimation("spin", duration=1.0)
+        spin.add_keyframe(Keyframe(0.0, "body", 40, 40, 0))
+        spin.add_keyframe(Keyframe(1.0, "body", 60, 40, 0))
+        spin.add_keyframe(Keyframe(0.0, "arm", 50, 30, 0))
+        spin.add_keyframe(Keyframe(1.0, "arm", 50, 30, 180, scale_x=2.0))
+        skeleton.add_animation(spin)
+        sprite = pygame.Surface((8, 16), pygame.SRCALPHA)
+        sprite.fill((255, 0, 0, 255))
+        skeleton.set_sprite(sprite)
+        return skeleton
+        
+    def render(self, skeleton):
+        """İskeleti boş bir yüzeye çizer"""
+        target = pygame.Surface((120, 120), pygame.SRCALPHA)
+        skeleton.draw(target)
+        return pygame.image.tobytes(target, "RGBA")
+        
+    def test_bake_frame_count(self, skeleton):
+        """Örnekleme hızına göre kare sayısı"""
+        baked = skeleton.bake_animation("spin", sample_rate=10)
+        assert len(baked.frames) == 10
+        assert baked.get_frame_index(0.25) == 2
+        assert baked.get_frame_index(1.05) == 0
+        
+    def test_baked_matches_live(self, skeleton):
+        """Pişmiş kare canlı çizim ile aynı pikselleri üretmeli"""
+        skeleton.play_animation("spin")
+        skeleton.update(0.3)
+        live = self.render(skeleton)
+        
+        skeleton.bake_animation("spin", sample_rate=10)
+        assert skeleton.get_active_baked() is not None
+        assert self.render(skeleton) == live
+        
+    def test_live_evaluation_skips_baked(self, skeleton):
+        """Canlı değerlendirme açıkken kemikler güncellenmeli"""
+        skeleton.bake_animation("spin", sample_rate=10)
+        skeleton.play_animation("spin")
+        skeleton.update(0.5)
+        assert skeleton.get_bone("body").x == 40  # Pişmiş oynatmada kemik hesaplanmaz
+        
+        skeleton.live_evaluation = True
+        skeleton.update(0.0)
+        assert skeleton.get_active_baked() is None
+        assert skeleton.get_bone("body").x == pytest.approx(50)
+        
+    def test_bake_to_atlas(self, skeleton):
+        """Pişmiş kareler atlas'a yazılabilmeli"""
+        from engine.graphics.texture_atlas import TextureAtlas
+        atlas = TextureAtlas((256, 256))
+        baked = skeleton.bake_animation("spin", sample_rate=4, atlas=atlas)
+        assert len(atlas.regions) == 4
+        assert baked.frames[0].get_parent() is atlas.pages[0]
@@ -0,0 +1,112 @@
+import random
+import pytest
+from engine.graphics.animation import Bone, Keyframe, SkeletalAnimation, Skeleton
+from engine.graphics.animation_batch import BatchAnimationEvaluator
+
+def make_animation(name="walk", bones=4, keys=6, duration=1.0, loop=True):
+    """Rastgele anahtar kareli iskelet animasyonu oluşturur"""
+    rng = random.Random(42)
+    animation = SkeletalAnimation(name, duration=duration, loop=loop)
+    for b in range(bones):
+        for k in range(keys):
+            animation.add_keyframe(Keyframe(
+                time=0.1 + k * 0.15, bone_name=f"bone{b}",
+                x=rng.uniform(-10, 10), y=rng.uniform(-10, 10),
+                rotation=rng.uniform(0, 360),
+                scale_x=rng.uniform(0.5, 2), scale_y=rng.uniform(0.5, 2)
+            ))
+    return animation
+
+def make_skeleton(animation, bones=4):
+    """Animasyonu oynatan iskelet oluşturur"""
+    skeleton = Skeleton()
+    for b in range(bones):
+        skeleton.add_bone(Bone(f"bone{b}", None, 0, 0, 0))
+    skeleton.add_animation(animation)
+    skeleton.play_animation(animation.name)
+    return skeleton
+
+def pose(skeleton):
+    """İskeletin kemik değerlerini düz liste olarak döndürür"""
+    return [value for b in skeleton.bones.values()
+            for value in (b.x, b.y, b.rotation, b.scale_x, b.scale_y)]
+
+class TestBatchAnimationEvaluator:
+    """BatchAnimationEvaluator test sınıfı"""
+    
+    def test_matches_skeleton_update(self):
+        """Toplu değerlendirme tek tek güncelleme ile aynı sonucu vermeli"""
+        animation = make_animation()
+        evaluator = BatchAnimationEvaluator()
+        batched = [make_skeleton(animation) for _ in range(5)]
+        reference = [make_skeleton(animation) for _ in range(5)]
+        for i, (a, b) in enumerate(zip(batched, reference)):
+            a.animation_time = b.animation_time = i * 0.17  # Farklı fazlar
+            evaluator.add_skeleton(a)
+            
+        for _ in range(20):
+            evaluator.update(0.05)
+            for skeleton in batched:
+                skeleton.update(0.05)  # batched iskelette animasyonu ilerletmemeli
+            for skeleton in reference:
+                skeleton.update(0.05)
+            for a, b in zip(batched, reference):
+                assert a.animation_time == pytest.approx(b.animation_time)
+                assert pose(a) == pytest.approx(pose(b))
+                
+    def test_before_first_keyframe(self):
+        """İlk kareden önce kemikler değişmemeli"""
+        skeleton = make_skeleton(make_animation())
+        evaluator = BatchAnimationEvaluator()
+        evaluator.add_skeleton(skeleton)
+        evaluator.update(0.05)
+        assert pose(skeleton)[:5] == [0, 0, 0, 1.0, 1.0]
+        
+    def test_results_without_write_back(self):
+        """write_back kapalıyken sonuçlar dizilerden okunabilmeli"""
+        animation = make_animation()
+        skeletons = [make_skeleton(animation) for _ in range(3)]
+        evaluator = BatchAnimationEvaluator(write_back=False)
+        for skeleton in skeletons:
+            evaluator.add_skeleton(skeleton)
+        evaluator.update(0.5)
+        
+        group, bone_names, values, valid = evaluator.get_pose(animation)
+        assert group == skeletons
+        assert values.shape == (5, 4, 3)
+        assert valid.all()
+        assert pose(skeletons[0])[:5] == [0, 0, 0, 1.0, 1.0]
+        
+    def test_same_name_animations(self):
+        """Aynı isimli farklı animasyonların sonuçları karışmamalı"""
+        first = make_animation()
+        second = make_animation(bones=2)
+        group_a = [make_skeleton(first)]
+        group_b = [make_skeleton(second, bones=2) for _ in range(2)]
+        evaluator = BatchAnimationEvaluator(write_back=False)
+        for skeleton in group_a + group_b:
+            evaluator.add_skeleton(skeleton)
+        evaluator.update(0.5)
+        
+        assert evaluator.get_pose(first)[0] == group_a
+        assert evaluator.get_pose(second)[0] == group_b
+        assert len(evaluator.get_poses("walk")) == 2
+        
+    def test_compiled_clips_released(self):
+        """Silinen animasyonların derlenmiş klipleri tutulmamalı"""
+        evaluator = BatchAnimationEvaluator()
+        animation = make_animation()
+        evaluator.get_clip(animation)
+        assert len(evaluator._clips) == 1
+        del animation
+        assert len(evaluator._clips) == 0
+        
+    def test_remove_skeleton(self):
+        """Çıkarılan iskelet yeniden kendi güncellemesini yapmalı"""
+        skeleton = make_skeleton(make_animation())
+        evaluator = BatchAnimationEvaluator()
+        evaluator.add_skeleton(skeleton)
+        evaluator.remove_skeleton(skeleton)
+        assert not skeleton.batched
+        skeleton.update(0.5)
+        assert skeleton.animation_time == pytest.approx(0.5)
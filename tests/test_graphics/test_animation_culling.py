@@ -0,0 +1,78 @@
+import pytest
+import pygame
+from engine.graphics.animation import Bone, Keyframe, SkeletalAnimation, Skeleton
+from engine.graphics.animation_culling import AnimationScheduler, CLOCK, FREEZE
+
+class Counter:
+    """Güncellemeleri kaydeden sahte animasyon hedefi"""
+    def __init__(self, x=0, y=0):
+        self.rect = pygame.Rect(x, y, 10, 10)
+        self.calls = []
+    
+    def get_bounds(self):
+        return self.rect
+    
+    def update(self, dt):
+        self.calls.append(dt)
+
+def make_skeleton(x):
+    """x konumunda, walk oynatan iskelet oluşturur"""
+    skeleton = Skeleton()
+    skeleton.add_bone(Bone("body", None, x, 0, 0))
+    walk = SkeletalAnimation("walk", duration=1.0)
+    walk.add_keyframe(Keyframe(0.0, "body", x, 0, 0))
+    walk.add_keyframe(Keyframe(1.0, "body", x, 0, 90))
+    skeleton.add_animation(walk)
+    skeleton.set_sprite(pygame.Surface((8, 8)))
+    skeleton.play_animation("walk")
+    return skeleton
+
+class TestAnimationScheduler:
+    """AnimationScheduler test sınıfı"""
+    
+    def test_offscreen_culled(self):
+        """Ekran dışındaki hedef güncellenmemeli"""
+        scheduler = AnimationScheduler(pygame.Rect(0, 0, 100, 100), margin=0)
+        near = scheduler.add(Counter(10, 10)).target
+        far = scheduler.add(Counter(500, 500), offscreen=FREEZE).target
+        scheduler.update(0.1)
+        assert near.calls == [0.1]
+        assert far.calls == []
+        assert scheduler.culled == 1
+        
+        # Görünür olunca donmuş süre uygulanmamalı
+        scheduler.set_viewport(450, 450, 100, 100)
+        scheduler.update(0.1)
+        assert far.calls == [0.1]
+    
+    def test_offscreen_skeleton_advances_clock(self):
+        """Ekran dışındaki iskeletin yalnızca zamanı ilerlemeli"""
+        scheduler = AnimationScheduler(pygame.Rect(0, 0, 100, 100), margin=0)
+        skeleton = make_skeleton(1000)
+        scheduler.add(skeleton, offscreen=CLOCK)
+        scheduler.update(0.5)
+        assert skeleton.animation_time == pytest.approx(0.5)
+        assert skeleton.get_bone("body").rotation == 0  # Kemikler hesaplanmadı
+    
+    def test_distant_lod_interval(self):
+        """Uzaktaki hedefler seyrek ve biriken süreyle güncellenmeli"""
+        scheduler = AnimationScheduler(pygame.Rect(0, 0, 1000, 100), margin=0,
+                                       lod_levels=[(300, 3)])
+        near = scheduler.add(Counter(495, 45)).target
+        far = scheduler.add(Counter(950, 45)).target
+        for _ in range(6):
+            scheduler.update(0.1)
+        assert len(near.calls) == 6
+        assert far.calls == pytest.approx([0.3, 0.3])
+    
+    def test_budget_defers_updates(self):
+        """Bütçe aşıldığında güncellemeler ertelenmeli ama atılmamalı"""
+        scheduler = AnimationScheduler(pygame.Rect(0, 0, 100, 100), budget=2)
+        targets = [scheduler.add(Counter(10 * i, 10)).target for i in range(3)]
+        scheduler.update(0.1)
+        assert scheduler.updated == 2 and scheduler.deferred == 1
+        scheduler.update(0.1)
+        
+        # Ertelenen hedef ilk sırada ve biriken süreyle güncellenir
+        assert sum(sum(t.calls) for t in targets) == pytest.approx(0.1 * 2 + 0.2 + 0.1)
+        assert all(t.calls for t in targets)
@@ -0,0 +1,53 @@
+import pytest
+import pygame
+from engine.graphics.animation import AnimationClip
+from engine.graphics.sprite_generator import SpriteGenerator, _clip_from_buffers, _clip_to_buffers
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Her testten önce üretim önbelleğini temizler"""
+    SpriteGenerator.clear_cache()
+    yield
+    SpriteGenerator.clear_cache()
+
+class TestSpriteGenerator:
+    """Prosedürel sprite üretimi test sınıfı"""
+    
+    def test_sprites_are_cached(self):
+        """Aynı parametreler aynı yüzeyi döndürmeli"""
+        first = SpriteGenerator.create_directional_sprites(16, 24, (200, 0, 0), (0, 0, 0))
+        second = SpriteGenerator.create_directional_sprites(16, 24, [200, 0, 0], (0, 0, 0))
+        assert all(first[d] is second[d] for d in first)
+        other = SpriteGenerator.create_character_sprite(16, 24, (0, 200, 0), (0, 0, 0))
+        assert other is not first['up']
+    
+    def test_animations_share_clips(self):
+        """Aynı renkli karakterler kareleri paylaşmalı, oynatma durumunu paylaşmamalı"""
+        first = SpriteGenerator.create_character_animations(16, 24, (200, 0, 0), (0, 0, 0))
+        second = SpriteGenerator.create_character_animations(16, 24, (200, 0, 0), (0, 0, 0))
+        assert first.animations["walk_up"].frames is second.animations["walk_up"].frames
+        first.update(0.1)
+        assert second.animations["walk_up"].current_frame == 0
+    
+    def test_parallel_variants_match_serial(self):
+        """Süreç havuzunda üretilen kareler yerel üretimle aynı olmalı"""
+        variants = [(16, 24, (200, 0, 0), (0, 0, 0)), (16, 24, (0, 0, 200), (255, 255, 255))]
+        parallel = SpriteGenerator.generate_character_variants(variants + variants[:1], workers=2)
+        assert parallel[0]["walk_left"] is not None
+        assert parallel[0]["walk_left"] is parallel[2]["walk_left"]
+        
+        SpriteGenerator.clear_cache()
+        serial = SpriteGenerator.generate_character_variants(variants, workers=0)
+        for expected, actual in zip(serial, parallel):
+            for name, clip in expected.items():
+                assert [pygame.image.tobytes(f, 'RGBA') for f in clip.frames] == \
+                       [pygame.image.tobytes(f, 'RGBA') for f in actual[name].frames]
+    
+    def test_clip_buffers_keep_settings(self):
+        """Süreçler arası taşınan klip ayarlarını korumalı"""
+        frame = pygame.Surface((4, 4), pygame.SRCALPHA)
+        frame.fill((1, 2, 3, 255))
+        clip = _clip_from_buffers(_clip_to_buffers(AnimationClip([frame], 0.25, loop=False)))
+        assert clip.loop is False
+        assert clip.frame_duration == 0.25
+        assert clip.frames[0].get_at((0, 0)) == pygame.Color(1, 2, 3, 255)
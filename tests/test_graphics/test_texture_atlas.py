@@ -0,0 +1,227 @@
+import pytest
+import pygame
+from engine.graphics.texture_atlas import TextureAtlas, MaxRectsPacker
+
+def make_surface(width, height, color=(255, 0, 0, 255)):
+    """Test için dolu bir yüzey oluşturur"""
+    surface = pygame.Surface((width, height), pygame.SRCALPHA)
+    surface.fill(color)
+    return surface
+
+class TestMaxRectsPacker:
+    """MaxRectsPacker test sınıfı"""
+    
+    def test_no_overlap(self):
+        """Yerleştirilen alanlar çakışmamalı"""
+        packer = MaxRectsPacker(128, 128)
+        rects = []
+        for size in [(64, 32), (32, 64), (48, 48), (16, 16), (40, 20)]:
+            placement = packer.insert(*size)
+            assert placement is not None
+            rects.append(placement[0])
+            
+        for i, a in enumerate(rects):
+            assert pygame.Rect(0, 0, 128, 128).contains(a)
+            for b in rects[i + 1:]:
+                assert not a.colliderect(b)
+                
+    def test_full_page(self):
+        """Dolu sayfa None döndürmeli"""
+        packer = MaxRectsPacker(64, 64)
+        for _ in range(4):
+            assert packer.insert(32, 32) is not None
+        assert packer.insert(32, 32) is None
+        assert packer.occupancy() == 1.0
+        
+    def test_rotation(self):
+        """Döndürme açıkken uzun texture yan yatırılarak sığmalı"""
+        packer = MaxRectsPacker(64, 16, allow_rotation=True)
+        rect, rotated = packer.insert(16, 64)
+        assert rotated
+        assert rect.size == (64, 16)
+
+class TestTextureAtlas:
+    """TextureAtlas test sınıfı"""
+    
+    def test_add_and_get_texture(self):
+        """Texture ekleme ve alma testi"""
+        atlas = TextureAtlas((64, 64))
+        region = atlas.add_texture("red", make_surface(16, 8))
+        assert region.page == 0
+        texture = atlas.get_texture("red")
+        assert texture.get_size() == (16, 8)
+        assert texture.get_at((0, 0)) == pygame.Color(255, 0, 0, 255)
+        
+    def test_overflow_to_new_page(self):
+        """Sayfa dolunca yeni sayfa açılmalı"""
+        atlas = TextureAtlas((32, 32))
+        first = atlas.add_texture("a", make_surface(32, 32))
+        second = atlas.add_texture("b", make_surface(16, 16))
+        assert first.page == 0
+        assert second.page == 1
+        assert atlas.page_count == 2
+        
+    def test_too_large_texture(self):
+        """Sayfadan büyük texture eklenememeli"""
+        atlas = TextureAtlas((32, 32))
+        assert atlas.add_texture("big", make_surface(64, 64)) is None
+        
+    def test_rotated_texture_roundtrip(self):
+        """Döndürülerek yerleşen texture orijinal yönüyle dönmeli"""
+        atlas = TextureAtlas((64, 16), allow_rotation=True)
+        surface = make_surface(16, 64)
+        surface.fill((0, 0, 255, 255), pygame.Rect(0, 0, 16, 8))
+        region = atlas.add_texture("tall", surface)
+        assert region.rotated
+        texture = atlas.get_texture("tall")
+        assert texture.get_size() == (16, 64)
+        assert texture.get_at((0, 0)) == pygame.Color(0, 0, 255, 255)
+        assert texture.get_at((0, 63)) == pygame.Color(255, 0, 0, 255)
+        
+    def test_sprite_handles(self):
+        """Sprite tutamaçları id ile erişilebilmeli ve önceden hesaplanmalı"""
+        atlas = TextureAtlas((64, 64))
+        atlas.add_texture("a", make_surface(8, 8))
+        atlas.add_texture("b", make_surface(16, 4, (0, 255, 0, 255)))
+        
+        handle_id = atlas.get_handle_id("b")
+        handle = atlas.get_handle(handle_id)
+        assert handle.name == "b"
+        assert handle.area.size == (16, 4)
+        assert handle.source is atlas.pages[0]
+        assert atlas.get_texture("b") is handle.surface
+        assert atlas.get_handle_by_name("missing") is None
+        
+        target = pygame.Surface((32, 32), pygame.SRCALPHA)
+        target.blits([(handle.source, (0, 0), handle.area), (handle.surface, (0, 10))], doreturn=False)
+        assert target.get_at((0, 0)) == pygame.Color(0, 255, 0, 255)
+        assert target.get_at((0, 10)) == pygame.Color(0, 255, 0, 255)
+        
+    def test_readded_texture_keeps_handle_id(self):
+        """Aynı isimle yeniden eklenen texture aynı id'yi korumalı"""
+        atlas = TextureAtlas((64, 64))
+        atlas.add_texture("a", make_surface(8, 8))
+        first_id = atlas.get_handle_id("a")
+        atlas.add_texture("a", make_surface(8, 8, (0, 0, 255, 255)))
+        assert atlas.get_handle_id("a") == first_id
+        assert atlas.get_texture("a").get_at((0, 0)) == pygame.Color(0, 0, 255, 255)
+        
+    def test_readded_texture_updates_handle(self):
+        """Yeniden eklenen texture var olan tutamaç nesnesini güncellemeli"""
+        atlas = TextureAtlas((64, 64))
+        atlas.add_texture("a", make_surface(8, 8))
+        handle = atlas.get_handle_by_name("a")
+        atlas.add_texture("a", make_surface(8, 8, (0, 0, 255, 255)))
+        assert atlas.get_handle_by_name("a") is handle
+        assert handle.surface.get_at((0, 0)) == pygame.Color(0, 0, 255, 255)
+        
+    def test_rotated_handle_blits_upright(self):
+        """Döndürülmüş bölgenin source/area çifti düz pikselleri çizmeli"""
+        atlas = TextureAtlas((64, 16), allow_rotation=True)
+        surface = make_surface(16, 64)
+        surface.fill((0, 0, 255, 255), pygame.Rect(0, 0, 16, 8))
+        atlas.add_texture("tall", surface)
+        handle = atlas.get_handle_by_name("tall")
+        assert handle.area.size == (16, 64)
+        
+        target = pygame.Surface((16, 64), pygame.SRCALPHA)
+        target.blits([(handle.source, (0, 0), handle.area)], doreturn=False)
+        assert target.get_at((0, 0)) == pygame.Color(0, 0, 255, 255)
+        assert target.get_at((0, 63)) == pygame.Color(255, 0, 0, 255)
+        
+    def test_add_textures_sorted(self):
+        """Sıralı toplu ekleme tüm texture'ları tek sayfaya sığdırmalı"""
+        atlas = TextureAtlas((64, 64))
+        textures = {
+            "small1": make_surface(16, 16),
+            "small2": make_surface(16, 16),
+            "wide": make_surface(64, 32),
+            "square": make_surface(32, 32),
+        }
+        regions = atlas.add_textures(textures)
+        assert all(region is not None for region in regions.values())
+        assert atlas.page_count == 1
+        
+    def test_save_load_pages(self, tmp_path):
+        """Çok sayfalı atlas kaydetme/yükleme testi"""
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        atlas = TextureAtlas((32, 32))
+        atlas.add_texture("a", make_surface(32, 32))
+        atlas.add_texture("b", make_surface(8, 8, (0, 255, 0, 255)))
+        atlas.save(str(tmp_path / "atlas.png"), str(tmp_path / "atlas.json"))
+        assert (tmp_path / "atlas_1.png").exists()
+        
+        loaded = TextureAtlas.load(str(tmp_path / "atlas.png"), str(tmp_path / "atlas.json"))
+        assert loaded.page_count == 2
+        assert loaded.get_region("b").page == 1
+        assert loaded.get_texture("b").get_at((0, 0)) == pygame.Color(0, 255, 0, 255)
+
+class TestAtlasBaking:
+    """TextureManager.bake_directory test sınıfı"""
+    
+    @pytest.fixture
+    def source_dir(self, tmp_path):
+        """İki sayfaya bölünecek kaynak PNG dizini"""
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        source = tmp_path / "src"
+        source.mkdir()
+        pygame.image.save(make_surface(32, 32), str(source / "a.png"))
+        pygame.image.save(make_surface(32, 32, (0, 255, 0, 255)), str(source / "b.png"))
+        return source
+        
+    def count_source_loads(self, mocker, source_dir):
+        """Kaynak dizinden yapılan image.load çağrılarını sayar"""
+        spy = mocker.spy(pygame.image, "load")
+        return lambda: sum(1 for call in spy.call_args_list if str(source_dir) in str(call.args[0]))
+        
+    def test_rebake_unchanged_uses_baked_atlas(self, source_dir, tmp_path, mocker):
+        """Değişmeyen kaynaklar yeniden çözülmemeli"""
+        from engine.graphics.texture_atlas import TextureManager
+        out = tmp_path / "out"
+        out.mkdir()
+        TextureManager().bake_directory(str(source_dir), "tiles", str(out), size=(32, 32))
+        
+        source_loads = self.count_source_loads(mocker, source_dir)
+        atlas = TextureManager().bake_directory(str(source_dir), "tiles", str(out), size=(32, 32))
+        assert source_loads() == 0
+        assert atlas.page_count == 2
+        assert set(atlas.sources) == {"a", "b"}
+        
+    def test_rebake_changed_file_rebuilds_its_page(self, source_dir, tmp_path, mocker):
+        """Yalnızca değişen dosyanın sayfası yeniden oluşturulmalı"""
+        from engine.graphics.texture_atlas import TextureManager
+        out = tmp_path / "out"
+        out.mkdir()
+        first = TextureManager().bake_directory(str(source_dir), "tiles", str(out), size=(32, 32))
+        changed_page = first.get_region("b").page
+        kept_page = first.get_region("a").page
+        
+        pygame.image.save(make_surface(32, 32, (0, 0, 255, 255)), str(source_dir / "b.png"))
+        source_loads = self.count_source_loads(mocker, source_dir)
+        atlas = TextureManager().bake_directory(str(source_dir), "tiles", str(out), size=(32, 32))
+        
+        assert source_loads() == 1
+        assert atlas.get_region("a").page == kept_page
+        assert atlas.get_region("b").page == changed_page
+        assert atlas.get_texture("b").get_at((0, 0)) == pygame.Color(0, 0, 255, 255)
+        assert atlas.get_texture("a").get_at((0, 0)) == pygame.Color(255, 0, 0, 255)
+
+class TestTextureManager:
+    """TextureManager test sınıfı"""
+    
+    @pytest.mark.parametrize("workers", [1, 4])
+    def test_load_directory(self, tmp_path, workers):
+        """Dizin yükleme sıralı ve paralel çözmede aynı sonucu vermeli"""
+        from engine.graphics.texture_atlas import TextureManager
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        for i in range(8):
+            pygame.image.save(make_surface(16, 16, (i * 30, 0, 0, 255)), str(tmp_path / f"tile{i}.png"))
+            
+        manager = TextureManager(decode_workers=workers)
+        atlas = manager.load_directory(str(tmp_path), "tiles")
+        assert len(atlas.regions) == 8
+        assert atlas.get_texture("tile3").get_at((0, 0)) == pygame.Color(90, 0, 0, 255)
+        assert set(manager.last_load_timings) == {"decode", "convert", "pack", "total"}
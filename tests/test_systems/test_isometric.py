@@ -70,6 +70,25 @@ class TestTileMap:
         tile_map.set_tile(5, 5, test_tile)
         assert tile_map.get_tile(5, 5) == test_tile
         
+    def test_tile_surface_uses_handle(self):
+        """Tile yüzeyi her erişimde aynı önceden hesaplanmış nesne olmalı"""
+        atlas = TextureAtlas((64, 64))
+        atlas.add_texture("grass", pygame.Surface((32, 16)))
+        tile = Tile(atlas=atlas, region_name="grass", tile_type="grass")
+        assert tile.surface is tile.surface
+        assert tile.handle.id == atlas.get_handle_id("grass")
+        
+    def test_tile_follows_readded_region(self):
+        """Bölge yeniden eklenince tile yeni pikselleri kullanmalı"""
+        atlas = TextureAtlas((64, 64))
+        atlas.add_texture("grass", pygame.Surface((32, 16)))
+        tile = Tile(atlas=atlas, region_name="grass", tile_type="grass")
+        tile.surface
+        replacement = pygame.Surface((32, 16))
+        replacement.fill((0, 255, 0))
+        atlas.add_texture("grass", replacement)
+        assert tile.surface.get_at((0, 0)) == pygame.Color(0, 255, 0)
+        
     def test_is_valid_position(self, tile_map):
         """Geçerli pozisyon kontrolü testi"""
         assert tile_map.is_valid_position(0, 0)
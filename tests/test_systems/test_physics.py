@@ -1,6 +1,8 @@
+import sys
 import pytest
+import numpy as np
 import pymunk
-from engine.systems.physics import PhysicsSystem, PhysicsBody
+from engine.systems.physics import PhysicsSystem, PhysicsBody, CollisionEventQueue, PhysicsSnapshot
 
 @pytest.fixture
 def physics_system():
@@ -139,4 +141,556 @@ class TestPhysicsSystem:
         body1.position = (0, 0)
         body2.position = (15, 0)  # Yarıçaplar toplamından az mesafe
         
-        physics_system.update(0.1)  # Çarpışma kontrolü için güncelle 
\ No newline at end of file
+        physics_system.update(0.1)  # Çarpışma kontrolü için güncelle 
+
+class TestFixedStep:
+    def test_accumulator_carries_time(self, physics_system):
+        """Sabit adımdan kısa kareler biriktirilmeli"""
+        physics_system.update(1 / 120.0)
+        assert physics_system.steps_taken == 0
+        physics_system.update(1 / 120.0)
+        assert physics_system.steps_taken == 1
+        assert physics_system.accumulator == pytest.approx(0.0, abs=1e-9)
+
+    def test_quiet_scene_single_substep(self, physics_system):
+        """Hareketsiz sahnede alt adım yapılmamalı"""
+        physics_system.create_body("idle")
+        physics_system.update(1 / 60.0)
+        assert physics_system.substeps == 1
+        assert physics_system.steps_taken == 1
+
+    def test_fast_body_substeps(self, physics_system):
+        """Hızlı gövdeler için alt adım sayısı artmalı"""
+        body = physics_system.create_body("bullet")
+        body.body.velocity = (1200, 0)  # Adım başına 20 piksel
+        physics_system.update(1 / 60.0)
+        assert physics_system.substeps == 4
+        assert physics_system.steps_taken == 4
+
+    def test_step_budget(self):
+        """Kare başına adım bütçesi aşılmamalı, fazla zaman atılmalı"""
+        physics = PhysicsSystem(max_steps=3, step_budget=6)
+        body = physics.create_body("bullet")
+        body.body.velocity = (6000, 0)
+        physics.update(0.2)
+        assert physics.steps_taken == 6
+        assert physics.substeps == 2
+        assert physics.dropped_time == pytest.approx(0.2 - 3 / 60.0)
+        assert physics.accumulator < physics.fixed_dt
+
+    def test_steps_over_budget(self):
+        """Sabit adım sayısı bütçeyi aşınca adımlar bütçeyle sınırlanmalı"""
+        physics = PhysicsSystem(max_steps=10, step_budget=4)
+        physics.create_body("idle")
+        physics.update(10 / 60.0)
+        assert physics.steps_taken == 4
+        assert physics.substeps == 1
+        assert physics.dropped_time == pytest.approx(6 / 60.0)
+        assert physics.accumulator < physics.fixed_dt
+
+class TestDeferredForces:
+    def test_apply_force_does_not_step(self, physics_system):
+        """Kuvvet uygulamak simülasyonu ilerletmemeli"""
+        body = physics_system.create_body("box")
+        body.body.velocity = (100, 0)
+        for _ in range(5):
+            body.apply_force((1000, 0))
+        assert body.position == (0, 0)
+        assert body.body.velocity.x == 100
+
+    def test_forces_applied_on_update(self, physics_system):
+        """Biriken kuvvetler sonraki güncellemenin her adımında uygulanmalı"""
+        body = physics_system.create_body("box")
+        body.apply_force((30, 0))
+        body.apply_force((30, 0))
+        physics_system.update(2 / 60.0)
+        # F = 60 N, m = 1 kg, t = 2/60 s -> v = 2
+        assert body.body.velocity.x == pytest.approx(2.0)
+        assert physics_system.pending_bodies == []
+
+        physics_system.update(1 / 60.0)
+        assert body.body.velocity.x == pytest.approx(2.0)  # Kuvvet tek güncellemelik
+
+    def test_forces_wait_for_step(self, physics_system):
+        """Adım yapılmayan güncellemede kuvvetler korunmalı"""
+        body = physics_system.create_body("box")
+        body.apply_impulse((5, 0))
+        physics_system.update(1 / 240.0)
+        assert body.body.velocity.x == 0
+        physics_system.update(1 / 60.0)
+        assert body.body.velocity.x == pytest.approx(5.0)
+
+    def test_apply_forces_bulk(self, physics_system):
+        """Toplu kuvvet API'si isimle eşleşen gövdelere uygulamalı"""
+        a = physics_system.create_body("a")
+        b = physics_system.create_body("b")
+        physics_system.apply_forces(["a", "b", "missing"], [(60, 0), (0, 120), (1, 1)])
+        physics_system.update(1 / 60.0)
+        assert a.body.velocity == pytest.approx((1.0, 0.0))
+        assert b.body.velocity == pytest.approx((0.0, 2.0))
+
+    def test_force_independent_of_frame_rate(self):
+        """Her kare uygulanan sabit kuvvet kare hızından bağımsız aynı hızı vermeli"""
+        velocities = []
+        for fps in (30, 60, 240):
+            physics = PhysicsSystem()
+            body = physics.create_body("box")
+            for _ in range(fps):
+                body.apply_force((60, 0))
+                physics.update(1.0 / fps)
+            velocities.append(body.body.velocity.x)
+        # F = 60 N, m = 1 kg, t = 1 s -> v = 60
+        assert velocities == pytest.approx([60.0] * 3)
+
+class TestBulkBodies:
+    def test_create_bodies(self, physics_system):
+        """Dizilerden toplu gövde oluşturma"""
+        positions = np.array([[0, 0], [10, 20], [30, 40]])
+        bodies = physics_system.create_bodies(["a", "b", "c"], positions)
+        assert len(bodies) == 3
+        assert len(physics_system.space.bodies) == 3
+        assert len(physics_system.space.shapes) == 3
+        assert physics_system.get_body("b").position == (10, 20)
+
+    def test_state_export(self, physics_system):
+        """Konum, hız ve açılar tek dizide dönmeli"""
+        physics_system.create_bodies(["a", "b"], [(1, 2), (3, 4)], size=None)
+        physics_system.get_body("b").body.velocity = (5, 6)
+        physics_system.get_body("a").angle = 0.5
+        assert len(physics_system.space.shapes) == 0
+
+        positions = physics_system.get_positions()
+        assert positions.tolist() == [[1, 2], [3, 4]]
+        assert physics_system.get_velocities().tolist() == [[0, 0], [5, 6]]
+        assert physics_system.get_angles().tolist() == [0.5, 0]
+
+        out = np.zeros((2, 2))
+        assert physics_system.get_positions(out) is out
+        assert out.tolist() == [[1, 2], [3, 4]]
+
+    def test_rows_follow_names_after_remove(self, physics_system):
+        """Silmeden sonra satırlar body_names ile eşleşmeli"""
+        physics_system.create_bodies(["a", "b", "c"], [(1, 0), (2, 0), (3, 0)])
+        physics_system.remove_body("a")
+        positions = physics_system.get_positions()
+        assert physics_system.body_names == ["c", "b"]
+        assert positions[:, 0].tolist() == [3, 2]
+
+    def test_recreate_same_name(self, physics_system):
+        """Aynı isimle oluşturma eski gövdeyi değiştirmeli"""
+        physics_system.create_body("a")
+        physics_system.create_body("a")
+        assert len(physics_system.space.bodies) == 1
+        assert physics_system.body_names == ["a"]
+
+    def test_duplicate_names_rejected(self):
+        """Aynı isim tek çağrıda iki kez verilirse hata vermeli, sistem değişmemeli"""
+        physics = PhysicsSystem()
+        with pytest.raises(ValueError):
+            physics.create_bodies(["x", "x"], [(0, 0), (10, 0)])
+        assert physics.body_names == []
+        assert len(physics.space.bodies) == 0
+
+    def test_position_count_mismatch(self):
+        """Konum sayısı isim sayısıyla uyuşmazsa hata vermeli, sistem değişmemeli"""
+        physics = PhysicsSystem()
+        with pytest.raises(ValueError):
+            physics.create_bodies(["a", "b", "c"], [(0, 0)])
+        with pytest.raises(ValueError):
+            physics.create_bodies(["a"], [(0, 0, 0)])
+        assert physics.body_names == []
+        assert len(physics.space.bodies) == 0
+
+    def test_existing_names_replaced(self):
+        """Sistemde var olan isimler yeni gövdeyle değiştirilmeli"""
+        physics = PhysicsSystem()
+        old = physics.create_body("x")
+        new = physics.create_bodies(["x"], [(10, 0)])[0]
+        assert physics.get_body("x") is new
+        assert old.body not in physics.space.bodies
+        assert physics.shape_count == 1
+
+class TestBroadphase:
+    def test_hash_params_from_shapes(self, physics_system):
+        """Hücre boyutu şekil boyutlarından, sayısı şekil sayısından hesaplanmalı"""
+        physics_system.create_bodies([f"b{i}" for i in range(200)],
+                                     [(i * 20, 0) for i in range(200)], size=(16, 16))
+        dim, count = physics_system.compute_hash_params()
+        assert dim == pytest.approx(16)
+        assert count == 2000
+
+    def test_hash_mode_retunes(self):
+        """Gövde sayısı çok değiştiğinde hash yeniden ayarlanmalı"""
+        physics = PhysicsSystem(broadphase="hash")
+        assert physics.hash_tunes == 1
+        physics.create_bodies([f"b{i}" for i in range(50)], [(i * 20, 0) for i in range(50)])
+        physics.update(1 / 60.0)
+        assert physics.hash_tunes == 2
+        assert physics.hash_params == (pytest.approx(10), 1000)
+        physics.update(1 / 60.0)
+        assert physics.hash_tunes == 2
+
+    def test_hash_matches_tree(self):
+        """Uzamsal hash ile çarpışmalar ağaçla aynı çözülmeli"""
+        gaps = []
+        for mode in ("tree", "hash"):
+            physics = PhysicsSystem(broadphase=mode)
+            a, b = physics.create_bodies(["a", "b"], [(0, 0), (8, 0)])
+            for _ in range(3):
+                physics.update(1 / 60.0)
+            gaps.append(b.position[0] - a.position[0])
+        assert gaps[0] > 8
+        assert gaps[1] == pytest.approx(gaps[0])
+
+    def test_shape_count_ignores_unadded_shapes(self):
+        """Uzaya eklenmemiş şekiller kaldırılırken sayılmamalı"""
+        physics = PhysicsSystem()
+        body = physics.create_body("a")
+        body.add_circle_shape(3)
+        physics.remove_body("a")
+        assert physics.shape_count == 0 == len(physics.space.shapes)
+
+    def test_cannot_switch_back(self):
+        """Hash'ten ağaca dönüş hata vermeli"""
+        physics = PhysicsSystem(broadphase="hash")
+        with pytest.raises(ValueError):
+            physics.set_broadphase("tree")
+
+@pytest.mark.skipif(sys.platform == "win32", reason="pymunk threaded space Windows'ta yok")
+class TestThreadedPhysics:
+    def test_threshold(self):
+        """Eşiğin altındaki sahneler tek iş parçacığıyla adımlanmalı"""
+        physics = PhysicsSystem(threads=4, thread_threshold=10)
+        assert physics.threads == 2
+        physics.create_bodies([f"b{i}" for i in range(5)], [(i * 20, 0) for i in range(5)])
+        physics.update(1 / 60.0)
+        assert physics.active_threads == 1
+
+        physics.create_bodies([f"c{i}" for i in range(5)], [(i * 20, 50) for i in range(5)])
+        physics.update(1 / 60.0)
+        assert physics.active_threads == 2
+
+    def test_threaded_matches_single(self):
+        """İş parçacıklı adım aynı sahnede benzer sonuç vermeli"""
+        results = []
+        for threads in (1, 2):
+            physics = PhysicsSystem(threads=threads, thread_threshold=0)
+            physics.set_gravity(0, 100)
+            physics.create_bodies(["a"], [(0, 0)])
+            physics.update(0.5)
+            results.append(physics.get_body("a").position)
+        assert results[1] == pytest.approx(results[0])
+
+class TestCollisionEvents:
+    def make_pair(self, physics):
+        """Çakışan iki gövde oluşturur"""
+        a, b = physics.create_bodies(["a", "b"], [(0, 0), (8, 0)])
+        a.shapes[0].collision_type = 1
+        b.shapes[0].collision_type = 2
+        return a, b
+
+    def test_events_batched_after_step(self):
+        """Olaylar adım sonrasında toplu olarak okunabilmeli"""
+        physics = PhysicsSystem()
+        queue = physics.enable_collision_events(post_solve=True)
+        a, b = self.make_pair(physics)
+        physics.update(1 / 60.0)
+
+        arrays = queue.as_arrays()
+        assert list(arrays['kinds']) == [CollisionEventQueue.BEGIN, CollisionEventQueue.POST_SOLVE]
+        assert arrays['points'].shape == (2, 2)
+        names = {physics.get_body_name(shape.body) for shape in queue.shapes_a + queue.shapes_b}
+        assert names == {"a", "b"}
+
+    def test_cleared_each_update(self):
+        """Kuyruk her güncellemede temizlenmeli"""
+        physics = PhysicsSystem()
+        queue = physics.enable_collision_events()
+        a, b = self.make_pair(physics)
+        physics.update(1 / 60.0)
+        assert len(queue) == 1
+
+        b.position = (200, 0)
+        physics.update(1 / 60.0)
+        assert list(queue.kinds) == [CollisionEventQueue.SEPARATE]
+
+    def test_type_filter(self):
+        """Tip çifti ve seçim filtreleri uygulanmalı"""
+        physics = PhysicsSystem()
+        queue = physics.enable_collision_events(1, 3)
+        self.make_pair(physics)
+        physics.update(1 / 60.0)
+        assert len(queue) == 0
+
+        physics.enable_collision_events(1, 2)
+        physics.create_bodies(["c", "d"], [(100, 0), (108, 0)])
+        physics.get_body("c").shapes[0].collision_type = 1
+        physics.get_body("d").shapes[0].collision_type = 2
+        physics.update(1 / 60.0)
+        assert len(queue.select(CollisionEventQueue.BEGIN, collision_type=2)) == 1
+        assert len(queue.select(collision_type=3)) == 0
+
+class TestSnapshot:
+    def make_scene(self):
+        """Yerçekimli ve hareketli küçük bir sahne kurar"""
+        physics = PhysicsSystem()
+        physics.set_gravity(0, 100)
+        bodies = physics.create_bodies(["a", "b", "c"], [(0, 0), (30, 0), (60, 0)])
+        for index, body in enumerate(bodies):
+            body.body.velocity = (index * 10, 0)
+            body.body.angular_velocity = index
+        return physics
+
+    def test_snapshot_layout(self):
+        """Anlık görüntü gövde başına bir satır içermeli"""
+        physics = self.make_scene()
+        snapshot = physics.snapshot()
+        assert isinstance(snapshot, PhysicsSnapshot)
+        assert len(snapshot) == 3
+        assert snapshot.data.shape == (3, PhysicsSnapshot.FIELDS)
+        assert snapshot.data[2, :6].tolist() == [60, 0, 20, 0, 0, 2]
+
+    def test_rollback_replays_identically(self):
+        """Geri sarıp aynı adımları tekrarlamak aynı sonucu vermeli"""
+        physics = self.make_scene()
+        snapshot = physics.snapshot()
+        for _ in range(10):
+            physics.update(1 / 60.0)
+        expected = physics.get_positions().copy()
+
+        physics.restore(snapshot)
+        assert physics.get_positions().tolist() == snapshot.data[:, :2].tolist()
+        for _ in range(10):
+            physics.update(1 / 60.0)
+        assert physics.get_positions().tolist() == expected.tolist()
+
+    def test_restore_by_name(self):
+        """Gövde sırası değişince isimle eşleştirilmeli"""
+        physics = self.make_scene()
+        snapshot = physics.snapshot()
+        physics.remove_body("a")
+        physics.get_body("c").position = (500, 500)
+        physics.restore(snapshot)
+        assert physics.get_body("c").position == (60, 0)
+        assert "a" not in physics.bodies
+
+    def test_restore_clears_pending(self):
+        """Geri yükleme bekleyen kuvvetleri silmeli"""
+        physics = self.make_scene()
+        snapshot = physics.snapshot()
+        physics.get_body("a").apply_impulse((1000, 0))
+        physics.restore(snapshot)
+        assert physics.pending_bodies == []
+
+    def test_sleep_state(self):
+        """Uyuyan gövdeler uyku durumunda geri yüklenmeli"""
+        physics = PhysicsSystem()
+        physics.space.sleep_time_threshold = 0.1
+        body = physics.create_body("a")
+        body.body.sleep()
+        snapshot = physics.snapshot()
+        body.body.activate()
+        physics.restore(snapshot)
+        assert snapshot.data[0, 6] == 1.0
+        assert body.body.is_sleeping
+
+class TestCollisionLayers:
+    def test_layer_bits(self):
+        """Her katman ayrı bir kategori biti almalı"""
+        physics = PhysicsSystem()
+        assert physics.add_layer("player") == 1
+        assert physics.add_layer("item") == 2
+        assert physics.add_layer("player") == 1
+        assert physics.layers_collide("player", "item")
+
+    def test_layer_limit(self):
+        """32'den fazla katman hata vermeli"""
+        physics = PhysicsSystem()
+        for index in range(PhysicsSystem.MAX_LAYERS):
+            physics.add_layer(f"layer{index}")
+        with pytest.raises(ValueError):
+            physics.add_layer("extra")
+
+    def test_filter_applied_to_shapes(self):
+        """Katman filtresi ve çarpışma tipi şekillere uygulanmalı"""
+        physics = PhysicsSystem()
+        physics.add_layer("enemy", collision_type=4)
+        physics.set_layer_collision("enemy", "enemy", False)
+        body = physics.create_body("e", layer="enemy")
+        shape = body.shapes[0]
+        assert shape.filter.categories == physics.layers["enemy"]
+        assert not shape.filter.mask & physics.layers["enemy"]
+        assert shape.collision_type == 4
+
+        # Sonradan eklenen şekiller ve değişen matris de uygulanmalı
+        extra = body.add_circle_shape(3)
+        assert extra.filter == shape.filter
+        physics.set_layer_collision("enemy", "enemy", True)
+        assert body.shapes[0].filter.mask & physics.layers["enemy"]
+
+    def test_filtered_bodies_pass_through(self):
+        """Çarpışmayan katmanlardaki gövdeler birbirinden geçmeli"""
+        physics = PhysicsSystem()
+        physics.set_layer_matrix({"ghost": ["wall"], "wall": ["ghost", "wall"], "player": ["wall"]})
+        physics.create_body("a", layer="ghost")
+        physics.create_body("b", layer="player")
+        assert not physics.layers_collide("ghost", "player")
+        physics.update(1 / 60.0)
+        assert physics.get_body("a").position == (0, 0)
+        assert physics.get_body("b").position == (0, 0)
+
+    def test_count_filtered_pairs(self):
+        """Filtrelerin elediği çiftler sayılmalı"""
+        physics = PhysicsSystem()
+        physics.set_layer_collision("ghost", "ghost", False)
+        physics.create_bodies(["a", "b", "c"], [(0, 0), (5, 0), (8, 0)], layer="ghost")
+        physics.create_body("d").position = (3, 0)
+        physics.space.reindex_shapes_for_body(physics.get_body("d").body)
+        candidates, filtered = physics.count_filtered_pairs()
+        assert candidates == 6
+        assert filtered == 3
+        assert physics.filtered_pairs == 3
+
+    def test_body_layer_change(self):
+        """Katman değişince filtre güncellenmeli"""
+        physics = PhysicsSystem()
+        physics.set_layer_collision("a", "b", False)
+        physics.create_body("x", layer="a")
+        physics.set_body_layer("x", "b")
+        assert physics.get_body("x").shapes[0].filter.categories == physics.layers["b"]
+
+    def test_unknown_layer_lookup(self):
+        """Katman sorguları bilinmeyen katmanı tanımlamamalı"""
+        physics = PhysicsSystem()
+        physics.add_layer("player")
+        with pytest.raises(KeyError):
+            physics.get_layer_filter("playr")
+        with pytest.raises(KeyError):
+            physics.layers_collide("player", "playr")
+        assert list(physics.layers) == ["player"]
+
+        # Gövdeye atanan katman ise tanımlanmalı
+        physics.create_body("e", layer="enemy")
+        assert physics.layers_collide("player", "enemy")
+
+class TestBatchQueries:
+    def make_scene(self):
+        """Yatay eksende iki gövdeli sahne kurar"""
+        physics = PhysicsSystem()
+        physics.create_bodies(["a", "b"], [(50, 0), (100, 0)])
+        physics.update(1 / 60.0)
+        return physics
+
+    def test_raycast(self):
+        """Her ışın ilk isabetini döndürmeli"""
+        physics = self.make_scene()
+        result = physics.raycast([(0, 0), (200, 0), (0, 50)], [(200, 0), (0, 0), (200, 50)])
+        assert result['hit'].tolist() == [True, True, False]
+        assert result['rows'].tolist() == [0, 1, -1]
+        assert result['points'][0].tolist() == pytest.approx([45, 0])
+        assert result['normals'][1].tolist() == pytest.approx([1, 0])
+        assert result['alpha'][2] == 1.0
+
+    def test_raycast_layer_filter(self):
+        """Sorgu filtresinin çarpışmadığı katmanlar atlanmalı"""
+        physics = self.make_scene()
+        physics.set_layer_collision("ray", "ghost", False)
+        physics.set_body_layer("a", "ghost")
+        result = physics.raycast([(0, 0)], [(200, 0)], shape_filter="ray")
+        assert result['rows'].tolist() == [1]
+
+    def test_point_query(self):
+        """Her noktaya en yakın gövde bulunmalı"""
+        physics = self.make_scene()
+        result = physics.point_query([(48, 0), (112, 0), (500, 500)], max_distance=10)
+        assert result['hit'].tolist() == [True, True, False]
+        assert result['rows'].tolist() == [0, 1, -1]
+        assert result['distances'][0] < 0
+        assert result['distances'][1] == pytest.approx(7)
+
+    def test_bb_query(self):
+        """Kutu sonuçları ofset dizisiyle ayrılmalı"""
+        physics = self.make_scene()
+        result = physics.bb_query([(40, -10, 110, 10), (0, 0, 1, 1), (95, -1, 96, 1)])
+        offsets = result['offsets'].tolist()
+        assert offsets == [0, 2, 2, 3]
+        assert result['rows'].tolist() == [0, 1, 1]
+
+    def test_query_cache(self):
+        """Özdeş sorgular aynı karede önbellekten dönmeli"""
+        physics = self.make_scene()
+        physics.enable_query_cache()
+        first = physics.raycast([(0, 0)], [(200, 0)])
+        assert physics.raycast([(0, 0)], [(200, 0)]) is first
+        assert physics.raycast([(0, 0)], [(200, 0)], shape_filter=pymunk.ShapeFilter(categories=2)) is not first
+        assert physics.query_cache_hits == 1
+
+        physics.update(1 / 60.0)
+        assert physics.raycast([(0, 0)], [(200, 0)]) is not first
+
+    def test_unknown_layer_not_created(self):
+        """Bilinmeyen katman adıyla sorgu hata vermeli, katman tanımlamamalı"""
+        physics = self.make_scene()
+        with pytest.raises(KeyError):
+            physics.raycast([(0, 0)], [(200, 0)], shape_filter="typo")
+        assert physics.layers == {}
+
+    def test_query_cache_invalidated_by_body_changes(self):
+        """Gövde satırları değişince önbellek temizlenmeli"""
+        physics = self.make_scene()
+        physics.enable_query_cache()
+        assert physics.raycast([(0, 0)], [(200, 0)])['rows'].tolist() == [0]
+
+        physics.remove_body("a")
+        result = physics.raycast([(0, 0)], [(200, 0)])
+        assert result['rows'].tolist() == [0]
+        assert physics.body_names[0] == "b"
+        assert result['points'][0].tolist() == pytest.approx([95, 0])
+
+        snapshot = physics.snapshot()
+        physics.create_body("c").position = (500, 500)
+        assert physics.query_cache == {}
+        physics.raycast([(0, 0)], [(200, 0)])
+        physics.restore(snapshot)
+        assert physics.query_cache == {}
+        physics.raycast([(0, 0)], [(200, 0)])
+        physics.set_body_layer("b", "ghost")
+        assert physics.query_cache == {}
+
+    def test_batch_matches_space_queries(self):
+        """Toplu sorgular tek tek pymunk sorgularıyla aynı sonucu vermeli"""
+        physics = PhysicsSystem()
+        physics.create_bodies([f"b{i}" for i in range(20)], [(i * 15, (i % 3) * 10) for i in range(20)])
+        physics.remove_body("b3")
+        physics.space.add(pymunk.Segment(physics.space.static_body, (0, 40), (300, 40), 1))
+        starts = np.array([(x, -20.0) for x in range(0, 400, 7)])
+        ends = starts + (5.0, 80.0)
+        everything = pymunk.ShapeFilter()
+        
+        rays = physics.raycast(starts, ends)
+        points = physics.point_query(ends, max_distance=8)
+        for index, (start, end) in enumerate(zip(starts.tolist(), ends.tolist())):
+            info = physics.space.segment_query_first(start, end, 0.0, everything)
+            name = physics.get_body_name(info.shape.body) if info else None
+            assert rays['hit'][index] == (info is not None)
+            assert rays['rows'][index] == (physics.body_names.index(name) if name else -1)
+            if info:
+                assert rays['points'][index].tolist() == pytest.approx(list(info.point))
+                assert rays['normals'][index].tolist() == pytest.approx(list(info.normal))
+                assert rays['alpha'][index] == pytest.approx(info.alpha)
+                
+            info = physics.space.point_query_nearest(end, 8, everything)
+            name = physics.get_body_name(info.shape.body) if info else None
+            assert points['rows'][index] == (physics.body_names.index(name) if name else -1)
+            if info:
+                assert points['distances'][index] == pytest.approx(info.distance)
+        assert rays['hit'].any() and not rays['hit'].all()
+        assert -1 in rays['rows'][rays['hit']]  # Sisteme kayıtlı olmayan duvar
+        
+    def test_rows_for_shapes_added_later(self):
+        """Kayıttan sonra eklenen şekiller gövdenin satırını vermeli"""
+        physics = self.make_scene()
+        assert physics.raycast([(300, -50)], [(300, 50)])['rows'].tolist() == [-1]
+        body = physics.get_body("b")
+        physics.space.add(body.add_circle_shape(5, offset=(200, 0)))
+        assert physics.raycast([(300, -50)], [(300, 50)])['rows'].tolist() == [1]
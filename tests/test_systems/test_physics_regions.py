@@ -0,0 +1,115 @@
+import pytest
+from engine.systems.physics_regions import RegionalPhysicsSystem
+
+class TestRegionalPhysics:
+    def test_bodies_placed_by_position(self):
+        """Gövdeler konumlarının bulunduğu bölgeye eklenmeli"""
+        regional = RegionalPhysicsSystem(region_size=100)
+        regional.create_body("a", (50, 50))
+        regional.create_body("b", (-50, 250))
+        assert regional.body_regions == {"a": (0, 0), "b": (-1, 2)}
+        assert regional.get_body("b").position == (-50, 250)
+    
+    def test_interval_by_distance(self):
+        """Uzak bölgeler seyrek güncellenmeli, çok uzaktakiler uyumalı"""
+        regional = RegionalPhysicsSystem(lod_levels=[(100, 2), (200, 4)], sleep_distance=500)
+        assert regional.get_interval(0) == 1
+        assert regional.get_interval(150) == 2
+        assert regional.get_interval(300) == 4
+        assert regional.get_interval(600) == 0
+    
+    def test_far_regions_step_less(self):
+        """Uzak bölge aynı süreyi daha az adımla ilerletmeli"""
+        regional = RegionalPhysicsSystem(region_size=100, lod_levels=[(150, 4)],
+                                         sleep_distance=1000, handoff_margin=1000)
+        regional.set_gravity(0, 100)
+        regional.create_body("near", (50, 50))
+        regional.create_body("far", (550, 50))
+        regional.set_focus(50, 50)
+        
+        total_steps = 0
+        for _ in range(16):
+            regional.update(1 / 60.0)
+            total_steps += regional.steps_taken
+        assert total_steps <= 16 + 4
+        
+        # Uzak bölge en fazla bir aralık kadar geride kalmalı
+        near_speed = regional.get_body("near").body.velocity.y
+        far_speed = regional.get_body("far").body.velocity.y
+        assert near_speed == pytest.approx(16 / 60.0 * 100)
+        assert 0 < far_speed <= near_speed
+        assert near_speed - far_speed <= 4 / 60.0 * 100 + 1e-6
+    
+    def test_sleeping_region_frozen(self):
+        """Uyuyan bölgedeki gövdeler hareket etmemeli"""
+        regional = RegionalPhysicsSystem(region_size=100, sleep_distance=200)
+        regional.set_gravity(0, 100)
+        regional.create_body("far", (950, 50))
+        regional.set_focus(0, 0)
+        regional.update(1 / 60.0)
+        assert regional.sleeping == 1
+        assert regional.get_body("far").position == (950, 50)
+    
+    def test_handoff(self):
+        """Sınırı aşan gövde yeni bölgeye taşınmalı"""
+        regional = RegionalPhysicsSystem(region_size=100, handoff_margin=5)
+        body = regional.create_body("a", (95, 50))
+        body.body.velocity = (420, 0)
+        regional.update(1 / 60.0)
+        assert regional.handoffs == 0
+        regional.update(1 / 60.0)
+        assert regional.handoffs == 1
+        assert regional.body_regions["a"] == (1, 0)
+        assert "a" in regional.regions[(1, 0)].physics.bodies
+        assert "a" not in regional.regions[(0, 0)].physics.bodies
+        assert regional.get_body("a").body.velocity.x == pytest.approx(420)
+    
+    def test_handoff_with_pending_force(self):
+        """Bekleyen kuvvetle taşınan gövde eski bölgenin kuyruğundan çıkmalı"""
+        regional = RegionalPhysicsSystem(region_size=100, handoff_margin=5)
+        regional.create_body("anchor", (20, 20))
+        body = regional.create_body("a", (50, 50))
+        old = regional.get_region((0, 0)).physics
+        body.position = (150, 50)
+        body.apply_force((60, 0))
+        regional.update(1 / 240.0)  # Adım yok, kuvvet beklerken taşınır
+        assert regional.body_regions["a"] == (1, 0)
+        assert body not in old.pending_bodies
+        
+        # Yeni kuvvet yalnızca yeni bölgede uygulanmalı
+        body.apply_force((60, 0))
+        regional.update(1 / 60.0)
+        assert body not in old.pending_bodies
+        assert body.body.velocity.x == pytest.approx(1.0)
+    
+    def test_remove_and_clear(self):
+        """Gövde kaldırma ve temizleme bölgeleri güncellemeli"""
+        regional = RegionalPhysicsSystem()
+        regional.create_body("a", (0, 0))
+        regional.create_body("b", (5000, 0))
+        regional.remove_body("a")
+        assert regional.get_body("a") is None
+        regional.clear()
+        assert regional.regions == {}
+    
+    def test_layers_shared_by_regions(self):
+        """Katman ayarları tüm bölgelerde aynı olmalı"""
+        regional = RegionalPhysicsSystem(region_size=100)
+        regional.create_body("a", (50, 50))
+        regional.set_layer_collision("ghost", "wall", False)
+        body = regional.create_body("b", (550, 50), layer="wall")
+        far = regional.get_region((5, 0)).physics
+        near = regional.get_region((0, 0)).physics
+        assert far.layers == near.layers == regional.layers
+        assert not far.layers_collide("ghost", "wall")
+        assert body.shapes[0].filter.categories == regional.layers["wall"]
+    
+    def test_layer_matrix_copied(self):
+        """Matris sonradan değiştirilse de yeni bölgeler aynı ayarı almalı"""
+        regional = RegionalPhysicsSystem(region_size=100)
+        matrix = {"ghost": ["wall"], "wall": ["ghost", "wall"]}
+        regional.set_layer_matrix(matrix)
+        matrix["ghost"].append("ghost")
+        far = regional.get_region((9, 9)).physics
+        assert not far.layers_collide("ghost", "ghost")
+        assert far.collision_layers is not regional.collision_layers
@@ -0,0 +1,84 @@
+import os
+import pytest
+import pygame
+from engine.utils.texture_cache import TextureCache, hash_file
+
+@pytest.fixture
+def source_image(tmp_path):
+    """Test için kaynak PNG dosyası oluşturur"""
+    surface = pygame.Surface((8, 4), pygame.SRCALPHA)
+    surface.fill((10, 20, 30, 128))
+    path = tmp_path / "tile.png"
+    pygame.image.save(surface, str(path))
+    return str(path)
+
+@pytest.fixture
+def cache(tmp_path):
+    """Geçici dizinde etkin TextureCache fixture'ı"""
+    cache = TextureCache()
+    cache.enable(str(tmp_path / "cache"))
+    return cache
+
+class TestTextureCache:
+    """TextureCache test sınıfı"""
+    
+    def test_disabled_cache(self, source_image):
+        """Devre dışı önbellek dosya yazmamalı"""
+        cache = TextureCache()
+        assert not cache.enabled
+        surface = cache.load_image(source_image)
+        assert surface.get_size() == (8, 4)
+        assert cache.load(source_image) is None
+        
+    def test_store_and_load(self, cache, source_image):
+        """İlk yükleme önbelleğe yazmalı, ikincisi önbellekten okumalı"""
+        cache.load_image(source_image)
+        assert cache.misses == 1
+        assert os.path.exists(cache.get_cache_path(source_image))
+        
+        surface = cache.load_image(source_image)
+        assert cache.hits == 1
+        assert surface.get_size() == (8, 4)
+        assert surface.get_at((0, 0)) == pygame.Color(10, 20, 30, 128)
+        
+    def test_changed_source_invalidates(self, cache, source_image):
+        """Kaynak dosya değişince önbellek geçersiz olmalı"""
+        cache.load_image(source_image)
+        
+        surface = pygame.Surface((8, 4), pygame.SRCALPHA)
+        surface.fill((200, 0, 0, 255))
+        pygame.image.save(surface, source_image)
+        os.utime(source_image, ns=(0, 0))
+        
+        assert cache.load(source_image) is None
+        assert cache.load_image(source_image).get_at((0, 0)) == pygame.Color(200, 0, 0, 255)
+        
+    def test_touched_source_with_same_content(self, cache, source_image):
+        """İçeriği aynı kalan dosyanın mtime değişimi önbelleği bozmamalı"""
+        cache.load_image(source_image)
+        os.utime(source_image, ns=(0, 0))
+        assert cache.load(source_image) is not None
+        
+    def test_touched_source_refreshes_header(self, cache, source_image, mocker):
+        """Hash eşleşince başlık yeni mtime ile güncellenmeli, hash bir daha hesaplanmamalı"""
+        cache.load_image(source_image)
+        os.utime(source_image, ns=(0, 0))
+        spy = mocker.patch("engine.utils.texture_cache.hash_file", wraps=hash_file)
+        assert cache.load(source_image) is not None
+        assert cache.load(source_image) is not None
+        assert spy.call_count == 1
+        
+    def test_resource_manager_uses_cache(self, cache, source_image, mocker):
+        """ResourceManager.load_texture global önbelleği kullanmalı"""
+        from engine.utils.resource_manager import ResourceManager
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        mocker.patch("engine.utils.resource_manager.texture_cache", cache)
+        
+        manager = ResourceManager()
+        manager.set_base_path(os.path.dirname(source_image))
+        manager.load_texture("first", "tile.png")
+        manager.load_texture("second", "tile.png")
+        assert cache.misses == 1
+        assert cache.hits == 1
+        assert manager.get_texture("second").get_size() == (8, 4)